@@ -0,0 +1,87 @@
+import argparse
+import math
+import threading
+import time
+from time import perf_counter
+from lib.binance.websocket.client import BinanceWebsocketClient
+from lib.binance.websocket.stub_feed import StubFeedServer
+from lib.binance.websocket.transport import TransportProfile
+
+# transport profiles compared, as TransportProfile options
+PROFILES = {
+    "default": {},
+    "nagle": {"tcp_nodelay": False},
+    "rcvbuf-4KiB": {"rcvbuf": 4096},
+    "rcvbuf-1MiB": {"rcvbuf": 1 << 20},
+    "ping-1s": {"ping_interval": 1, "ping_timeout": 0.5},
+    "skip-utf8": {"skip_utf8_validation": True},
+}
+
+
+def stamped_trades(count, burst, pause):
+    """
+    aggTrade messages stamped with the perf_counter time they are sent at, in bursts of `burst` messages every `pause` seconds
+    """
+    for i in range(count):
+        if i and i % burst == 0:
+            time.sleep(pause)
+        yield {'e': 'aggTrade', 's': 'BTCBUSD', 'a': i, 'p': '20000.00', 'q': '0.01000', 'T': 1669812778000 + i, 'sent_at': perf_counter()}
+
+
+def _percentile(values, p):
+    return values[math.ceil(p * len(values)) - 1]
+
+
+def run_profile(name, options, count, burst, pause, timeout=60):
+    received = []
+    done = threading.Event()
+
+    def on_message(msg):
+        if msg.get('e') != 'aggTrade':
+            return
+        received.append((perf_counter() - msg['sent_at']) * 1e6)
+        if len(received) == count:
+            done.set()
+
+    server = StubFeedServer(lambda: stamped_trades(count, burst, pause)).start()
+    client = BinanceWebsocketClient(
+        name=name,
+        ws_base_url=server.url,
+        topics=[BinanceWebsocketClient.agg_trade('btcbusd')],
+        message_handler=on_message,
+        transport=TransportProfile(**options)
+    )
+    started_at = perf_counter()
+    client.connect()
+    done.wait(timeout)
+    elapsed = perf_counter() - started_at
+    client.disconnect()
+    server.stop()
+
+    latencies = sorted(received)
+    stats = client.stats.as_dict()
+    if not latencies:
+        # e.g. the connection failed, nothing to measure
+        print(f"{name:>12}: no messages in {timeout}s")
+        return
+    print(
+        f"{name:>12}: {len(latencies)}/{count} messages, {len(latencies) / elapsed:,.0f} msg/s, "
+        f"send to handler p50 {_percentile(latencies, 0.5):.0f}us p99 {_percentile(latencies, 0.99):.0f}us max {latencies[-1]:.0f}us, "
+        f"decode ewma {stats['handler_delay_ms']['ewma'] * 1000:.1f}us, pongs {stats['pongs']}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compares websocket transport profiles against a local stub feed")
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--burst", type=int, default=50, help="messages sent back to back before each pause")
+    parser.add_argument("--pause", type=float, default=0.01, help="seconds between bursts")
+    parser.add_argument("--profile", choices=PROFILES, action="append", help="profiles to run, all if omitted")
+    args = parser.parse_args()
+
+    for name in args.profile or PROFILES:
+        run_profile(name, PROFILES[name], args.messages, args.burst, args.pause)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+import os
+from bot.journal import ORDER_RECORD, ORDER_FIELDS, FILL_RECORD, FILL_FIELDS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _dtype(fields, record):
+    formats = {'q': '<i8', 'b': 'i1', 'd': '<f8'}
+    return np.dtype([(name, formats[code]) for name, code in zip(fields, record.format.lstrip('<'))])
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("Journal analytics need NumPy, install it with `pip install numpy`")
+
+
+def load_records(path, record, fields):
+    """
+    Memory-maps a journal file as a structured array, a partially written last row is ignored
+    """
+    _require_numpy()
+    dtype = _dtype(fields, record)
+    rows = os.path.getsize(path) // dtype.itemsize if os.path.exists(path) else 0
+    if rows == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', shape=(rows,))
+
+
+def load_journal(directory):
+    """
+    Returns {symbol: (orders, fills)} for every symbol journaled in `directory`
+    """
+    journal = {}
+    for symbol in sorted(os.listdir(directory)):
+        path = os.path.join(directory, symbol)
+        if not os.path.isdir(path):
+            continue
+        journal[symbol] = (
+            load_records(os.path.join(path, "orders.bin"), ORDER_RECORD, ORDER_FIELDS),
+            load_records(os.path.join(path, "fills.bin"), FILL_RECORD, FILL_FIELDS)
+        )
+    return journal
+
+
+def _percentiles(values):
+    if len(values) == 0:
+        return {'p50': None, 'p90': None, 'p99': None}
+    p50, p90, p99 = np.percentile(values, [50, 90, 99])
+    return {'p50': float(p50), 'p90': float(p90), 'p99': float(p99)}
+
+
+def time_to_fill(orders, fills):
+    """
+    Seconds from placing each order to its first fill, for orders that were filled
+    """
+    if len(orders) == 0 or len(fills) == 0:
+        return np.zeros(0)
+
+    # first fill of every order
+    by_order = np.lexsort((fills['time'], fills['order_id']))
+    fill_order_ids, first = np.unique(fills['order_id'][by_order], return_index=True)
+    first_fill_times = fills['time'][by_order][first]
+
+    order_sort = np.argsort(orders['order_id'], kind='stable')
+    sorted_order_ids = orders['order_id'][order_sort]
+    index = np.searchsorted(sorted_order_ids, fill_order_ids)
+    index[index == len(sorted_order_ids)] = 0
+    found = sorted_order_ids[index] == fill_order_ids
+
+    placed_at = orders['time'][order_sort][index[found]]
+    return (first_fill_times[found] - placed_at) / 1000
+
+
+def summarize(orders, fills) -> dict:
+    """
+    Fill rate, time to fill, realized spread and inventory drift of one symbol.
+
+    Realized spread is the quantity weighted edge of fills against the production reference price at fill time,
+    in basis points, positive when buying below or selling above it.
+    Inventory drift is the base asset bought minus sold, cumulated in fill order
+    """
+    _require_numpy()
+    filled = np.isin(orders['order_id'], fills['order_id'])
+    order_qty = float(orders['qty'].sum())
+    fill_qty = fills['qty']
+
+    if len(fills):
+        edge = fills['side'] * (fills['reference_price'] - fills['price']) / fills['reference_price']
+        realized_spread_bps = float((edge * fill_qty).sum() / fill_qty.sum() * 10000)
+        inventory = np.cumsum((fills['side'] * fill_qty)[np.argsort(fills['time'], kind='stable')])
+        days = max((int(fills['time'].max()) - int(fills['time'].min())) / 86400000, 1 / 24)
+    else:
+        realized_spread_bps = None
+        inventory = np.zeros(1)
+        days = None
+
+    return {
+        'orders': len(orders),
+        'fills': len(fills),
+        'fill_rate': float(filled.mean()) if len(orders) else None,
+        'filled_qty_ratio': float(fill_qty.sum()) / order_qty if order_qty else None,
+        'volume': float(fill_qty.sum()),
+        'notional': float((fill_qty * fills['price']).sum()),
+        'time_to_fill': _percentiles(time_to_fill(orders, fills)),
+        'realized_spread_bps': realized_spread_bps,
+        'inventory': float(inventory[-1]),
+        'max_inventory': float(np.abs(inventory).max()),
+        'inventory_drift_per_day': float(inventory[-1]) / days if days else None,
+    }
@@ -0,0 +1,120 @@
+import time
+from decimal import Decimal
+from lib.binance import BinanceClient
+from bot.order_book import LocalOrderBook, OrderBookOutOfSyncException
+from bot.logger import get_logger
+
+
+class DepthMirror:
+    """
+    Keeps a local copy of the production order book and works out which testnet orders
+    are needed so the top `levels` of testnet look like production.
+
+    A level is only requoted when its target size moves by more than `min_size_change` (relative),
+    so small production size changes don't cost testnet orders
+    """
+    def __init__(
+        self,
+        symbol,
+        rest_client: BinanceClient,
+        levels=5,
+        size_ratio="1",
+        min_size_change="0.1",
+        min_interval=0.5,
+        clock=time.monotonic,
+        logger=None
+    ):
+        self.symbol = symbol
+        self.rest_client = rest_client
+        self.logger = logger or get_logger()
+        self.levels = levels
+        self.size_ratio = Decimal(size_ratio)
+        self.min_size_change = Decimal(min_size_change)
+        self.min_interval = min_interval
+        self.clock = clock
+        self.book = LocalOrderBook(symbol)
+        self.mirrored = {}
+        self.last_mirrored_at = None
+
+    def on_depth_update(self, event: dict) -> bool:
+        """
+        Applies a diff depth event, fetching a snapshot when the book is not synced
+        Returns True when the book is synced and ready to be mirrored
+        """
+        try:
+            self.book.apply_diff(event)
+        except OrderBookOutOfSyncException as err:
+            self.logger.update('info', f"{err}, resyncing")
+            self.book.reset()
+            self.book.apply_diff(event)
+
+        if self.book.last_update_id is None:
+            self._sync()
+
+        return self.book.synced
+
+    def _sync(self):
+        snapshot = self.rest_client.request("getDepth", {
+            "symbol": self.symbol,
+            "limit": 1000
+        })
+        try:
+            self.book.apply_snapshot(snapshot)
+        except OrderBookOutOfSyncException as err:
+            # snapshot is older than the buffered events, try again on the next event
+            self.logger.update('info', f"{err}, resyncing")
+            self.book.reset()
+
+    def due(self) -> bool:
+        return self.last_mirrored_at is None or self.clock() - self.last_mirrored_at >= self.min_interval
+
+    def targets(self) -> dict:
+        """
+        Target testnet size for each (side, price) in the top levels of the production book
+        """
+        targets = {}
+        for price, qty in self.book.bids.top(self.levels):
+            targets[('BUY', price)] = qty * self.size_ratio
+        for price, qty in self.book.asks.top(self.levels):
+            targets[('SELL', price)] = qty * self.size_ratio
+        return targets
+
+    def plan(self):
+        """
+        Returns (to_cancel, to_place)
+        to_cancel: mirrored orders whose level left the top levels or whose size changed meaningfully
+        to_place: (side, price, qty) for levels without a mirrored order
+        """
+        self.last_mirrored_at = self.clock()
+        targets = self.targets()
+        to_cancel, to_place = [], []
+
+        for level, order in self.mirrored.items():
+            if level not in targets or self._changed_meaningfully(order['qty'], targets[level]):
+                to_cancel.append(order)
+
+        for level, qty in targets.items():
+            order = self.mirrored.get(level)
+            if order is None or order in to_cancel:
+                to_place.append((level[0], level[1], qty))
+
+        return to_cancel, to_place
+
+    def _changed_meaningfully(self, current: Decimal, target: Decimal) -> bool:
+        if current == 0:
+            return target != 0
+        return abs(target - current) / current > self.min_size_change
+
+    def record_placed(self, side, price, qty, order_id):
+        self.mirrored[(side, price)] = {'orderId': order_id, 'side': side, 'price': price, 'qty': qty}
+
+    def record_cancelled(self, order):
+        self.mirrored.pop((order['side'], order['price']), None)
+
+    def forget_order(self, order_id):
+        self.mirrored = {level: order for level, order in self.mirrored.items() if order['orderId'] != order_id}
+        # requote the level on the next update regardless of the rate cap
+        self.last_mirrored_at = None
+
+    def clear(self):
+        self.mirrored = {}
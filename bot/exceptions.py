@@ -5,3 +5,17 @@ class TestnetMMInsufficientFundsException(Exception):
 
 class TestnetMMOrderFailedException(Exception):
     pass
+
+
+class SymbolConfigException(Exception):
+    def __init__(self, msg):
+        super().__init__(msg)
+
+
+class TestnetMMOrderRejectedException(Exception):
+    """
+    An order the exchange would reject, caught locally before sending it
+    """
+    def __init__(self, filter_type, msg):
+        super().__init__(f"{filter_type}: {msg}")
+        self.filter_type = filter_type
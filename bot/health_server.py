@@ -0,0 +1,81 @@
+import ipaddress
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class HealthServer:
+    """
+    Serves engine health for orchestrators
+    /healthz: liveness, 200 while every engine is running
+    /readyz: readiness, 200 once every engine is set up and all of its feeds are fresh, 503 otherwise
+    Both return the engines' health reports as JSON
+    `routes` optionally adds GET handlers, such as StateStream.routes()
+    `post_routes` optionally maps paths to handlers of POST requests, such as ProfilingControls.routes().
+    It listens on loopback unless given another `host`, POST routes only answer loopback clients either way
+    """
+    def __init__(self, engines, host="127.0.0.1", port=8080, post_routes=None, routes=None):
+        self.engines = engines
+        self.host = host
+        self.port = port
+        self.routes = {
+            '/healthz': self._healthz,
+            '/readyz': self._readyz,
+            **(routes or {}),
+        }
+        self.post_routes = post_routes or {}
+
+    def start(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self._dispatch(server.routes)
+
+            def do_POST(self):
+                if not ipaddress.ip_address(self.client_address[0]).is_loopback:
+                    self.send_error(403)
+                    return
+                self._dispatch(server.post_routes)
+
+            def _dispatch(self, routes):
+                route = routes.get(self.path.split('?')[0])
+                if route is None:
+                    self.send_error(404)
+                    return
+                route(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    @staticmethod
+    def send_json(handler, status, body):
+        payload = json.dumps(body, default=str).encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(payload)))
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+    def _reports(self):
+        return {engine.symbol: engine.health() for engine in self.engines}
+
+    def _healthz(self, handler):
+        reports = self._reports()
+        alive = all(report['alive'] for report in reports.values())
+        self.send_json(handler, 200 if alive else 503, reports)
+
+    def _readyz(self, handler):
+        reports = self._reports()
+        ready = all(report['ready'] for report in reports.values())
+        self.send_json(handler, 200 if ready else 503, reports)
@@ -0,0 +1,74 @@
+from decimal import Decimal
+
+
+class InventoryManager:
+    """
+    Skews quotes toward holding `target_ratio` of the inventory's value in the base asset, instead of swapping assets.
+
+    `imbalance` is -1 holding only the quote asset, 0 on target and 1 holding only the base asset.
+    On target, each side is sized to half of what its asset would hold. The side reducing the imbalance is enlarged by
+    `size_skew` times the imbalance, up to the amount that restores the target, and the other shrunk by as much,
+    down to a minimum and to half of its asset. A full fill on either side then leaves both assets to quote with.
+    The side reducing the imbalance is also moved toward the reference price and the other away from it
+    by `price_skew` times the imbalance, as a share of the distance from mid price
+    """
+    QUANTUM = Decimal('1e-12')
+    # share of its regular size the side growing the imbalance keeps, however skewed
+    MIN_SIZE_SHARE = Decimal('0.1')
+
+    def __init__(self, target_ratio="0.5", size_skew="1", price_skew="0.5"):
+        self.target_ratio = Decimal(target_ratio)
+        self.size_skew = Decimal(size_skew)
+        self.price_skew = Decimal(price_skew)
+        self.base_ratio = None
+        self.imbalance = Decimal('0')
+
+    def update(self, base_qty, quote_qty, price: Decimal) -> Decimal:
+        base_value = Decimal(base_qty) * price
+        total_value = base_value + Decimal(quote_qty)
+        if total_value <= 0:
+            self.base_ratio, self.imbalance = None, Decimal('0')
+            return self.imbalance
+
+        self.base_ratio = base_value / total_value
+        deviation = self.base_ratio - self.target_ratio
+        self.imbalance = deviation / (1 - self.target_ratio if deviation > 0 else self.target_ratio)
+        return self.imbalance
+
+    def quotes(self, base_available, quote_available, price: Decimal, distance: Decimal) -> tuple:
+        """
+        Returns ((bid_qty, bid_price), (ask_qty, ask_price)) for the current balances, before exchange filters
+        """
+        imbalance = self.update(base_available, quote_available, price)
+
+        # long base: bid further away and smaller, ask closer and larger
+        shift = distance * self.price_skew * imbalance
+        bid_price = price * (1 - distance - shift)
+        ask_price = price * (1 + distance - shift)
+
+        base_qty = Decimal(base_available)
+        quote_qty = Decimal(quote_available) / price
+        total_qty = base_qty + quote_qty
+        # base quantity to sell (positive) or buy (negative) to be on target
+        excess = base_qty - self.target_ratio * total_qty
+        ask_qty = self._size(self.target_ratio * total_qty / 2, excess, imbalance, base_qty)
+        bid_qty = self._size((1 - self.target_ratio) * total_qty / 2, -excess, -imbalance, Decimal(quote_available) / bid_price)
+        return (max(bid_qty, Decimal('0')), bid_price), (max(ask_qty, Decimal('0')), ask_price)
+
+    def _size(self, regular_qty, excess, imbalance, available) -> Decimal:
+        """
+        Quantity of a side that can spend `available`, `excess` and `imbalance` are positive when it rebalances
+        """
+        if imbalance > 0:
+            qty, cap = max(regular_qty, min(regular_qty * (1 + self.size_skew * imbalance), excess)), available
+        else:
+            qty, cap = max(regular_qty * (1 + self.size_skew * imbalance), regular_qty * self.MIN_SIZE_SHARE), available / 2
+        # divisions leave e.g. 0.9999... for 1, which truncating to the step would turn into a step less
+        return min(cap, qty.quantize(self.QUANTUM))
+
+    def summary(self) -> dict:
+        return {
+            'base_ratio': float(self.base_ratio) if self.base_ratio is not None else None,
+            'target_ratio': float(self.target_ratio),
+            'imbalance': float(self.imbalance),
+        }
@@ -0,0 +1,53 @@
+import os
+import struct
+
+# little-endian packed records, read back as NumPy structured arrays by bot.analytics
+ORDER_RECORD = struct.Struct("<qqbddd")
+ORDER_FIELDS = ("time", "order_id", "side", "price", "qty", "reference_price")
+
+FILL_RECORD = struct.Struct("<qqbdddb")
+FILL_FIELDS = ("time", "order_id", "side", "price", "qty", "reference_price", "is_maker")
+
+SIDES = {'BUY': 1, 'SELL': -1}
+
+
+class TradeJournal:
+    """
+    Append-only record of the orders and fills of one symbol, for analytics over long histories.
+
+    Records are fixed size binary rows in `<directory>/<symbol>/orders.bin` and `fills.bin`,
+    one row per order placed and per fill, each with the production reference price at that time.
+    Rows are flushed as they are written so a crashed engine loses nothing
+    """
+    def __init__(self, directory, symbol):
+        self.path = os.path.join(directory, symbol)
+        os.makedirs(self.path, exist_ok=True)
+        self.orders = open(os.path.join(self.path, "orders.bin"), "ab")
+        self.fills = open(os.path.join(self.path, "fills.bin"), "ab")
+
+    def record_order(self, order_details, reference_price):
+        self.orders.write(ORDER_RECORD.pack(
+            int(order_details['transactTime']),
+            int(order_details['orderId']),
+            SIDES[order_details['side']],
+            float(order_details['price']),
+            float(order_details['origQty']),
+            float(reference_price)
+        ))
+        self.orders.flush()
+
+    def record_fill(self, fill, reference_price):
+        self.fills.write(FILL_RECORD.pack(
+            int(fill['time']),
+            int(fill['orderId']),
+            SIDES[fill['side']],
+            float(fill['price']),
+            float(fill['qty']),
+            float(reference_price),
+            1 if fill['isMaker'] else 0
+        ))
+        self.fills.flush()
+
+    def close(self):
+        self.orders.close()
+        self.fills.close()
@@ -1,11 +1,14 @@
 import logging
 import os
 import sys
-from datetime import datetime
+import threading
+from lib.clock import REAL_CLOCK
 
 
 class BotLogger(object):
-    def __init__(self, log_file, log_level):
+    def __init__(self, log_file, log_level, clock=REAL_CLOCK):
+        # timestamps and screen refreshes, a simulation sets its VirtualClock
+        self.clock = clock
         self._create_logger(log_file, log_level)
         self.log_history = {
             'info': [],
@@ -16,10 +19,13 @@ class BotLogger(object):
         }
         self.number_of_log_history_to_keep = 10
         self.seconds_between_log_refresh = 1
-        self.last_refreshed = datetime.now()
+        self.clear_screen = True
+        self.last_refreshed = self.clock.monotonic()
 
     def _create_logger(self, log_file,  log_level):
         self.logger = logging.getLogger(log_file)
+        # engine loggers are named TestnetMM.<symbol>, each prints through its own handler only
+        self.logger.propagate = False
         ch = logging.StreamHandler(sys.stdout)
         self.logger.addHandler(ch)
 
@@ -32,7 +38,8 @@ class BotLogger(object):
         return self.logger
 
     def construct_output(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if self.clear_screen:
+            os.system('cls' if os.name == 'nt' else 'clear')
         self.logger.info('LAST PRICE')
         self.logger.info(self.log_history['production_last_price'])
         self.logger.info('')
@@ -41,10 +48,10 @@ class BotLogger(object):
         self.logger.info('OPEN ORDERS')
         self.logger.info("bids:")
         for bid in self.log_history['open_orders']['bids']:
-            self.logger.info(bid)
+            self.logger.info(dict(bid))
         self.logger.info("asks:")
         for ask in self.log_history['open_orders']['asks']:
-            self.logger.info(ask)
+            self.logger.info(dict(ask))
         self.logger.info('')
 
         self.logger.info('-' * 50)
@@ -63,7 +70,7 @@ class BotLogger(object):
         for order in self.log_history['past_orders']:
             self.logger.info(order)
 
-        self.last_refreshed = datetime.now()
+        self.last_refreshed = self.clock.monotonic()
 
     def update(self, type, msg):
         if type == 'production_last_price':
@@ -72,7 +79,7 @@ class BotLogger(object):
             self.log_history['open_orders'] = msg
         elif type == 'info' or type == 'debug':
             self.log_history[type].append(
-                f"{datetime.now().strftime('%m/%d/%Y, %H:%M:%S')} - {msg}")
+                f"{self.clock.now().strftime('%m/%d/%Y, %H:%M:%S')} - {msg}")
             self.log_history[type] = \
                 self.log_history[type][-self.number_of_log_history_to_keep:]
         else:
@@ -80,8 +87,23 @@ class BotLogger(object):
             self.log_history[type] = \
                 self.log_history[type][-self.number_of_log_history_to_keep:]
 
-        if (datetime.now() - self.last_refreshed).seconds > self.seconds_between_log_refresh:
+        if self.clock.monotonic() - self.last_refreshed > self.seconds_between_log_refresh:
             self.construct_output()
 
 
-logger = BotLogger('TestnetMM', "INFO")
+_loggers = {}
+_loggers_lock = threading.Lock()
+
+
+def get_logger(name="TestnetMM", log_level="INFO", clock=None) -> BotLogger:
+    """
+    The process-wide BotLogger called `name`, created with its stdout handler on first use rather than at import.
+    `clock` is given by the engine owning the logger, its timestamps and refreshes then follow the engine's time
+    """
+    with _loggers_lock:
+        if name not in _loggers:
+            _loggers[name] = BotLogger(name, log_level, clock or REAL_CLOCK)
+        elif clock is not None and _loggers[name].clock is not clock:
+            _loggers[name].clock = clock
+            _loggers[name].last_refreshed = clock.monotonic()
+        return _loggers[name]
@@ -0,0 +1,146 @@
+import math
+from collections import deque
+from decimal import Decimal
+
+
+class RollingTradeWindow:
+    """
+    Trades of the last `window` seconds, in a ring buffer of at most `max_trades` entries.
+    Volume and notional are kept as running sums, so every update is O(1) amortized
+    """
+    def __init__(self, window=60, max_trades=10000):
+        self.window = window
+        self.trades = deque()
+        self.max_trades = max_trades
+        self.volume = 0.0
+        self.notional = 0.0
+        self.first_time = None
+        self.last_time = None
+
+    def __len__(self):
+        return len(self.trades)
+
+    def append(self, time: float, price: float, qty: float):
+        if len(self.trades) == self.max_trades:
+            self._pop()
+        self.trades.append((time, price, qty))
+        if self.first_time is None:
+            self.first_time = time
+        self.last_time = time
+        self.volume += qty
+        self.notional += price * qty
+        self.expire(time)
+
+    def expire(self, now: float):
+        while self.trades and self.trades[0][0] <= now - self.window:
+            self._pop()
+
+    def _pop(self):
+        _, price, qty = self.trades.popleft()
+        self.volume -= qty
+        self.notional -= price * qty
+        if not self.trades:
+            # running sums drift with float rounding, an empty window resets them
+            self.volume, self.notional = 0.0, 0.0
+
+    def span(self) -> float:
+        """
+        Seconds covered by the window, shorter than `window` while it is still filling up
+        """
+        if self.first_time is None:
+            return 0.0
+        return min(self.last_time - self.first_time, self.window)
+
+
+class MarketStats:
+    """
+    Streaming statistics of production trades, fed one aggTrade at a time
+    https://binance-docs.github.io/apidocs/spot/en/#aggregate-trade-streams
+
+    `volatility` is the EWMA of squared log returns between trades, scaled by the trade rate into a per second figure.
+    `trade_rate` and `vwap` are taken over the last `window` seconds.
+    Times are exchange trade times in seconds, so results don't depend on when messages are processed
+    """
+    def __init__(self, window=60, vol_alpha=0.05, max_trades=10000):
+        self.vol_alpha = vol_alpha
+        self.trades = RollingTradeWindow(window, max_trades)
+        self.last_price = None
+        self.squared_return = None
+        self.samples = 0
+
+    def update(self, price, qty, time: float):
+        price, qty = float(price), float(qty)
+
+        if self.last_price is not None and price > 0:
+            squared_return = math.log(price / self.last_price) ** 2
+            if self.squared_return is None:
+                self.squared_return = squared_return
+            else:
+                self.squared_return += self.vol_alpha * (squared_return - self.squared_return)
+            self.samples += 1
+
+        self.last_price = price
+        self.trades.append(time, price, qty)
+
+    def trade_rate(self) -> float:
+        """
+        Trades per second over the window, or over the time seen so far while the window is filling up
+        """
+        span = max(self.trades.span(), 1.0)
+        return len(self.trades) / span
+
+    def volatility(self) -> float:
+        """
+        Standard deviation of log returns per second
+        """
+        if self.squared_return is None:
+            return 0.0
+        return math.sqrt(self.squared_return * self.trade_rate())
+
+    def vwap(self):
+        if self.trades.volume <= 0:
+            return None
+        return self.trades.notional / self.trades.volume
+
+
+class SpreadPolicy:
+    """
+    Distance from the reference price to quote at, `vol_multiplier` standard deviations of the price move
+    expected over `horizon` seconds, bounded by `min_distance` and `max_distance`.
+
+    Quotes widen when the market is volatile, so they are crossed and requoted less often,
+    and tighten when it is quiet instead of sitting far from the market.
+    `distance_from_mid_price` is used until `min_samples` trades have been seen
+    """
+    def __init__(
+        self,
+        distance_from_mid_price="0.01",
+        min_distance="0.001",
+        max_distance="0.05",
+        vol_multiplier=2,
+        horizon=60,
+        min_samples=20,
+        requote_tolerance=0.5
+    ):
+        self.distance_from_mid_price = Decimal(distance_from_mid_price)
+        self.min_distance = Decimal(min_distance)
+        self.max_distance = Decimal(max_distance)
+        self.vol_multiplier = vol_multiplier
+        self.horizon = horizon
+        self.min_samples = min_samples
+        self.requote_tolerance = requote_tolerance
+
+    def distance(self, stats: MarketStats) -> Decimal:
+        if stats.samples < self.min_samples:
+            return self.distance_from_mid_price
+
+        distance = Decimal(str(round(self.vol_multiplier * stats.volatility() * math.sqrt(self.horizon), 8)))
+        return min(max(distance, self.min_distance), self.max_distance)
+
+    def should_requote(self, quoted_distance: Decimal, stats: MarketStats) -> bool:
+        """
+        True once the target distance moved more than `requote_tolerance` (relative) away from the quoted one
+        """
+        if quoted_distance is None or quoted_distance <= 0:
+            return False
+        return abs(self.distance(stats) - quoted_distance) / quoted_distance > Decimal(str(self.requote_tolerance))
@@ -0,0 +1,112 @@
+from bisect import bisect_left, insort
+from decimal import Decimal
+
+
+class OrderBookSide:
+    """
+    Price levels kept in a sorted list of prices, with quantities in a dict keyed by price
+    """
+    def __init__(self, descending=False):
+        self.descending = descending
+        self.prices = []
+        self.quantities = {}
+
+    def clear(self):
+        self.prices = []
+        self.quantities = {}
+
+    def update(self, price: Decimal, qty: Decimal):
+        if qty == 0:
+            if price in self.quantities:
+                del self.quantities[price]
+                del self.prices[bisect_left(self.prices, price)]
+            return
+
+        if price not in self.quantities:
+            insort(self.prices, price)
+        self.quantities[price] = qty
+
+    def top(self, n: int) -> list:
+        """
+        Best `n` levels as (price, qty), best price first
+        """
+        prices = self.prices[-n:][::-1] if self.descending else self.prices[:n]
+        return [(price, self.quantities[price]) for price in prices]
+
+    def __len__(self):
+        return len(self.prices)
+
+
+class OrderBookOutOfSyncException(Exception):
+    def __init__(self, msg):
+        super().__init__(msg)
+
+
+class LocalOrderBook:
+    """
+    Production order book maintained from a REST depth snapshot plus the diff depth stream
+    https://binance-docs.github.io/apidocs/spot/en/#how-to-manage-a-local-order-book-correctly
+
+    Diff events received before the snapshot are buffered, then replayed on top of it.
+    A gap in update ids marks the book out of sync, the owner should fetch a new snapshot
+    """
+    def __init__(self, symbol):
+        self.symbol = symbol
+        self.bids = OrderBookSide(descending=True)
+        self.asks = OrderBookSide()
+        self.last_update_id = None
+        self.synced = False
+        self.buffer = []
+
+    def reset(self):
+        self.bids.clear()
+        self.asks.clear()
+        self.last_update_id = None
+        self.synced = False
+        self.buffer = []
+
+    def apply_snapshot(self, snapshot: dict):
+        self.bids.clear()
+        self.asks.clear()
+        for price, qty in snapshot['bids']:
+            self.bids.update(Decimal(price), Decimal(qty))
+        for price, qty in snapshot['asks']:
+            self.asks.update(Decimal(price), Decimal(qty))
+
+        self.last_update_id = snapshot['lastUpdateId']
+        self.synced = True
+
+        buffered, self.buffer = self.buffer, []
+        for event in buffered:
+            self.apply_diff(event)
+
+    def apply_diff(self, event: dict):
+        """
+        Returns False if the event was buffered or already reflected in the book
+        Raises OrderBookOutOfSyncException on an update id gap
+        """
+        if self.last_update_id is None:
+            self.buffer.append(event)
+            return False
+
+        if event['u'] <= self.last_update_id:
+            return False
+
+        if event['U'] > self.last_update_id + 1:
+            self.synced = False
+            raise OrderBookOutOfSyncException(
+                f"{self.symbol} depth gap: expected update {self.last_update_id + 1}, received {event['U']}")
+
+        for price, qty in event['b']:
+            self.bids.update(Decimal(price), Decimal(qty))
+        for price, qty in event['a']:
+            self.asks.update(Decimal(price), Decimal(qty))
+
+        self.last_update_id = event['u']
+        return True
+
+    def mid_price(self):
+        if len(self.bids) == 0 or len(self.asks) == 0:
+            return None
+
+        return (self.bids.top(1)[0][0] + self.asks.top(1)[0][0]) / Decimal('2')
@@ -0,0 +1,141 @@
+from abc import ABC, abstractmethod
+from lib.binance import BinanceClient, BinanceAccountPool, BinanceWebsocketApiClient
+from lib.binance.rest.exceptions import BinanceRestException
+from lib.binance.websocket.exceptions import BinanceWebsocketApiConnectionException, BinanceWebsocketApiTimeoutException
+
+
+class OrderGateway(ABC):
+    """
+    Order entry interface used by TestnetMM.
+    Implementations return Binance's order payloads unchanged, so the engine does not care how orders are sent
+    """
+    def connect(self):
+        pass
+
+    def disconnect(self):
+        pass
+
+    @abstractmethod
+    def place_order(self, params: dict) -> dict:
+        pass
+
+    @abstractmethod
+    def cancel_order(self, symbol: str, order_id: int) -> dict:
+        pass
+
+    @abstractmethod
+    def cancel_open_orders(self, symbol: str):
+        pass
+
+
+class RestOrderGateway(OrderGateway):
+    """
+    Sends every order action as a separate HTTPS request
+    """
+    def __init__(self, rest_client: BinanceClient):
+        self.rest_client = rest_client
+
+    def place_order(self, params):
+        return self.rest_client.request("postOrder", params)
+
+    def cancel_order(self, symbol, order_id):
+        return self.rest_client.request("deleteOrder", {
+            "symbol": symbol,
+            "orderId": order_id
+        })
+
+    def cancel_open_orders(self, symbol):
+        return self.rest_client.request("deleteOpenOrders", {
+            "symbol": symbol,
+        })
+
+
+class PooledRestOrderGateway(OrderGateway):
+    """
+    Sends orders over REST, routing each symbol to a pool account with spare rate limit budget.
+    A symbol pinned to an account sends its orders there, so orders sized from that account's balances can be funded.
+    Remembers which account holds which order so cancels reach the right one
+    """
+    def __init__(self, account_pool: BinanceAccountPool):
+        self.account_pool = account_pool
+        self.order_accounts = {}
+        self.symbol_accounts = {}
+        self.pinned = {}
+
+    def pin(self, symbol, client: BinanceClient):
+        """
+        Routes the symbol's orders to `client` until pinned to another account
+        """
+        self.pinned[symbol] = client
+
+    def place_order(self, params):
+        client = self.pinned.get(params["symbol"]) or self.account_pool.client_for(params["symbol"])
+        res = client.request("postOrder", params)
+        self.order_accounts[res["orderId"]] = (client, params["symbol"])
+        self.symbol_accounts.setdefault(params["symbol"], set()).add(client)
+        return res
+
+    def cancel_order(self, symbol, order_id):
+        client, _ = self.order_accounts.pop(order_id, (self.account_pool.client_for(symbol), symbol))
+        return client.request("deleteOrder", {
+            "symbol": symbol,
+            "orderId": order_id
+        })
+
+    def cancel_open_orders(self, symbol):
+        cancelled = []
+        for client in self.symbol_accounts.pop(symbol, set()) or self.account_pool.clients:
+            try:
+                cancelled += client.request("deleteOpenOrders", {
+                    "symbol": symbol,
+                })
+            except BinanceRestException as err:
+                # -2011: this account had no open orders left for the symbol
+                if err.code != -2011:
+                    raise err
+
+        self.order_accounts = {
+            order_id: account for order_id, account in self.order_accounts.items() if account[1] != symbol
+        }
+        return cancelled
+
+
+class WebsocketApiOrderGateway(OrderGateway):
+    """
+    Sends order actions over one persistent WebSocket API connection
+    https://binance-docs.github.io/apidocs/websocket_api/en/#trading-requests
+    Cancels go through `fallback` when the connection is lost or times out, so orders aren't left live while it's down
+    """
+    def __init__(self, ws_api_client: BinanceWebsocketApiClient, fallback: OrderGateway = None):
+        self.ws_api_client = ws_api_client
+        self.fallback = fallback
+
+    def connect(self):
+        self.ws_api_client.connect()
+
+    def disconnect(self):
+        self.ws_api_client.disconnect()
+
+    def place_order(self, params):
+        return self.ws_api_client.request("order.place", params, is_signed=True)
+
+    def cancel_order(self, symbol, order_id):
+        try:
+            return self.ws_api_client.request("order.cancel", {
+                "symbol": symbol,
+                "orderId": order_id
+            }, is_signed=True)
+        except (BinanceWebsocketApiConnectionException, BinanceWebsocketApiTimeoutException) as err:
+            if not self.fallback:
+                raise err
+            return self.fallback.cancel_order(symbol, order_id)
+
+    def cancel_open_orders(self, symbol):
+        try:
+            return self.ws_api_client.request("openOrders.cancelAll", {
+                "symbol": symbol,
+            }, is_signed=True)
+        except (BinanceWebsocketApiConnectionException, BinanceWebsocketApiTimeoutException) as err:
+            if not self.fallback:
+                raise err
+            return self.fallback.cancel_open_orders(symbol)
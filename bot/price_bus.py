@@ -0,0 +1,214 @@
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+
+# header: magic, number of slots, then one 16 byte symbol name per slot
+HEADER = struct.Struct("<8sI")
+MAGIC = b"TMMPBUS1"
+SYMBOL_NAME = struct.Struct("<16s")
+# slot: sequence, then the last aggTrade's price and quantity as ASCII, trade time and aggregate trade id.
+# prices stay strings end to end, as they arrive from the exchange
+SLOT = struct.Struct("<Q24s24sqq")
+SEQUENCE = struct.Struct("<Q")
+# one slot per 128 bytes, so writers of neighbouring symbols never share a cache line
+SLOT_SIZE = 128
+# reads of a slot before giving up on a write that doesn't complete, e.g. of a feed handler killed halfway
+READ_ATTEMPTS = 10000
+
+
+def default_price_bus_path():
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(directory, f"testnet-mm-prices-{os.getpid()}")
+
+
+class PriceBus:
+    """
+    Latest production trade per symbol in shared memory, written by one feed handler process and read by any number of engines.
+
+    Each symbol has a fixed slot guarded by a seqlock: the writer makes the sequence odd, writes the trade and makes it even again.
+    A reader retries while the sequence is odd or changed during its read, so it never sees a torn trade and never blocks the writer.
+    A writer that died halfway leaves the sequence odd, the next publish starts from the following even sequence.
+    Readers only get the latest trade, trades published between two reads are skipped.
+    The region is a memory mapped file, under /dev/shm where available, so it never touches disk
+    """
+    def __init__(self, path, mapping, symbols, owner=False):
+        self.path = path
+        self.mapping = mapping
+        self.symbols = symbols
+        self.owner = owner
+        self.buffer = memoryview(mapping)
+        self.slots = {symbol: self._slots_offset(len(symbols)) + i * SLOT_SIZE for i, symbol in enumerate(symbols)}
+
+    @staticmethod
+    def _slots_offset(count):
+        names_end = HEADER.size + count * SYMBOL_NAME.size
+        return (names_end + SLOT_SIZE - 1) // SLOT_SIZE * SLOT_SIZE
+
+    @classmethod
+    def create(cls, symbols, path=None):
+        path = path or default_price_bus_path()
+        symbols = [symbol.upper() for symbol in symbols]
+        size = cls._slots_offset(len(symbols)) + len(symbols) * SLOT_SIZE
+
+        fd = os.open(path, os.O_CREAT | os.O_TRUNC | os.O_RDWR, 0o600)
+        try:
+            os.ftruncate(fd, size)
+            mapping = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+
+        HEADER.pack_into(mapping, 0, MAGIC, len(symbols))
+        for i, symbol in enumerate(symbols):
+            SYMBOL_NAME.pack_into(mapping, HEADER.size + i * SYMBOL_NAME.size, symbol.encode("ascii"))
+        return cls(path, mapping, symbols, owner=True)
+
+    @classmethod
+    def attach(cls, path):
+        fd = os.open(path, os.O_RDWR)
+        try:
+            mapping = mmap.mmap(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+
+        magic, count = HEADER.unpack_from(mapping, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a price bus")
+        symbols = [
+            SYMBOL_NAME.unpack_from(mapping, HEADER.size + i * SYMBOL_NAME.size)[0].rstrip(b"\0").decode("ascii")
+            for i in range(count)
+        ]
+        return cls(path, mapping, symbols)
+
+    def publish(self, symbol, price: str, qty: str, trade_time: int, trade_id: int):
+        """
+        Single writer per symbol
+        """
+        offset = self.slots[symbol]
+        sequence = SEQUENCE.unpack_from(self.buffer, offset)[0]
+        # odd if the previous writer stopped halfway
+        sequence += sequence % 2
+        SEQUENCE.pack_into(self.buffer, offset, sequence + 1)
+        SLOT.pack_into(self.buffer, offset, sequence + 1, price.encode("ascii"), qty.encode("ascii"), trade_time, trade_id)
+        SEQUENCE.pack_into(self.buffer, offset, sequence + 2)
+
+    def sequence(self, symbol) -> int:
+        return SEQUENCE.unpack_from(self.buffer, self.slots[symbol])[0]
+
+    def read(self, symbol):
+        """
+        Returns (sequence, price, qty, trade time, trade id) of the latest trade,
+        None before the first one or while a write doesn't complete within READ_ATTEMPTS reads
+        """
+        offset = self.slots[symbol]
+        for _ in range(READ_ATTEMPTS):
+            sequence, price, qty, trade_time, trade_id = SLOT.unpack_from(self.buffer, offset)
+            if sequence % 2 == 0 and SEQUENCE.unpack_from(self.buffer, offset)[0] == sequence:
+                break
+        else:
+            return None
+        if sequence == 0:
+            return None
+        return sequence, price.rstrip(b"\0").decode("ascii"), qty.rstrip(b"\0").decode("ascii"), trade_time, trade_id
+
+    def close(self):
+        self.buffer.release()
+        self.mapping.close()
+        if self.owner:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+
+class PriceBusReader:
+    """
+    Stands in for the production websocket client of one engine: polls its symbol's slot every `poll_interval` seconds
+    and passes new trades to `message_handler` as aggTrade messages, without a socket or JSON decoding of its own.
+    Trades published between two polls are conflated into the latest
+    """
+    def __init__(self, path, symbol, message_handler=None, poll_interval=0.001, name="price bus"):
+        self.name = name
+        self.path = path
+        self.symbol = symbol.upper()
+        self.message_handler = message_handler
+        self.poll_interval = poll_interval
+        self.bus = None
+        self.thread = None
+        self.last_sequence = 0
+        self.messages = 0
+        self._stop = threading.Event()
+
+    def connect(self):
+        self.bus = PriceBus.attach(self.path)
+        if self.symbol not in self.bus.slots:
+            raise ValueError(f"{self.symbol} is not published on {self.path}")
+        # the trade already on the bus may be long gone, passing it on would make a dead feed look fresh.
+        # one being written now is new
+        sequence = self.bus.sequence(self.symbol)
+        self.last_sequence = sequence - sequence % 2
+        self.thread = threading.Thread(target=self._run, name=f"price-bus-{self.symbol}", daemon=True)
+        self.thread.start()
+
+    def disconnect(self):
+        self._stop.set()
+        # the mapping is only released once the polling thread no longer reads it
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join()
+        if self.bus is not None:
+            self.bus.close()
+            self.bus = None
+
+    def poll(self):
+        """
+        Passes on the latest trade if it's new, returns whether there was one
+        """
+        if self.bus.sequence(self.symbol) == self.last_sequence:
+            return False
+
+        trade = self.bus.read(self.symbol)
+        if trade is None or trade[0] == self.last_sequence:
+            return False
+
+        self.last_sequence, price, qty, trade_time, trade_id = trade
+        self.messages += 1
+        if self.message_handler:
+            self.message_handler({'e': 'aggTrade', 's': self.symbol, 'a': trade_id, 'p': price, 'q': qty, 'T': trade_time})
+        return True
+
+    def _run(self):
+        while not self._stop.is_set():
+            if not self.poll():
+                self._stop.wait(self.poll_interval)
+
+    def connection_stats(self) -> dict:
+        return {self.name: {'messages': self.messages, 'sequence': self.last_sequence}}
+
+
+def run_feed_handler(path, ws_base_urls, transport=None):
+    """
+    Feed handler process entry point: one production connection for the aggTrades of every symbol on the price bus at `path`.
+    Exits non-zero when the connection is lost, so the supervisor restarts it
+    """
+    from lib.binance import BinanceWebsocketClient, BinanceMultiEndpointWebsocketClient
+    from lib.binance.websocket.transport import TransportProfile
+
+    bus = PriceBus.attach(path)
+    closed = threading.Event()
+
+    def on_message(msg):
+        if msg.get('e') == 'aggTrade' and msg['s'] in bus.slots:
+            bus.publish(msg['s'], msg['p'], msg['q'], msg['T'], msg['a'])
+
+    topics = [BinanceWebsocketClient.agg_trade(symbol) for symbol in bus.symbols]
+    transport = TransportProfile(**transport) if transport else None
+    if len(ws_base_urls) > 1:
+        client = BinanceMultiEndpointWebsocketClient("feed handler", ws_base_urls, topics, on_message, closed.set, transport=transport)
+    else:
+        client = BinanceWebsocketClient("feed handler", ws_base_urls[0], topics, on_message, closed.set, transport=transport)
+    client.connect()
+
+    closed.wait()
+    sys.exit(1)
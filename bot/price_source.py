@@ -0,0 +1,141 @@
+import time
+from abc import ABC, abstractmethod
+from decimal import Decimal
+from lib.binance import BinanceWebsocketClient
+
+
+class PriceConflator:
+    """
+    Rate-caps a reference price.
+    Updates arriving within `min_interval` seconds of the last published price are held back and only the latest is kept,
+    unchanged prices are never republished. A held back price is published by the next update or by `flush` once `due_in` is 0
+    """
+    def __init__(self, min_interval=0.0, clock=time.monotonic):
+        self.min_interval = min_interval
+        self.clock = clock
+        self.last_published_price = None
+        self.last_published_at = None
+        self.pending_price = None
+
+    def update(self, price: str):
+        self.pending_price = price
+        return self.flush()
+
+    def flush(self):
+        if self.pending_price is None or self.pending_price == self.last_published_price:
+            self.pending_price = None
+            return None
+
+        now = self.clock()
+        if self.last_published_at is not None and now - self.last_published_at < self.min_interval:
+            return None
+
+        price, self.pending_price = self.pending_price, None
+        self.last_published_price = price
+        self.last_published_at = now
+        return price
+
+    def due_in(self):
+        """
+        Seconds until the held back price can be published, None if there is none
+        """
+        if self.pending_price is None:
+            return None
+        if self.last_published_at is None:
+            return 0.0
+        return max(0.0, self.min_interval - (self.clock() - self.last_published_at))
+
+
+class PriceSource(ABC):
+    """
+    Turns production market data into the reference price quotes are anchored on
+    """
+    def __init__(self, min_interval=0.0, clock=time.monotonic):
+        self.conflator = PriceConflator(min_interval, clock)
+
+    @abstractmethod
+    def topics(self, symbol: str) -> list:
+        pass
+
+    @abstractmethod
+    def handles(self, msg: dict) -> bool:
+        pass
+
+    @abstractmethod
+    def price_from_message(self, msg: dict) -> str:
+        pass
+
+    def on_message(self, msg: dict):
+        """
+        Returns the new reference price, or None if the update was conflated
+        """
+        return self.conflator.update(self.price_from_message(msg))
+
+    def flush(self):
+        """
+        Returns the held back reference price once it's due, None otherwise
+        """
+        return self.conflator.flush()
+
+    def due_in(self):
+        return self.conflator.due_in()
+
+
+class AggTradePriceSource(PriceSource):
+    """
+    Last traded price from aggTrade
+    https://binance-docs.github.io/apidocs/spot/en/#aggregate-trade-streams
+    """
+    def topics(self, symbol):
+        return [BinanceWebsocketClient.agg_trade(symbol)]
+
+    def handles(self, msg):
+        return msg.get('e') == 'aggTrade'
+
+    def price_from_message(self, msg):
+        return msg['p']
+
+
+class BookTickerPriceSource(PriceSource):
+    """
+    Mid or microprice from the best bid and ask
+    https://binance-docs.github.io/apidocs/spot/en/#individual-symbol-book-ticker-streams
+    Microprice weighs each side by the opposite side's size: (bid * ask_qty + ask * bid_qty) / (bid_qty + ask_qty)
+    """
+    def __init__(self, method="mid", min_interval=0.1, clock=time.monotonic):
+        super().__init__(min_interval, clock)
+        if method not in ("mid", "microprice"):
+            raise ValueError(f"Unknown book ticker pricing method {method}")
+        self.method = method
+
+    def topics(self, symbol):
+        return [BinanceWebsocketClient.book_ticker(symbol)]
+
+    def handles(self, msg):
+        # book ticker payloads have no event type
+        return 'e' not in msg and 'u' in msg and 'b' in msg and 'a' in msg
+
+    def price_from_message(self, msg):
+        bid, ask = Decimal(msg['b']), Decimal(msg['a'])
+        bid_qty, ask_qty = Decimal(msg['B']), Decimal(msg['A'])
+
+        if self.method == "microprice" and bid_qty + ask_qty > 0:
+            return str((bid * ask_qty + ask * bid_qty) / (bid_qty + ask_qty))
+
+        return str((bid + ask) / Decimal('2'))
+
+
+def create_price_source(price_source="aggTrade", min_interval=None, clock=time.monotonic):
+    """
+    `price_source` is either "aggTrade", "mid", "microprice" or a PriceSource instance
+    `min_interval` overrides the source's default rate cap in seconds
+    """
+    options = {"clock": clock} if min_interval is None else {"min_interval": min_interval, "clock": clock}
+
+    if price_source == "aggTrade":
+        return AggTradePriceSource(**options)
+
+    if price_source in ("mid", "microprice"):
+        return BookTickerPriceSource(price_source, **options)
+
+    return price_source
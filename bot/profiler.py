@@ -0,0 +1,168 @@
+import os
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from bot.health_server import HealthServer
+
+
+class SamplingProfiler:
+    """
+    Statistical CPU profiler over every thread of the process, websocket threads included.
+
+    A background thread reads the stack of all other threads every `interval` seconds and counts each one,
+    in the collapsed format flame graph tools read: `thread;module:function:line;... count`
+    Nothing is sampled until `start`
+    """
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.samples = Counter()
+        self.sample_count = 0
+        self.thread = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self.samples.clear()
+        self.sample_count = 0
+        self._stop.clear()
+        self.thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self.thread is not None:
+            self.thread.join()
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.sample(own_id)
+
+    def sample(self, skip_thread_id=None):
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == skip_thread_id:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{frame.f_globals.get('__name__', '?')}:{code.co_name}:{frame.f_lineno}")
+                frame = frame.f_back
+            stack.append(names.get(thread_id, str(thread_id)))
+            self.samples[';'.join(reversed(stack))] += 1
+        self.sample_count += 1
+
+    def collapsed(self) -> str:
+        return ''.join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+class MemoryProfiler:
+    """
+    tracemalloc snapshots compared in pairs. Allocations are only traced between `start` and `stop`,
+    `diff` starts tracing on one call and stops it on the next
+    """
+    def __init__(self, frames=10):
+        self.frames = frames
+        self.snapshot = None
+
+    @property
+    def running(self):
+        return tracemalloc.is_tracing()
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        self.snapshot = tracemalloc.take_snapshot()
+
+    def stop(self):
+        tracemalloc.stop()
+        self.snapshot = None
+
+    def diff(self, top=25) -> str:
+        """
+        Largest allocation changes since tracing started, starting it if it isn't running and stopping it otherwise
+        """
+        if not self.running:
+            self.start()
+            return "tracemalloc started, take another snapshot to see changes\n"
+
+        snapshot = tracemalloc.take_snapshot()
+        stats = snapshot.compare_to(self.snapshot, 'lineno')
+        current, peak = tracemalloc.get_traced_memory()
+        # tracing slows every allocation down, it's not left running once the diff is taken
+        self.stop()
+        lines = [f"traced {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB"]
+        lines += [str(stat) for stat in stats[:top]]
+        return '\n'.join(lines) + '\n'
+
+
+class ProfilingControls:
+    """
+    Starts and stops profiling of a live process, from a signal or the health server.
+    SIGUSR1 toggles CPU sampling, stopping writes the collapsed stacks to `output_dir`.
+    SIGUSR2 starts tracemalloc, the next one writes the allocation diff since then and stops it
+    """
+    def __init__(self, output_dir="profiles", interval=0.005, clock=time.time):
+        self.output_dir = output_dir
+        self.cpu = SamplingProfiler(interval)
+        self.memory = MemoryProfiler()
+        self.clock = clock
+
+    def install_signal_handlers(self):
+        # not available on Windows
+        if not hasattr(signal, 'SIGUSR1'):
+            return
+        # signals are delivered to the main thread, the work happens on a separate one so the handler returns at once
+        signal.signal(signal.SIGUSR1, lambda *_: threading.Thread(target=self.toggle_cpu, daemon=True).start())
+        signal.signal(signal.SIGUSR2, lambda *_: threading.Thread(target=self.dump_memory, daemon=True).start())
+
+    def routes(self) -> dict:
+        """
+        POST routes for HealthServer
+        """
+        return {
+            '/debug/profile/cpu/start': lambda handler: self._respond(handler, self.start_cpu()),
+            '/debug/profile/cpu/stop': lambda handler: self._respond(handler, self.stop_cpu()),
+            '/debug/profile/memory': lambda handler: self._respond(handler, self.dump_memory()),
+        }
+
+    @staticmethod
+    def _respond(handler, path):
+        HealthServer.send_json(handler, 200, {'path': path})
+
+    def _path(self, kind, extension):
+        os.makedirs(self.output_dir, exist_ok=True)
+        return os.path.join(self.output_dir, f"{kind}-{os.getpid()}-{int(self.clock())}.{extension}")
+
+    def toggle_cpu(self):
+        return self.stop_cpu() if self.cpu.running else self.start_cpu()
+
+    def start_cpu(self):
+        self.cpu.start()
+        return None
+
+    def stop_cpu(self):
+        """
+        Returns the path of the collapsed stacks, None if sampling wasn't running
+        """
+        if not self.cpu.running:
+            return None
+        self.cpu.stop()
+        path = self._path("cpu", "collapsed")
+        with open(path, "w") as f:
+            f.write(self.cpu.collapsed())
+        return path
+
+    def dump_memory(self):
+        path = self._path("memory", "txt")
+        with open(path, "w") as f:
+            f.write(self.memory.diff())
+        return path
@@ -0,0 +1,272 @@
+import bisect
+import itertools
+from decimal import Decimal
+from time import perf_counter
+from lib.binance import BinanceClient
+from lib.clock import REAL_CLOCK
+from lib.binance.rest.exceptions import BinanceRestException
+
+
+class SimulatedBinanceClient(BinanceClient):
+    """
+    BinanceClient backed by an in-memory matching engine instead of the testnet REST API.
+
+    Only `_send` is replaced, so request validation, client order ids and retries behave as with the real client.
+    Signed requests are still signed, so benchmarks include that cost; the "http" span is the matching engine's time.
+    Resting orders are kept in price-time priority and filled against a production trade stream fed to `on_trade`:
+    a trade at or through an order's limit price fills it at its limit price, oldest order first,
+    for at most the trade's quantity. Orders never take liquidity, they rest until a trade crosses them.
+    Every order update is passed to `execution_handler` shaped like a user stream executionReport
+    https://binance-docs.github.io/apidocs/spot/en/#payload-order-update
+    """
+    def __init__(
+        self,
+        base_asset="BTC",
+        quote_asset="BUSD",
+        balances=None,
+        tick_size="0.01000000",
+        step_size="0.00001000",
+        min_notional="10.00000000",
+        execution_handler=None,
+        clock=REAL_CLOCK
+    ):
+        super().__init__("simulated", "simulated", "simulated", clock=clock)
+        self.base_asset = base_asset.upper()
+        self.quote_asset = quote_asset.upper()
+        self.symbol = self.base_asset + self.quote_asset
+        self.tick_size = tick_size
+        self.step_size = step_size
+        self.min_notional = min_notional
+        self.execution_handler = execution_handler
+        self.free = {asset: Decimal(qty) for asset, qty in (balances or {self.base_asset: "1", self.quote_asset: "20000"}).items()}
+        self.locked = {asset: Decimal('0') for asset in self.free}
+        self.orders = {}
+        # (sort key, order id), best first: highest bid, lowest ask, then oldest
+        self.bids = []
+        self.asks = []
+        self._order_ids = itertools.count(1)
+        self._trade_ids = itertools.count(1)
+        self.handlers = {
+            "getServerTime": self._get_server_time,
+            "getExchangeInfo": self._get_exchange_info,
+            "getAccount": self._get_account,
+            "postOrder": self._post_order,
+            "getOrder": self._get_order,
+            "deleteOrder": self._delete_order,
+            "deleteOpenOrders": self._delete_open_orders,
+            "postUserDataStream": lambda params: {"listenKey": "simulated"},
+            "putUserDataStream": lambda params: {},
+        }
+
+    def _send(self, endpoint, params):
+        self._prepare_querystring(endpoint, params)
+
+        self.request_count += 1
+        started_at = perf_counter() if self.span_recorder else None
+        try:
+            res = self.handlers[endpoint](params or {})
+            if self.span_recorder:
+                self.span_recorder("http", started_at, perf_counter(), endpoint)
+        except Exception as err:
+            self.error_count += 1
+            self.recent_results.append(False)
+            raise err
+
+        self.recent_results.append(True)
+        return res
+
+    def _now(self):
+        return int(self.clock.time() * 1000)
+
+    def _error(self, endpoint, code, msg):
+        return BinanceRestException(
+            reason="Bad Request",
+            status_code=400,
+            http_method=self.endpoints[endpoint]["http_method"],
+            path=self.endpoints[endpoint]["path"],
+            details={"code": code, "msg": msg}
+        )
+
+    def _get_server_time(self, params):
+        return {"serverTime": self._now()}
+
+    def _get_exchange_info(self, params):
+        return {"symbols": [{
+            "symbol": self.symbol,
+            "status": "TRADING",
+            "baseAsset": self.base_asset,
+            "quoteAsset": self.quote_asset,
+            "orderTypes": ["LIMIT", "LIMIT_MAKER", "MARKET"],
+            "filters": [
+                {"filterType": "PRICE_FILTER", "minPrice": self.tick_size, "maxPrice": "1000000.00000000", "tickSize": self.tick_size},
+                {"filterType": "LOT_SIZE", "minQty": self.step_size, "maxQty": "9000.00000000", "stepSize": self.step_size},
+                {"filterType": "MIN_NOTIONAL", "minNotional": self.min_notional, "applyToMarket": True, "avgPriceMins": 5},
+            ]
+        }]}
+
+    def _get_account(self, params):
+        return {"balances": [
+            {"asset": asset, "free": '{:f}'.format(self.free[asset]), "locked": '{:f}'.format(self.locked[asset])}
+            for asset in self.free
+        ]}
+
+    def _order_response(self, order):
+        return {
+            "symbol": order["symbol"],
+            "orderId": order["orderId"],
+            "orderListId": -1,
+            "clientOrderId": order["clientOrderId"],
+            "transactTime": order["transactTime"],
+            "price": '{:f}'.format(order["price"]),
+            "origQty": '{:f}'.format(order["origQty"]),
+            "executedQty": '{:f}'.format(order["executedQty"]),
+            "cummulativeQuoteQty": '{:f}'.format(order["executedQty"] * order["price"]),
+            "status": order["status"],
+            "timeInForce": "GTC",
+            "type": "LIMIT",
+            "side": order["side"],
+        }
+
+    def _post_order(self, params):
+        if params["symbol"] != self.symbol:
+            raise self._error("postOrder", -1121, "Invalid symbol.")
+        if params["type"] != "LIMIT":
+            raise self._error("postOrder", -1116, "Invalid orderType.")
+
+        price, qty = Decimal(params["price"]), Decimal(params["quantity"])
+        if price * qty < Decimal(self.min_notional):
+            raise self._error("postOrder", -1013, "Filter failure: MIN_NOTIONAL")
+
+        # funds are locked while the order rests
+        asset, amount = (self.quote_asset, price * qty) if params["side"] == "BUY" else (self.base_asset, qty)
+        if self.free[asset] < amount:
+            raise self._error("postOrder", -2010, "Account has insufficient balance for requested action.")
+        self.free[asset] -= amount
+        self.locked[asset] += amount
+
+        order = {
+            "symbol": self.symbol,
+            "orderId": next(self._order_ids),
+            "clientOrderId": params.get("newClientOrderId", ""),
+            "transactTime": self._now(),
+            "price": price,
+            "origQty": qty,
+            "executedQty": Decimal('0'),
+            "status": "NEW",
+            "side": params["side"],
+        }
+        self.orders[order["orderId"]] = order
+        if order["side"] == "BUY":
+            bisect.insort(self.bids, ((-price, order["orderId"]), order["orderId"]))
+        else:
+            bisect.insort(self.asks, ((price, order["orderId"]), order["orderId"]))
+
+        self._report(order, "NEW")
+
+        if params.get("newOrderRespType") == "ACK":
+            return {key: order[key] for key in ("symbol", "orderId", "clientOrderId", "transactTime")}
+        return self._order_response(order)
+
+    def _find_order(self, endpoint, params):
+        order = self.orders.get(params.get("orderId"))
+        if order is None and "origClientOrderId" in params:
+            order = next((o for o in self.orders.values() if o["clientOrderId"] == params["origClientOrderId"]), None)
+        if order is None:
+            raise self._error(endpoint, -2013 if endpoint == "getOrder" else -2011, "Order does not exist." if endpoint == "getOrder" else "Unknown order sent.")
+        return order
+
+    def _get_order(self, params):
+        order = self._find_order("getOrder", params)
+        return dict(self._order_response(order), time=order["transactTime"])
+
+    def _delete_order(self, params):
+        order = self._find_order("deleteOrder", params)
+        if order["status"] not in ("NEW", "PARTIALLY_FILLED"):
+            raise self._error("deleteOrder", -2011, "Unknown order sent.")
+        self._cancel(order)
+        return self._order_response(order)
+
+    def _delete_open_orders(self, params):
+        open_orders = [self.orders[order_id] for _, order_id in self.bids + self.asks]
+        if not open_orders:
+            raise self._error("deleteOpenOrders", -2011, "Unknown order sent.")
+        for order in open_orders:
+            self._cancel(order)
+        return [self._order_response(order) for order in open_orders]
+
+    def _cancel(self, order):
+        book = self.bids if order["side"] == "BUY" else self.asks
+        key = (-order["price"], order["orderId"]) if order["side"] == "BUY" else (order["price"], order["orderId"])
+        book.pop(bisect.bisect_left(book, (key, order["orderId"])))
+
+        remaining = order["origQty"] - order["executedQty"]
+        asset, amount = (self.quote_asset, remaining * order["price"]) if order["side"] == "BUY" else (self.base_asset, remaining)
+        self.locked[asset] -= amount
+        self.free[asset] += amount
+
+        order["status"] = "CANCELED"
+        del self.orders[order["orderId"]]
+        self._report(order, "CANCELED")
+
+    def on_trade(self, msg):
+        """
+        Fills resting orders crossed by a production aggTrade
+        https://binance-docs.github.io/apidocs/spot/en/#aggregate-trade-streams
+        """
+        price, remaining = Decimal(msg['p']), Decimal(msg['q'])
+
+        for book, crossed in ((self.bids, lambda p: p >= price), (self.asks, lambda p: p <= price)):
+            left = remaining
+            while book and left > 0:
+                order = self.orders[book[0][1]]
+                if not crossed(order["price"]):
+                    break
+                left -= self._fill(order, min(left, order["origQty"] - order["executedQty"]), msg.get('T', self._now()))
+                if order["status"] == "FILLED":
+                    book.pop(0)
+                    del self.orders[order["orderId"]]
+
+    def _fill(self, order, qty, trade_time):
+        order["executedQty"] += qty
+        order["status"] = "FILLED" if order["executedQty"] == order["origQty"] else "PARTIALLY_FILLED"
+
+        notional = qty * order["price"]
+        if order["side"] == "BUY":
+            self.locked[self.quote_asset] -= notional
+            self.free[self.base_asset] += qty
+        else:
+            self.locked[self.base_asset] -= qty
+            self.free[self.quote_asset] += notional
+
+        self._report(order, "TRADE", last_qty=qty, trade_time=trade_time)
+        return qty
+
+    def _report(self, order, execution_type, last_qty=Decimal('0'), trade_time=None):
+        if not self.execution_handler:
+            return
+
+        now = self._now()
+        self.execution_handler({
+            "e": "executionReport",
+            "E": now,
+            "s": order["symbol"],
+            "c": order["clientOrderId"],
+            "S": order["side"],
+            "o": "LIMIT",
+            "f": "GTC",
+            "q": '{:f}'.format(order["origQty"]),
+            "p": '{:f}'.format(order["price"]),
+            "x": execution_type,
+            "X": order["status"],
+            "r": "NONE",
+            "i": order["orderId"],
+            "l": '{:f}'.format(last_qty),
+            "z": '{:f}'.format(order["executedQty"]),
+            "L": '{:f}'.format(order["price"]) if execution_type == "TRADE" else "0.00000000",
+            "n": "0",
+            "N": None,
+            "T": trade_time or now,
+            "t": next(self._trade_ids) if execution_type == "TRADE" else -1,
+            "m": execution_type == "TRADE",
+            "Y": '{:f}'.format(last_qty * order["price"]),
+        })
@@ -0,0 +1,106 @@
+import json
+import time
+from urllib.parse import urlparse, parse_qs
+from bot.health_server import HealthServer
+
+
+def engine_view(snapshot, recent_fills=20) -> dict:
+    """
+    JSON-ready view of a TestnetMMStateSnapshot
+    """
+    return {
+        'production_last_price': snapshot.production_last_price,
+        'open_orders': {side: [dict(order) for order in orders] for side, orders in snapshot.open_orders.items()},
+        'recent_fills': [dict(fill) for fill in snapshot.fills[-recent_fills:]],
+        'balances': dict(snapshot.balances),
+        'order_count': snapshot.order_count,
+        'fill_count': snapshot.fill_count,
+    }
+
+
+def diff_views(old: dict, new: dict) -> dict:
+    """
+    Keys of `new` whose values differ from `old`
+    """
+    return {key: value for key, value in new.items() if old.get(key) != value}
+
+
+class StateStream:
+    """
+    Serves engine state to dashboards, for HealthServer
+    /state: the current view of every engine as JSON
+    /events: Server-Sent Events, a `snapshot` event with every engine's view, then `delta` events with only the changed keys per symbol.
+
+    Every client reads the engines' immutable snapshots at its own pace, at most every `?interval=` seconds,
+    so a slow client gets one coalesced delta instead of every intermediate state and the engines never wait on it.
+    A comment line is sent every `heartbeat` seconds without changes, to keep proxies from closing the stream
+    """
+    def __init__(self, engines, interval=0.25, min_interval=0.05, heartbeat=15, clock=time.monotonic, sleep=time.sleep):
+        self.engines = engines
+        self.interval = interval
+        self.min_interval = min_interval
+        self.heartbeat = heartbeat
+        self.clock = clock
+        self.sleep = sleep
+
+    def routes(self) -> dict:
+        return {
+            '/state': self._state,
+            '/events': self._events,
+        }
+
+    def views(self) -> dict:
+        return {engine.symbol: engine_view(engine.state.snapshot()) for engine in self.engines}
+
+    def _state(self, handler):
+        HealthServer.send_json(handler, 200, self.views())
+
+    def _client_interval(self, handler):
+        query = parse_qs(urlparse(handler.path).query)
+        try:
+            return max(float(query['interval'][0]), self.min_interval) if 'interval' in query else self.interval
+        except ValueError:
+            return self.interval
+
+    @staticmethod
+    def _send_event(handler, event, data):
+        handler.wfile.write(f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n".encode("utf-8"))
+        handler.wfile.flush()
+
+    def _events(self, handler):
+        interval = self._client_interval(handler)
+        handler.send_response(200)
+        handler.send_header("Content-Type", "text/event-stream")
+        handler.send_header("Cache-Control", "no-cache")
+        handler.end_headers()
+
+        snapshots = {engine.symbol: engine.state.snapshot() for engine in self.engines}
+        views = {symbol: engine_view(snapshot) for symbol, snapshot in snapshots.items()}
+        last_sent_at = self.clock()
+
+        try:
+            self._send_event(handler, 'snapshot', views)
+            while True:
+                self.sleep(interval)
+                delta = {}
+                for engine in self.engines:
+                    snapshot = engine.state.snapshot()
+                    # snapshots are replaced on every change, an unchanged engine costs one comparison
+                    if snapshot is snapshots[engine.symbol]:
+                        continue
+                    snapshots[engine.symbol] = snapshot
+                    view = engine_view(snapshot)
+                    changes = diff_views(views[engine.symbol], view)
+                    views[engine.symbol] = view
+                    if changes:
+                        delta[engine.symbol] = changes
+
+                if delta:
+                    self._send_event(handler, 'delta', delta)
+                    last_sent_at = self.clock()
+                elif self.clock() - last_sent_at >= self.heartbeat:
+                    handler.wfile.write(b": heartbeat\n\n")
+                    handler.wfile.flush()
+                    last_sent_at = self.clock()
+        except (BrokenPipeError, ConnectionResetError):
+            return
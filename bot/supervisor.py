@@ -0,0 +1,279 @@
+import logging
+import logging.handlers
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+import traceback
+from functools import partial
+from bot.price_bus import PriceBus, run_feed_handler
+from bot.price_source import create_price_source, AggTradePriceSource
+from bot.symbol_config import load_symbol_config
+
+# key of the feed handler process among the workers'
+FEED_HANDLER = 'feed'
+
+
+def shard_symbols(symbols: list, workers: int) -> list:
+    """
+    Splits symbols round-robin into at most `workers` non-empty shards
+    """
+    shards = [symbols[i::workers] for i in range(workers)]
+    return [shard for shard in shards if shard]
+
+
+def _engine_metrics(engine):
+    snapshot = engine.state.snapshot()
+    return {
+        'production_last_price': snapshot.production_last_price,
+        'open_bids': len(snapshot.open_orders['bids']),
+        'open_asks': len(snapshot.open_orders['asks']),
+        'fills': snapshot.fill_count,
+        'orders_placed': snapshot.order_count,
+    }
+
+
+def run_worker(worker_id, symbols, engine_options, ipc_queue, health_port=None, metrics_interval=5, profile_dir=None, symbol_config_file=None, health_host="127.0.0.1"):
+    """
+    Worker process entry point: one TestnetMM engine per (base_asset, quote_asset) in `symbols`, each on its own thread.
+    Log records and periodic metrics are sent to the supervisor over `ipc_queue`.
+    Exits non-zero as soon as any engine stops, so the supervisor restarts the shard.
+    With `profile_dir`, the worker can be profiled through signals or its health server, see ProfilingControls.
+    With `symbol_config_file`, each engine takes its pair's settings from it and changed settings are applied while running
+    """
+    from bot.logger import get_logger
+    from bot.testnet_mm import TestnetMM
+    from bot.health_server import HealthServer
+    from bot.profiler import ProfilingControls
+    from bot.state_stream import StateStream
+    from bot.symbol_config import SymbolConfigWatcher
+
+    def to_supervisor(bot_logger):
+        # the supervisor owns the terminal
+        bot_logger.logger.handlers = [logging.handlers.QueueHandler(ipc_queue)]
+        bot_logger.clear_screen = False
+
+    logger = get_logger()
+    to_supervisor(logger)
+
+    watcher = None
+    if symbol_config_file is not None:
+        watcher = SymbolConfigWatcher(symbol_config_file, lambda *diff: _apply_symbol_config(worker_id, engines, *diff), logger.logger.error)
+        settings = watcher.config
+        engines = [
+            TestnetMM(base_asset, quote_asset, **dict(engine_options, **settings[base_asset + quote_asset].engine_options()))
+            for base_asset, quote_asset in symbols
+        ]
+        watcher.install_signal_handler()
+        watcher.start()
+    else:
+        engines = [TestnetMM(base_asset, quote_asset, **engine_options) for base_asset, quote_asset in symbols]
+    for engine in engines:
+        to_supervisor(engine.logger)
+    stopped = threading.Event()
+
+    profiling = ProfilingControls(profile_dir) if profile_dir is not None else None
+    if profiling:
+        profiling.install_signal_handlers()
+
+    if health_port is not None:
+        HealthServer(
+            engines,
+            host=health_host,
+            port=health_port + worker_id,
+            post_routes=profiling.routes() if profiling else None,
+            routes=StateStream(engines).routes()
+        ).start()
+
+    def run_engine(engine):
+        try:
+            engine.run()
+        except Exception:
+            logger.logger.error(f"{engine.symbol} stopped: {traceback.format_exc()}")
+        finally:
+            stopped.set()
+
+    for engine in engines:
+        threading.Thread(target=run_engine, args=(engine,), daemon=True).start()
+
+    while not stopped.wait(metrics_interval):
+        ipc_queue.put(('metrics', worker_id, {engine.symbol: _engine_metrics(engine) for engine in engines}))
+
+    os._exit(1)
+
+
+def _apply_symbol_config(worker_id, engines, added, removed, changed):
+    from bot.logger import get_logger
+
+    for engine in engines:
+        if engine.symbol in changed:
+            engine.submit(partial(engine.apply_settings, **changed[engine.symbol]))
+
+    # shards are fixed when the supervisor starts
+    if (added or removed) and worker_id == 0:
+        get_logger().logger.info(f"Restart to add {added} or remove {removed}")
+
+
+class Supervisor:
+    """
+    Shards symbols across worker processes and keeps them running.
+
+    A crashed worker is restarted after a backoff that doubles on every consecutive crash, up to `max_backoff` seconds.
+    A worker that stayed up for `stable_after` seconds is considered healthy again and its backoff resets.
+    With `symbol_config_file`, pairs and their settings come from that TOML file instead of `symbols`, see bot.symbol_config.
+    Workers reload it when it changes or on SIGHUP, which the supervisor forwards to them.
+    With `price_bus`, a feed handler process holds the only production connection and publishes every symbol's trades
+    to a PriceBus the engines read, instead of one connection per engine. It's restarted like a worker
+    """
+    def __init__(
+        self,
+        symbols,
+        workers=None,
+        engine_options=None,
+        initial_backoff=1,
+        max_backoff=60,
+        stable_after=60,
+        health_port=None,
+        health_host="127.0.0.1",
+        profile_dir=None,
+        symbol_config_file=None,
+        price_bus=False,
+        clock=time.monotonic
+    ):
+        # checked here once, each worker's engine would reject it and be restarted forever
+        if price_bus and not isinstance(create_price_source((engine_options or {}).get('price_source', "aggTrade")), AggTradePriceSource):
+            raise ValueError("The price bus only carries aggTrades, use the aggTrade price source")
+        if symbol_config_file is not None:
+            symbols = [(settings.base_asset, settings.quote_asset) for settings in load_symbol_config(symbol_config_file).values()]
+        self.shards = shard_symbols(list(symbols), workers or os.cpu_count() or 1)
+        self.engine_options = engine_options or {}
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.stable_after = stable_after
+        self.health_port = health_port
+        self.health_host = health_host
+        self.profile_dir = profile_dir
+        self.symbol_config_file = symbol_config_file
+        self.price_bus = price_bus
+        self.bus = None
+        self.clock = clock
+        self.context = multiprocessing.get_context("spawn")
+        self.ipc_queue = self.context.Queue()
+        self.processes = {}
+        self.started_at = {}
+        self.backoff = {}
+        self.restart_at = {}
+        self.metrics = {}
+        self.keep_alive = True
+        self.logger = logging.getLogger('TestnetMMSupervisor')
+        if not self.logger.handlers:
+            self.logger.addHandler(logging.StreamHandler())
+        self.logger.setLevel(logging.INFO)
+
+    def run(self):
+        if self.price_bus:
+            self._create_price_bus()
+            self._spawn(FEED_HANDLER)
+        for worker_id in range(len(self.shards)):
+            self._spawn(worker_id)
+
+        if self.symbol_config_file is not None and hasattr(signal, 'SIGHUP'):
+            signal.signal(signal.SIGHUP, lambda *_: self._forward_signal(signal.SIGHUP))
+
+        try:
+            while self.keep_alive:
+                self._drain_ipc(timeout=1)
+                self._check_workers()
+        finally:
+            self.terminate()
+
+    def terminate(self):
+        self.keep_alive = False
+        for process in self.processes.values():
+            if process.is_alive():
+                process.terminate()
+        if self.bus:
+            self.bus.close()
+            self.bus = None
+
+    def _create_price_bus(self):
+        self.bus = PriceBus.create([base_asset + quote_asset for shard in self.shards for base_asset, quote_asset in shard])
+        self.engine_options = dict(self.engine_options, price_bus=self.bus.path)
+
+    def _forward_signal(self, signum):
+        for worker_id, process in self.processes.items():
+            # the feed handler has no settings to reload
+            if worker_id != FEED_HANDLER and process.is_alive():
+                os.kill(process.pid, signum)
+
+    def _spawn(self, worker_id):
+        if worker_id == FEED_HANDLER:
+            process = self.context.Process(
+                target=run_feed_handler,
+                args=(self.bus.path, self._production_ws_base_urls(), self.engine_options.get('websocket_transport')),
+                name="testnet-mm-feed",
+                daemon=True
+            )
+            started = f"feed handler for {self.bus.symbols}"
+        else:
+            process = self.context.Process(
+                target=run_worker,
+                args=(worker_id, self.shards[worker_id], self.engine_options, self.ipc_queue, self.health_port),
+                kwargs={'profile_dir': self.profile_dir, 'symbol_config_file': self.symbol_config_file, 'health_host': self.health_host},
+                name=f"testnet-mm-worker-{worker_id}",
+                daemon=True
+            )
+            started = self.shards[worker_id]
+        process.start()
+        self.processes[worker_id] = process
+        self.started_at[worker_id] = self.clock()
+        self.restart_at.pop(worker_id, None)
+        self.logger.info(f"worker {worker_id}: started {started} (pid {process.pid})")
+
+    def _production_ws_base_urls(self):
+        return (
+            self.engine_options.get('production_ws_base_urls')
+            or [self.engine_options.get('production_ws_base_url', "wss://stream.binance.com:9443/ws")]
+        )
+
+    def _check_workers(self):
+        now = self.clock()
+
+        for worker_id, process in self.processes.items():
+            if worker_id in self.restart_at:
+                if now >= self.restart_at[worker_id]:
+                    self._spawn(worker_id)
+                continue
+
+            if process.is_alive():
+                continue
+
+            if now - self.started_at[worker_id] >= self.stable_after:
+                self.backoff[worker_id] = self.initial_backoff
+            else:
+                self.backoff[worker_id] = min(self.backoff.get(worker_id, self.initial_backoff / 2) * 2, self.max_backoff)
+
+            self.restart_at[worker_id] = now + self.backoff[worker_id]
+            self.logger.info(f"worker {worker_id}: exited with {process.exitcode}, restarting in {self.backoff[worker_id]}s")
+
+    def _drain_ipc(self, timeout):
+        try:
+            message = self.ipc_queue.get(timeout=timeout)
+        except queue.Empty:
+            return
+
+        while True:
+            self._handle_ipc(message)
+            try:
+                message = self.ipc_queue.get_nowait()
+            except queue.Empty:
+                return
+
+    def _handle_ipc(self, message):
+        if isinstance(message, logging.LogRecord):
+            self.logger.log(message.levelno, f"[{message.processName}] {message.getMessage()}")
+        elif message[0] == 'metrics':
+            _, worker_id, metrics = message
+            self.metrics[worker_id] = metrics
@@ -0,0 +1,185 @@
+import os
+import signal
+import threading
+from decimal import Decimal, InvalidOperation
+from typing import NamedTuple
+from bot.exceptions import SymbolConfigException
+
+
+class SymbolSettings(NamedTuple):
+    """
+    Quoting settings of one pair, passed to TestnetMM as keyword arguments
+    """
+    base_asset: str
+    quote_asset: str
+    mode: str = "spread"
+    distance_from_mid_price: str = "0.01"
+    spread_policy: str = "fixed"
+    min_distance_from_mid_price: str = "0.001"
+    max_distance_from_mid_price: str = "0.05"
+    depth_levels: int = 5
+    depth_size_ratio: str = "1"
+    depth_min_size_change: str = "0.1"
+
+    @property
+    def symbol(self):
+        return self.base_asset + self.quote_asset
+
+    def engine_options(self) -> dict:
+        options = self._asdict()
+        del options['base_asset'], options['quote_asset']
+        return options
+
+
+_RATES = ('distance_from_mid_price', 'min_distance_from_mid_price', 'max_distance_from_mid_price', 'depth_size_ratio', 'depth_min_size_change')
+_CHOICES = {'mode': ('spread', 'mirror'), 'spread_policy': ('fixed', 'adaptive')}
+
+
+def _validate(entry: dict, defaults: dict) -> SymbolSettings:
+    unknown = set(entry) - set(SymbolSettings._fields)
+    if unknown:
+        raise SymbolConfigException(f"Unknown settings {sorted(unknown)}")
+
+    values = dict(defaults, **entry)
+    for field in ('base_asset', 'quote_asset'):
+        if not isinstance(values.get(field), str) or not values[field].isalnum():
+            raise SymbolConfigException(f"'{field}' must be an asset name")
+        values[field] = values[field].upper()
+
+    for field, choices in _CHOICES.items():
+        if field in values and values[field] not in choices:
+            raise SymbolConfigException(f"'{field}' must be one of {choices}")
+
+    for field in _RATES:
+        if field not in values:
+            continue
+        # rates stay strings, floats would lose the exact decimal
+        values[field] = str(values[field])
+        try:
+            rate = Decimal(values[field])
+        except InvalidOperation:
+            raise SymbolConfigException(f"'{field}' must be a number, got {values[field]!r}")
+        if rate < 0 or (field.endswith('distance_from_mid_price') and rate >= 1):
+            raise SymbolConfigException(f"'{field}' must be between 0 and 1, got {values[field]}")
+
+    if 'depth_levels' in values and (not isinstance(values['depth_levels'], int) or values['depth_levels'] < 1):
+        raise SymbolConfigException("'depth_levels' must be a positive integer")
+
+    settings = SymbolSettings(**values)
+    if Decimal(settings.min_distance_from_mid_price) > Decimal(settings.max_distance_from_mid_price):
+        raise SymbolConfigException("'min_distance_from_mid_price' is above 'max_distance_from_mid_price'")
+    return settings
+
+
+def load_symbol_config(path) -> dict:
+    """
+    Reads and validates a TOML symbol config, returns {symbol: SymbolSettings} in file order.
+
+        [defaults]
+        distance_from_mid_price = "0.0003"
+
+        [[symbols]]
+        base_asset = "BTC"
+        quote_asset = "BUSD"
+        spread_policy = "adaptive"
+
+    Every [[symbols]] entry takes the [defaults] for settings it doesn't set
+    """
+    # imported here so the bot runs without tomli on Python < 3.11 when no symbol config is used
+    try:
+        import tomllib
+    except ImportError:
+        import tomli as tomllib
+
+    try:
+        with open(path, "rb") as f:
+            document = tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError) as err:
+        raise SymbolConfigException(f"Unable to read {path}: {err}")
+
+    defaults = document.get('defaults', {})
+    config = {}
+    for i, entry in enumerate(document.get('symbols', [])):
+        try:
+            settings = _validate(entry, defaults)
+        except SymbolConfigException as err:
+            raise SymbolConfigException(f"{path} symbols[{i}]: {err}")
+        if settings.symbol in config:
+            raise SymbolConfigException(f"{path}: {settings.symbol} is listed twice")
+        config[settings.symbol] = settings
+
+    if not config:
+        raise SymbolConfigException(f"{path}: no [[symbols]]")
+    return config
+
+
+def diff_symbol_config(old: dict, new: dict) -> tuple:
+    """
+    Returns (added, removed, changed) symbols, `changed` maps each symbol to its changed settings only
+    """
+    added = [symbol for symbol in new if symbol not in old]
+    removed = [symbol for symbol in old if symbol not in new]
+    changed = {}
+    for symbol in new:
+        if symbol in old and new[symbol] != old[symbol]:
+            changed[symbol] = {
+                field: value for field, value in new[symbol].engine_options().items()
+                if getattr(old[symbol], field) != value
+            }
+    return added, removed, changed
+
+
+class SymbolConfigWatcher:
+    """
+    Reloads the symbol config when the file changes (checked every `interval` seconds) or on SIGHUP.
+    `on_change(added, removed, changed)` is called with the differences to the last valid config.
+    An invalid file is reported to `on_error` and the last valid config stays in effect
+    """
+    def __init__(self, path, on_change, on_error=print, interval=1):
+        self.path = path
+        self.on_change = on_change
+        self.on_error = on_error
+        self.interval = interval
+        self.config = load_symbol_config(path)
+        self.mtime = os.path.getmtime(path)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def start(self):
+        threading.Thread(target=self._run, name="symbol-config-watcher", daemon=True).start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def install_signal_handler(self):
+        # not available on Windows
+        if not hasattr(signal, 'SIGHUP'):
+            return
+        signal.signal(signal.SIGHUP, lambda *_: threading.Thread(target=self.reload, daemon=True).start())
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def check(self):
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return
+        if mtime != self.mtime:
+            self.reload()
+
+    def reload(self):
+        with self._lock:
+            self.mtime = os.path.getmtime(self.path)
+            try:
+                config = load_symbol_config(self.path)
+            except SymbolConfigException as err:
+                self.on_error(f"Keeping the current symbol config: {err}")
+                return
+
+            added, removed, changed = diff_symbol_config(self.config, config)
+            self.config = config
+            if added or removed or changed:
+                self.on_change(added, removed, changed)
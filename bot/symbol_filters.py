@@ -0,0 +1,164 @@
+from collections import Counter
+from decimal import Decimal, ROUND_DOWN, ROUND_UP
+from bot.exceptions import TestnetMMOrderRejectedException
+
+
+class SymbolFilters:
+    """
+    Every exchangeInfo filter of one symbol, checks limit orders locally before they reach postOrder
+    https://binance-docs.github.io/apidocs/spot/en/#filters
+
+    Orders are fixed where the intent survives: prices are rounded to the tick (bids down, asks up) and clamped
+    into the price limits and the PERCENT_PRICE band, quantities are floored to the step and reduced to maxQty and maxNotional.
+    Orders that can't be fixed (below minQty or minNotional, too many open orders, symbol not trading) are rejected.
+    The percent band is relative to the exchange's average price, set `reference_price` to enforce it, it is skipped while unknown
+    """
+    def __init__(self, symbol_info: dict):
+        self.symbol = symbol_info['symbol']
+        self.status = symbol_info.get('status', 'TRADING')
+        self.order_types = symbol_info.get('orderTypes')
+        self.tick_size = self.min_price = self.max_price = None
+        self.step_size = self.min_qty = self.max_qty = None
+        self.min_notional = self.max_notional = None
+        self.max_num_orders = None
+        # side: (multiplierDown, multiplierUp)
+        self.price_band = {}
+        self.reference_price = None
+        self.adjustments = Counter()
+        self.rejections_avoided = Counter()
+
+        for f in symbol_info.get('filters', []):
+            filter_type = f['filterType']
+            if filter_type == 'PRICE_FILTER':
+                self.tick_size = self._positive(f['tickSize'])
+                self.min_price = self._positive(f['minPrice'])
+                self.max_price = self._positive(f['maxPrice'])
+
+            elif filter_type == 'LOT_SIZE':
+                self.step_size = self._positive(f['stepSize'])
+                self.min_qty = self._positive(f['minQty'])
+                self.max_qty = self._positive(f['maxQty'])
+
+            elif filter_type == 'MIN_NOTIONAL':
+                self.min_notional = self._positive(f['minNotional'])
+
+            elif filter_type == 'NOTIONAL':
+                self.min_notional = self._positive(f['minNotional'])
+                self.max_notional = self._positive(f.get('maxNotional', '0'))
+
+            elif filter_type == 'PERCENT_PRICE':
+                band = (Decimal(f['multiplierDown']), Decimal(f['multiplierUp']))
+                self.price_band = {'BUY': band, 'SELL': band}
+
+            elif filter_type == 'PERCENT_PRICE_BY_SIDE':
+                self.price_band = {
+                    'BUY': (Decimal(f['bidMultiplierDown']), Decimal(f['bidMultiplierUp'])),
+                    'SELL': (Decimal(f['askMultiplierDown']), Decimal(f['askMultiplierUp'])),
+                }
+
+            elif filter_type == 'MAX_NUM_ORDERS':
+                self.max_num_orders = f['maxNumOrders']
+
+    @staticmethod
+    def _positive(value):
+        # a limit of 0 means the filter doesn't apply
+        value = Decimal(value)
+        return value if value > 0 else None
+
+    @property
+    def has_price_band(self):
+        return bool(self.price_band)
+
+    def _reject(self, filter_type, msg):
+        self.rejections_avoided[filter_type] += 1
+        return TestnetMMOrderRejectedException(filter_type, f"{self.symbol} {msg}")
+
+    @staticmethod
+    def _round(value, increment, rounding):
+        return (value / increment).to_integral_value(rounding) * increment
+
+    @classmethod
+    def _floor(cls, value, increment) -> str:
+        if not increment:
+            return '{:f}'.format(value)
+        # as many decimals as the increment has significant ones, none for steps of 1 or more
+        return '{:f}'.format(cls._round(value, increment, ROUND_DOWN).quantize(increment.normalize()))
+
+    def floor_quantity(self, qty: Decimal) -> str:
+        """
+        `qty` rounded down to the step size
+        """
+        return self._floor(qty, self.step_size)
+
+    def floor_price(self, price: Decimal) -> str:
+        """
+        `price` rounded down to the tick size
+        """
+        return self._floor(price, self.tick_size)
+
+    def _fix_price(self, side, price):
+        if self.tick_size:
+            price = self._round(price, self.tick_size, ROUND_DOWN if side == 'BUY' else ROUND_UP)
+
+        low, high = self.min_price, self.max_price
+        if self.reference_price and side in self.price_band:
+            multiplier_down, multiplier_up = self.price_band[side]
+            band_low, band_high = self.reference_price * multiplier_down, self.reference_price * multiplier_up
+            if self.tick_size:
+                band_low = self._round(band_low, self.tick_size, ROUND_UP)
+                band_high = self._round(band_high, self.tick_size, ROUND_DOWN)
+            low = max(low, band_low) if low else band_low
+            high = min(high, band_high) if high else band_high
+
+        if low and price < low:
+            price = low
+        elif high and price > high:
+            price = high
+        return price
+
+    def _fix_quantity(self, qty, price):
+        if self.step_size:
+            qty = self._round(qty, self.step_size, ROUND_DOWN)
+        if self.max_qty and qty > self.max_qty:
+            qty = self.max_qty
+        if self.max_notional and qty * price > self.max_notional:
+            qty = self.max_notional / price
+            if self.step_size:
+                qty = self._round(qty, self.step_size, ROUND_DOWN)
+        return qty
+
+    def validate(self, side: str, qty: str, price: str, open_orders=0, order_type="LIMIT") -> tuple[str, str]:
+        """
+        Returns the (quantity, price) to send, unchanged strings when the order already passes every filter.
+        Raises TestnetMMOrderRejectedException for orders the exchange would reject
+        """
+        if self.status != 'TRADING':
+            raise self._reject('STATUS', f"is {self.status}")
+        if self.order_types is not None and order_type not in self.order_types:
+            raise self._reject('ORDER_TYPE', f"doesn't allow {order_type} orders")
+        if self.max_num_orders and open_orders >= self.max_num_orders:
+            raise self._reject('MAX_NUM_ORDERS', f"has {open_orders} open orders, the limit is {self.max_num_orders}")
+
+        requested_price, requested_qty = Decimal(price), Decimal(qty)
+        fixed_price = self._fix_price(side, requested_price)
+        fixed_qty = self._fix_quantity(requested_qty, fixed_price)
+
+        if fixed_qty <= 0 or (self.min_qty and fixed_qty < self.min_qty):
+            raise self._reject('LOT_SIZE', f"quantity {qty} is below {self.min_qty}")
+        if self.min_notional and fixed_qty * fixed_price < self.min_notional:
+            raise self._reject('MIN_NOTIONAL', f"notional {fixed_qty * fixed_price:f} is below {self.min_notional}")
+
+        if fixed_price != requested_price:
+            self.adjustments['price'] += 1
+            price = '{:f}'.format(fixed_price)
+        if fixed_qty != requested_qty:
+            self.adjustments['quantity'] += 1
+            qty = '{:f}'.format(fixed_qty)
+        return qty, price
+
+    def summary(self) -> dict:
+        return {
+            'rejections_avoided': dict(self.rejections_avoided),
+            'adjustments': dict(self.adjustments),
+            'reference_price': str(self.reference_price) if self.reference_price else None,
+        }
@@ -1,19 +1,35 @@
-import math
+import json
+import queue
 import traceback
-from time import sleep
+from contextlib import nullcontext
+from functools import partial
+from time import perf_counter
 from decimal import Decimal
-from datetime import datetime
-from lib.binance import BinanceWebsocketClient, BinanceClient
+from lib.binance import BinanceWebsocketClient, BinanceMultiEndpointWebsocketClient, BinanceClient, BinanceAccountPool, BinanceWebsocketApiClient
 from lib.binance.rest.exceptions import BinanceRestException
+from lib.binance.rest.policy import is_transient
+from lib.binance.rest.time_sync import ServerTimeEstimator
+from lib.binance.websocket.transport import TransportProfile
+from lib.binance.websocket.exceptions import BinanceWebsocketApiConnectionException
+from lib.clock import REAL_CLOCK
 from bot.testnet_mm_state import TestnetMMState
-from bot.exceptions import TestnetMMOrderFailedException, TestnetMMInsufficientFundsException
-from bot.logger import logger
+from bot.order_gateway import RestOrderGateway, PooledRestOrderGateway, WebsocketApiOrderGateway
+from bot.price_source import create_price_source, AggTradePriceSource
+from bot.price_bus import PriceBusReader
+from bot.depth_mirror import DepthMirror
+from bot.market_stats import MarketStats, SpreadPolicy
+from bot.journal import TradeJournal
+from bot.symbol_filters import SymbolFilters
+from bot.inventory import InventoryManager
+from bot.tracing import TickTracer
+from bot.watchdog import FeedWatchdog
+from bot.exceptions import TestnetMMOrderFailedException, TestnetMMInsufficientFundsException, TestnetMMOrderRejectedException
+from bot.logger import get_logger
 
 
 class TestnetMM:
-    @staticmethod
-    def _record_last_price(price: str):
-        TestnetMMState.PRODUCTION_LAST_PRICE = price
+    ORDER_ENTRY_STATS_TO_KEEP = 1000
+    AVG_PRICE_REFRESH_INTERVAL = 60
 
     def __init__(
         self,
@@ -24,38 +40,151 @@ class TestnetMM:
         testnet_rest_base_url="https://testnet.binance.vision",
         testnet_ws_base_url="wss://testnet.binance.vision/ws",
         production_ws_base_url="wss://stream.binance.com:9443/ws",
-        distance_from_mid_price="0.01"
+        distance_from_mid_price="0.01",
+        order_gateway="rest",
+        testnet_ws_api_base_url="wss://testnet.binance.vision/ws-api/v3",
+        price_source="aggTrade",
+        price_min_interval=None,
+        mode="spread",
+        production_rest_base_url="https://api.binance.com",
+        depth_levels=5,
+        depth_size_ratio="1",
+        depth_min_size_change="0.1",
+        testnet_api_credentials=None,
+        production_ws_base_urls=None,
+        feed_stale_after=10,
+        recv_window=None,
+        server_time_sync_interval=60,
+        order_response_type="RESULT",
+        spread_policy="fixed",
+        min_distance_from_mid_price="0.001",
+        max_distance_from_mid_price="0.05",
+        journal_dir=None,
+        rest_client=None,
+        trace_file=None,
+        inventory_target_ratio="0.5",
+        inventory_size_skew="1",
+        inventory_price_skew="0.5",
+        websocket_transport=None,
+        price_bus=None,
+        clock=REAL_CLOCK
     ):
+        """
+        `mode` is either "spread", quoting one bid and ask around the production price,
+        or "mirror", copying the top `depth_levels` of the production order book into testnet
+        `testnet_api_credentials` is an optional list of (key, secret) pairs, order load is spread across these accounts
+        `production_ws_base_urls` is an optional list of production endpoints raced against each other, replacing `production_ws_base_url`
+        `feed_stale_after` is the number of seconds without production data before quotes are pulled and the feed reconnected
+        `server_time_sync_interval` is the number of seconds between server time offset estimates, None signs with the local clock
+        `order_response_type` is either "RESULT", copying order details from the order response, or "ACK",
+        tracking the order as pending and finalizing it from the user stream
+        `spread_policy` is either "fixed", quoting `distance_from_mid_price` away, or "adaptive", quoting between
+        `min_distance_from_mid_price` and `max_distance_from_mid_price` depending on production volatility
+        `journal_dir` is an optional directory orders and fills are journaled to, see report.py
+        `rest_client` optionally replaces the testnet BinanceClient, e.g. with a SimulatedBinanceClient
+        `trace_file` enables tick-to-executionReport tracing, finished traces are written to it in the Chrome trace format
+        `inventory_target_ratio` is the share of the inventory's value to hold in the base asset, quote sizes and prices
+        are skewed toward it by `inventory_size_skew` and `inventory_price_skew`, see InventoryManager
+        `websocket_transport` is an optional dict of TransportProfile options for every websocket connection
+        `price_bus` is the path of a PriceBus published by a feed handler process, read instead of connecting to production.
+        It carries aggTrades only: it needs the "aggTrade" price source, and "mirror" mode keeps its own depth connection
+        `clock` is the RealClock or VirtualClock behind every wait, interval and request timestamp of the engine and its clients.
+        Latency measurements stay on perf_counter
+        """
+        self.clock = clock
         self.base_asset = base_asset.upper()
         self.quote_asset = quote_asset.upper()
         self.symbol = self.base_asset + self.quote_asset
-        self.rest_client = BinanceClient(
+        # one logger per engine, engines sharing a process would overwrite each other's last price and open orders
+        self.logger = get_logger(f"TestnetMM.{self.symbol}", clock=clock)
+        self.account_pool = BinanceAccountPool(
             testnet_rest_base_url,
+            testnet_api_credentials,
+            clock=clock
+        ) if testnet_api_credentials else None
+        if rest_client is None:
+            rest_client = self.account_pool.clients[0] if self.account_pool else BinanceClient(
+                testnet_rest_base_url,
+                testnet_api_key,
+                testnet_api_secret,
+                clock=clock
+            )
+        self.rest_client = rest_client
+        self.tracer = TickTracer(trace_file) if trace_file else None
+        self.websocket_transport = TransportProfile(**websocket_transport) if websocket_transport else None
+        for rest_client in self._user_stream_clients():
+            rest_client.recv_window = recv_window
+            rest_client.span_recorder = self.tracer.record if self.tracer else None
+        self.server_time_sync_interval = server_time_sync_interval
+        self.order_response_type = order_response_type
+        self.order_entry_stats = {}
+        if order_gateway == "ws-api" and self.account_pool:
+            raise ValueError("The ws-api gateway signs with testnet_api_key only, it can't place orders for an account pool")
+        self.order_gateway = self._create_order_gateway(
+            order_gateway,
+            testnet_ws_api_base_url,
             testnet_api_key,
             testnet_api_secret
         )
         self.testnet_ws_base_url = testnet_ws_base_url
         self.production_ws_base_url = production_ws_base_url
+        self.production_ws_base_urls = production_ws_base_urls
         self.distance_from_mid_price = distance_from_mid_price
-        self.base_asset_precision = {}
-        self.price_precision = {}
-        self.min_notional = {}
-        logger.update('open_orders', TestnetMMState.OPEN_ORDERS)
+        self.price_source = create_price_source(price_source, price_min_interval, clock=clock.monotonic)
+        if price_bus and not isinstance(self.price_source, AggTradePriceSource):
+            raise ValueError("The price bus only carries aggTrades, use the aggTrade price source")
+        self.price_bus = price_bus
+        self.market_stats = MarketStats() if spread_policy == "adaptive" else None
+        self.spread_policy = SpreadPolicy(
+            distance_from_mid_price,
+            min_distance=min_distance_from_mid_price,
+            max_distance=max_distance_from_mid_price
+        ) if spread_policy == "adaptive" else None
+        self.quoted_distance = None
+        # sides expected to have open orders, both until a requote leaves one out for lack of inventory
+        self.quoted_sides = {'bids', 'asks'}
+        self.inventory = InventoryManager(inventory_target_ratio, inventory_size_skew, inventory_price_skew)
+        self.depth_mirror = DepthMirror(
+            self.symbol,
+            BinanceClient(production_rest_base_url, clock=clock),
+            levels=depth_levels,
+            size_ratio=depth_size_ratio,
+            min_size_change=depth_min_size_change,
+            clock=clock.monotonic,
+            logger=self.logger
+        ) if mode == "mirror" else None
+        self.symbol_filters = None
+        self.avg_price_refreshed_at = None
+        self.state = TestnetMMState(self.logger)
+        self.journal = TradeJournal(journal_dir, self.symbol) if journal_dir else None
+        self.listen_keys = {}
+        self.bws = None
+        self.uws = []
+        self.watchdog = FeedWatchdog(feed_stale_after, clock=clock.monotonic)
+        self.keep_alive = False
+        self.ready = False
+        # websocket threads only enqueue, the engine thread is the single writer of `state`
+        self.events = queue.Queue()
+        self.logger.update('open_orders', self.state.snapshot().open_orders)
 
     def run(self):
         """
         Entry point for bot to begin executing.
         First, we retrieve filters for order precision
-        Next, we cancel any open orders to not interfere with our bot
+        Next, we connect the order gateway and cancel any open orders to not interfere with our bot
         Then, we subscribe to price socket stream and user stream
         Finally, we keep the program running forever until stopped
         """
         self._get_asset_filters()
+        self._start_server_time_sync()
+        self.order_gateway.connect()
         self._cancel_open_orders()
         self.keep_alive = True
         self.bws = self._connect_to_production_trade_stream()
-        self.last_keep_listen_key_alive_at = datetime.now()
+        self.last_keep_listen_key_alive_at = self.clock.monotonic()
         self.uws = self._connect_to_testnet_user_stream()
+        self.watchdog.watch('production', self.symbol)
+        self.ready = True
         self._keep_alive()
 
     def terminate(self):
@@ -66,35 +195,231 @@ class TestnetMM:
         self._cancel_open_orders()
         self.keep_alive = False
 
+    def apply_settings(self, **settings):
+        """
+        Applies changed quoting settings, as listed in SymbolSettings, on the engine thread: use `submit`.
+        Nothing is cancelled or reconnected here, the next production tick requotes whatever is off the new settings.
+        `mode` changes the subscriptions and only applies on restart.
+        Switching to the adaptive spread policy with a book ticker price source has no trades to learn from,
+        it quotes `distance_from_mid_price` until restarted
+        """
+        if 'mode' in settings:
+            self.logger.update('info', f"{self.symbol}: mode changes apply on restart")
+
+        if 'distance_from_mid_price' in settings:
+            self.distance_from_mid_price = settings['distance_from_mid_price']
+
+        spread_settings = ('spread_policy', 'min_distance_from_mid_price', 'max_distance_from_mid_price', 'distance_from_mid_price')
+        if any(key in settings for key in spread_settings):
+            policy = settings.get('spread_policy', 'adaptive' if self.spread_policy else 'fixed')
+            current = self.spread_policy or SpreadPolicy()
+            self.spread_policy = SpreadPolicy(
+                self.distance_from_mid_price,
+                min_distance=settings.get('min_distance_from_mid_price', current.min_distance),
+                max_distance=settings.get('max_distance_from_mid_price', current.max_distance)
+            ) if policy == 'adaptive' else None
+            if self.spread_policy and not self.market_stats:
+                self.market_stats = MarketStats()
+
+        if self.depth_mirror:
+            self.depth_mirror.levels = settings.get('depth_levels', self.depth_mirror.levels)
+            self.depth_mirror.size_ratio = Decimal(settings.get('depth_size_ratio', self.depth_mirror.size_ratio))
+            self.depth_mirror.min_size_change = Decimal(settings.get('depth_min_size_change', self.depth_mirror.min_size_change))
+
+        self.logger.update('info', f"{self.symbol}: applied {settings}")
+
+    def submit(self, mutation):
+        """
+        Queues `mutation` to be called on the engine thread. Use this from any other thread instead of touching state
+        """
+        self.events.put(mutation)
+
     def _keep_alive(self):
         while self.keep_alive:
-            if (datetime.now() - self.last_keep_listen_key_alive_at).seconds > 60 * 50:
+            if self.clock.monotonic() - self.last_keep_listen_key_alive_at > 60 * 50:
                 self._keep_listen_key_alive()
 
-            sleep(1)
+            self._process_next_event(timeout=self._idle_timeout())
+            self._publish_held_back_price()
+            self._check_feeds()
 
         self.bws.disconnect()
-        self.uws.disconnect()
+        for uws in self.uws:
+            uws.disconnect()
+        self.order_gateway.disconnect()
+
+    def _idle_timeout(self):
+        """
+        Waits for events at most a second, less when a held back reference price becomes due sooner
+        """
+        due_in = self.price_source.due_in()
+        return 1 if due_in is None else min(1, due_in)
+
+    def _publish_held_back_price(self):
+        """
+        Trailing edge of price conflation: the last price held back within `price_min_interval` is quoted once it's due,
+        even if production sends nothing after it
+        """
+        price = self.price_source.flush()
+        if price is not None:
+            self._on_reference_price(price)
+
+    def _on_reference_price(self, price):
+        self._record_last_price(price)
+        self.logger.update('production_last_price', price)
+        self._trade()
+
+    def _start_server_time_sync(self):
+        if self.server_time_sync_interval is None:
+            return
+
+        clients = self._user_stream_clients()
+        if isinstance(self.order_gateway, WebsocketApiOrderGateway):
+            clients.append(self.order_gateway.ws_api_client)
+        self.server_time_estimator = ServerTimeEstimator(
+            clients,
+            interval=self.server_time_sync_interval,
+            clock_ms=lambda: self.clock.time() * 1000
+        ).start()
+
+    def _create_order_gateway(self, order_gateway, ws_api_base_url, api_key, api_secret):
+        """
+        `order_gateway` is either "rest", "ws-api" or an OrderGateway instance
+        """
+        if order_gateway == "rest" and self.account_pool:
+            return PooledRestOrderGateway(self.account_pool)
+
+        if order_gateway == "rest":
+            return RestOrderGateway(self.rest_client)
+
+        if order_gateway == "ws-api":
+            # cancels fall back to REST while the connection is down
+            return WebsocketApiOrderGateway(BinanceWebsocketApiClient(
+                name="testnet ws-api",
+                ws_api_base_url=ws_api_base_url,
+                key=api_key,
+                secret=api_secret,
+                transport=self.websocket_transport,
+                clock=self.clock,
+                close_handler=lambda: self.submit(self._on_order_gateway_closed)
+            ), fallback=RestOrderGateway(self.rest_client))
+
+        return order_gateway
+
+    def _process_next_event(self, timeout):
+        try:
+            event = self.clock.wait(self.events, timeout)
+        except queue.Empty:
+            return
+
+        if callable(event):
+            event()
+        else:
+            self._message_handler(event)
+
+    def _check_feeds(self):
+        """
+        A production feed that went silent leaves stale quotes resting, pull them and reconnect
+        """
+        if ('production', self.symbol) not in self.watchdog.stale():
+            return
+
+        self.logger.update('info', f"No production data for {self.watchdog.stale_after}s, pulling quotes and reconnecting")
+        self._cancel_open_orders()
+        self._reconnect_production_stream()
+
+    def _reconnect_production_stream(self):
+        stale_bws = self.bws
+        self.bws = self._connect_to_production_trade_stream()
+        stale_bws.disconnect()
+        self.watchdog.watch('production', self.symbol)
+
+    def health(self) -> dict:
+        """
+        Health report for the health server, safe to call from any thread
+        """
+        snapshot = self.state.snapshot()
+        feed_ages = self.watchdog.ages()
+        stale_feeds = [feed for feed, age in feed_ages.items() if age > self.watchdog.stale_after]
+        return {
+            'alive': self.keep_alive,
+            'ready': self.keep_alive and self.ready and not stale_feeds,
+            'feeds': {f"{stream}:{symbol}": {'age': age, 'stale': (stream, symbol) in stale_feeds} for (stream, symbol), age in feed_ages.items()},
+            'open_orders': {side: len(orders) for side, orders in snapshot.open_orders.items()},
+            'rest': {
+                'requests': self.rest_client.request_count,
+                'errors': self.rest_client.error_count,
+                'recent_error_rate': self.rest_client.recent_error_rate(),
+            },
+            'order_entry': self.order_entry_summary(),
+            'market': self._market_summary(),
+            'tracing': self.tracer.summary() if self.tracer else None,
+            'filters': self.symbol_filters.summary() if self.symbol_filters else None,
+            'inventory': self.inventory.summary(),
+            'websocket': self._websocket_summary(),
+        }
+
+    def _websocket_summary(self):
+        connections = [self.bws] + list(self.uws) if self.bws else list(self.uws)
+        if isinstance(self.order_gateway, WebsocketApiOrderGateway):
+            connections.append(self.order_gateway.ws_api_client)
+
+        summary = {}
+        for connection in connections:
+            summary.update(connection.connection_stats())
+        return summary
+
+    def _market_summary(self):
+        if not self.market_stats:
+            return None
+        return {
+            'volatility': self.market_stats.volatility(),
+            'trade_rate': self.market_stats.trade_rate(),
+            'vwap': self.market_stats.vwap(),
+            'distance_from_mid_price': str(self._distance_from_mid_price()),
+        }
+
+    def _record_last_price(self, price: str):
+        self.state.set_production_last_price(price)
 
     def _timeout(self, seconds):
-        sleep(seconds)
+        self.clock.sleep(seconds)
 
     def _get_asset_filters(self):
         exchange_info = self.rest_client.request("getExchangeInfo")
 
         for asset in exchange_info["symbols"]:
-            for f in asset['filters']:
-                if f['filterType'] == 'LOT_SIZE':
-                    self.base_asset_precision[asset["symbol"]] = f['stepSize'].find('1') - 1
+            if asset["symbol"] == self.symbol:
+                self.symbol_filters = SymbolFilters(asset)
+
+    def _min_notional(self) -> Decimal:
+        """
+        From the MIN_NOTIONAL or NOTIONAL filter, 0 if the symbol has neither
+        """
+        return self.symbol_filters.min_notional or Decimal('0')
 
-                if f['filterType'] == 'PRICE_FILTER':
-                    self.price_precision[asset["symbol"]] = f['tickSize'].find('1') - 1
+    def _refresh_avg_price(self):
+        """
+        PERCENT_PRICE bands are relative to the testnet average price, refreshed every AVG_PRICE_REFRESH_INTERVAL seconds at most
+        """
+        if not self.symbol_filters or not self.symbol_filters.has_price_band:
+            return
+        if self.avg_price_refreshed_at is not None and self.clock.monotonic() - self.avg_price_refreshed_at < self.AVG_PRICE_REFRESH_INTERVAL:
+            return
 
-                if f['filterType'] == 'MIN_NOTIONAL':
-                    self.min_notional[asset["symbol"]] = f['minNotional']
+        res = self.rest_client.request("getAvgPrice", {"symbol": self.symbol})
+        self.symbol_filters.reference_price = Decimal(res['price'])
+        self.avg_price_refreshed_at = self.clock.monotonic()
 
     def _get_balances(self, base_asset="BTC", quote_asset="BUSD") -> tuple[str, str]:
-        res = self.rest_client.request("getAccount")
+        rest_client = self.rest_client
+        if self.account_pool:
+            # orders can only spend the balances of the account placing them: pick it for this requote and size from its balances
+            rest_client = self.account_pool.client_for(self.symbol)
+            if isinstance(self.order_gateway, PooledRestOrderGateway):
+                self.order_gateway.pin(self.symbol, rest_client)
+
+        res = rest_client.request("getAccount")
 
         balances = {}
         for balance in res['balances']:
@@ -103,34 +428,29 @@ class TestnetMM:
         return (balances[base_asset], balances[quote_asset])
 
     def _track_orders(self, order_details):
-        side = 'bids' if order_details['side'] == 'BUY' else 'asks'
-        TestnetMMState.PAST_ORDERS.append(order_details)
-        TestnetMMState.OPEN_ORDERS[side].append(order_details)
-        logger.update('past_orders', order_details)
-        logger.update('open_orders', TestnetMMState.OPEN_ORDERS)
-        logger.update('info', f"Placed bid order for {order_details['symbol']} {order_details['origQty']} at {order_details['price']}")
+        self.state.track_order(order_details)
+        self.logger.update('past_orders', order_details)
+        self.logger.update('info', f"Placed bid order for {order_details['symbol']} {order_details['origQty']} at {order_details['price']}")
 
     def _truncate_quantity(self, quantity: Decimal) -> str:
         """
-        Fix number of decimal places as per Binance filters
+        Rounds down to the LOT_SIZE step
         """
-        factor = 10 ** self.base_asset_precision[self.symbol]
-        return '{:f}'.format(math.floor(quantity * factor) / factor)
+        return self.symbol_filters.floor_quantity(Decimal(quantity))
 
     def _truncate_price(self, price: Decimal) -> str:
         """
-        Fix number of decimal places as per Binance filters
+        Rounds down to the PRICE_FILTER tick
         """
-        factor = 10 ** self.price_precision[self.symbol]
-        return '{:f}'.format(math.floor(price * factor) / factor)
+        return self.symbol_filters.floor_price(Decimal(price))
 
     def _cancel_open_orders(self):
         try:
-            self.rest_client.request("deleteOpenOrders", {
-                "symbol": self.symbol,
-            })
-            TestnetMMState.clear_open_orders()
-            logger.update('info', "Cancelled open orders")
+            self.order_gateway.cancel_open_orders(self.symbol)
+            self.state.clear_open_orders()
+            if self.depth_mirror:
+                self.depth_mirror.clear()
+            self.logger.update('info', "Cancelled open orders")
             # add a small timeout for new balance to be reflected
             self._timeout(1)
 
@@ -142,215 +462,434 @@ class TestnetMM:
 
             raise err
 
-    def _place_bid(self, qty: str, price: str):
-        res = self.rest_client.request("postOrder", {
-            "symbol": self.symbol,
-            "side": "BUY",
-            "type": "LIMIT",
-            "timeInForce": "GTC",
-            "quantity": qty,
-            "price": price
-        })
-
-        if not res['orderId']:
-            raise TestnetMMOrderFailedException
+    def _cancel_order(self, order_id):
+        try:
+            self.order_gateway.cancel_order(self.symbol, order_id)
+        except BinanceRestException as err:
+            # order already filled or cancelled
+            if err.code != -2011:
+                raise err
 
-        order_details = {
-            'orderId': res['orderId'],
-            'clientOrderId': res['clientOrderId'],
-            'transactTime': res['transactTime'],
-            'status': res['status'],
-            'symbol': res['symbol'],
-            'side': res['side'],
-            'type': res['type'],
-            'price': res['price'],
-            'origQty': res['origQty'],
-            'executedQty': res['executedQty'],
-        }
+        self.state.remove_open_order(order_id)
 
-        self._track_orders(order_details)
+    def _place_order(self, side: str, qty: str, price: str):
+        """
+        In ACK mode the exchange only confirms the order id, the order is tracked as PENDING_NEW
+        and finalized by its NEW executionReport. Execution reports are handled on the engine thread
+        after this returns, so the order is always tracked before its first report is applied
+        Orders are checked against the symbol filters first, returns None for an order the exchange would reject
+        """
+        if self.symbol_filters:
+            try:
+                open_orders = len(self.state.open_orders['bids']) + len(self.state.open_orders['asks'])
+                qty, price = self.symbol_filters.validate(side, qty, price, open_orders=open_orders)
+            except TestnetMMOrderRejectedException as err:
+                self.logger.update('info', f"Skipped {side} {qty} at {price}, {err}")
+                return None
 
-    def _place_ask(self, qty: str, price: str):
-        res = self.rest_client.request("postOrder", {
+        params = {
             "symbol": self.symbol,
-            "side": "SELL",
+            "side": side,
             "type": "LIMIT",
             "timeInForce": "GTC",
             "quantity": qty,
             "price": price
-        })
+        }
+        if self.order_response_type == "ACK":
+            params["newOrderRespType"] = "ACK"
+        if self.tracer and self.tracer.current:
+            params["newClientOrderId"] = self.tracer.client_order_id()
+
+        sent_at = perf_counter()
+        res = self.order_gateway.place_order(params)
+        if self.tracer:
+            self.tracer.order_sent(res.get('clientOrderId'), sent_at, perf_counter())
 
         if not res['orderId']:
             raise TestnetMMOrderFailedException
 
-        order_details = {
-            'orderId': res['orderId'],
-            'clientOrderId': res['clientOrderId'],
-            'transactTime': res['transactTime'],
-            'status': res['status'],
-            'symbol': res['symbol'],
-            'side': res['side'],
-            'type': res['type'],
-            'price': res['price'],
-            'origQty': res['origQty'],
-            'executedQty': res['executedQty'],
-        }
-
+        if self.order_response_type == "ACK":
+            order_details = {
+                'orderId': res['orderId'],
+                'clientOrderId': res['clientOrderId'],
+                'transactTime': res['transactTime'],
+                'status': 'PENDING_NEW',
+                'symbol': res['symbol'],
+                'side': side,
+                'type': params['type'],
+                'price': price,
+                'origQty': qty,
+                'executedQty': '0',
+            }
+        else:
+            order_details = {
+                'orderId': res['orderId'],
+                'clientOrderId': res['clientOrderId'],
+                'transactTime': res['transactTime'],
+                'status': res['status'],
+                'symbol': res['symbol'],
+                'side': res['side'],
+                'type': res['type'],
+                'price': res['price'],
+                'origQty': res['origQty'],
+                'executedQty': res['executedQty'],
+            }
+
+        self._record_order_entry(res, sent_at)
         self._track_orders(order_details)
+        if self.journal:
+            self.journal.record_order(order_details, self.state.production_last_price)
+        return order_details
 
-    def _buy_base_asset(self, quote_asset_available: str):
-        """
-        Buy base asset with quote asset
-        Warning: Hardcoded a ratio of 1/2 base and 1/2 quote asset
-        For a symbol like BTCBUSD, BTC is the base asset and BUSD is the quote asset
-        """
-        bid_price = Decimal(TestnetMMState.PRODUCTION_LAST_PRICE) * (Decimal('1') - Decimal(self.distance_from_mid_price))
-        bid_quantity = (Decimal(quote_asset_available) / Decimal('2')) / bid_price
-        self._place_bid(self._truncate_quantity(bid_quantity), self._truncate_price(bid_price))
+    def _place_bid(self, qty: str, price: str):
+        return self._place_order("BUY", qty, price)
+
+    def _place_ask(self, qty: str, price: str):
+        return self._place_order("SELL", qty, price)
+
+    def _record_order_entry(self, res, sent_at):
+        # response size as re-serialized compact JSON, close to the wire size and comparable across gateways
+        self.order_entry_stats[res['orderId']] = {
+            'responseType': self.order_response_type,
+            'sentAt': sent_at,
+            'responseMs': (perf_counter() - sent_at) * 1000,
+            'responseBytes': len(json.dumps(res, separators=(',', ':'))),
+            'ackLatencyMs': None,
+        }
+        while len(self.order_entry_stats) > self.ORDER_ENTRY_STATS_TO_KEEP:
+            self.order_entry_stats.pop(next(iter(self.order_entry_stats)))
 
-    def _buy_quote_asset(self, base_asset_available):
+    def _record_ack_latency(self, msg):
         """
-        Sells base asset for quote asset
-        Warning: Hardcoded a ratio of 1/2 base and 1/2 quote asset
-        For a symbol like BTCBUSD, BTC is the base asset and BUSD is the quote asset
+        Time from sending the order to its NEW executionReport arriving on the user stream
         """
-        ask_price = Decimal(TestnetMMState.PRODUCTION_LAST_PRICE) * (Decimal('1') + Decimal(self.distance_from_mid_price))
-        ask_quantity = Decimal(base_asset_available) / Decimal('2')
-        self._place_ask(self._truncate_quantity(ask_quantity), self._truncate_price(ask_price))
+        stats = self.order_entry_stats.get(msg['i'])
+        if stats is not None and stats['ackLatencyMs'] is None:
+            stats['ackLatencyMs'] = (perf_counter() - stats['sentAt']) * 1000
+
+    def order_entry_summary(self) -> dict:
+        stats = list(self.order_entry_stats.values())
+        acked = [s['ackLatencyMs'] for s in stats if s['ackLatencyMs'] is not None]
+        return {
+            'responseType': self.order_response_type,
+            'orders': len(stats),
+            'avgResponseMs': sum(s['responseMs'] for s in stats) / len(stats) if stats else None,
+            'avgResponseBytes': sum(s['responseBytes'] for s in stats) / len(stats) if stats else None,
+            'avgAckLatencyMs': sum(acked) / len(acked) if acked else None,
+        }
+
+    def _distance_from_mid_price(self) -> Decimal:
+        if self.spread_policy:
+            return self.spread_policy.distance(self.market_stats)
+        return Decimal(self.distance_from_mid_price)
 
     def _provide_liquidity(self, base_asset_available, quote_asset_available):
         """
-        Places 2 limit bid and ask orders of equivalent size in testnet, at prices `distance_from_mid_price` away from the last price on production
+        Places a limit bid and ask in testnet around the last price on production, `distance_from_mid_price` away
+        and skewed by the inventory manager toward the target inventory.
+        A side the balances can't fund above min notional is left out, the other side rebalances the inventory.
+        Raises TestnetMMInsufficientFundsException when neither side can be funded, requoting wouldn't change that
         """
-        bid_price = Decimal(TestnetMMState.PRODUCTION_LAST_PRICE) * (Decimal('1') - Decimal(self.distance_from_mid_price))
-        ask_price = Decimal(TestnetMMState.PRODUCTION_LAST_PRICE) * (Decimal('1') + Decimal(self.distance_from_mid_price))
+        self.quoted_distance = self._distance_from_mid_price()
+        (bid_qty, bid_price), (ask_qty, ask_price) = self.inventory.quotes(
+            base_asset_available,
+            quote_asset_available,
+            Decimal(self.state.production_last_price),
+            self.quoted_distance
+        )
 
-        """
-        If base-quote asset ratio isn't 50:50, order_qty should be minimum of what is available to sell or buy to have an order size of equal base value
-        """
-        max_quantity_to_sell = Decimal(base_asset_available)
-        max_quantity_to_buy = Decimal(quote_asset_available) / bid_price
-        order_qty = min(max_quantity_to_sell, max_quantity_to_buy)
+        quotes = []
+        for side, qty, price, place in (('bids', bid_qty, bid_price, self._place_bid), ('asks', ask_qty, ask_price, self._place_ask)):
+            truncated_qty, truncated_price = self._truncate_quantity(qty), self._truncate_price(price)
+            if Decimal(truncated_qty) * Decimal(truncated_price) <= self._min_notional():
+                self.logger.update('info', f"Not quoting {side}, inventory imbalance {self.inventory.imbalance:.2f}")
+                continue
+            quotes.append((side, truncated_qty, truncated_price, place))
 
-        truncated_order_qty = self._truncate_quantity(order_qty)
-        self._place_bid(truncated_order_qty, self._truncate_price(bid_price))
-        self._place_ask(truncated_order_qty, self._truncate_price(ask_price))
+        if not quotes:
+            raise TestnetMMInsufficientFundsException(f"Neither side of {self.symbol} clears min notional {self._min_notional()}")
+
+        self.quoted_sides = set()
+        for side, qty, price, place in quotes:
+            if place(qty, price) is not None:
+                self.quoted_sides.add(side)
 
     def _has_no_open_orders(self):
-        return len(TestnetMMState.OPEN_ORDERS['bids']) == 0 and len(TestnetMMState.OPEN_ORDERS['asks']) == 0
+        return len(self.state.open_orders['bids']) == 0 and len(self.state.open_orders['asks']) == 0
+
+    def _has_missing_quotes(self):
+        """
+        A quoted side with no open orders left was filled or cancelled. Sides left out for lack of inventory don't count
+        """
+        return any(len(self.state.open_orders[side]) == 0 for side in self.quoted_sides)
 
     def _has_open_orders_and_production_price_reached(self):
-        return (len(TestnetMMState.OPEN_ORDERS['bids']) > 0 and float(TestnetMMState.PRODUCTION_LAST_PRICE) <= float(TestnetMMState.OPEN_ORDERS['bids'][0]['price'])) or (len(TestnetMMState.OPEN_ORDERS['asks']) > 0 and float(TestnetMMState.PRODUCTION_LAST_PRICE) >= float(TestnetMMState.OPEN_ORDERS['asks'][0]['price']))
+        return (len(self.state.open_orders['bids']) > 0 and float(self.state.production_last_price) <= float(self.state.open_orders['bids'][0]['price'])) or (len(self.state.open_orders['asks']) > 0 and float(self.state.production_last_price) >= float(self.state.open_orders['asks'][0]['price']))
+
+    def _has_quotes_off_target(self):
+        if self._has_no_open_orders() or self.quoted_distance is None:
+            return False
+        if self.spread_policy is not None:
+            return self.spread_policy.should_requote(self.quoted_distance, self.market_stats)
+        return self.quoted_distance != Decimal(self.distance_from_mid_price)
 
     def _has_sufficient_base_asset(self, base_asset_qty):
-        return float(Decimal(base_asset_qty) * Decimal(TestnetMMState.PRODUCTION_LAST_PRICE)) > float(self.min_notional[self.symbol])
+        return Decimal(base_asset_qty) * Decimal(self.state.production_last_price) > self._min_notional()
 
     def _has_sufficient_quote_asset(self, quote_asset_qty):
-        return float(quote_asset_qty) > float(self.min_notional[self.symbol])
+        return Decimal(quote_asset_qty) > self._min_notional()
 
     def _place_trade(self):
-        self._cancel_open_orders()
+        with self._trace_stage('cancel'):
+            self._cancel_open_orders()
+        self._refresh_avg_price()
 
-        base_asset_qty, quote_asset_qty = self._get_balances(base_asset=self.base_asset, quote_asset=self.quote_asset)
+        with self._trace_stage('balances'):
+            base_asset_qty, quote_asset_qty = self._get_balances(base_asset=self.base_asset, quote_asset=self.quote_asset)
+        self.state.set_balances({self.base_asset: base_asset_qty, self.quote_asset: quote_asset_qty})
 
         if not self._has_sufficient_base_asset(base_asset_qty) and not self._has_sufficient_quote_asset(quote_asset_qty):
             raise TestnetMMInsufficientFundsException(f"Insufficient {self.base_asset} and {self.quote_asset}")
 
-        if self._has_sufficient_quote_asset(quote_asset_qty) and not self._has_sufficient_base_asset(base_asset_qty):
-            logger.update('info', 'No base asset, buying base asset')
-            self._buy_base_asset(quote_asset_available=quote_asset_qty)
-
-        elif self._has_sufficient_base_asset(base_asset_qty) and not self._has_sufficient_quote_asset(quote_asset_qty):
-            logger.update('info', 'No quote asset, selling base asset')
-            self._buy_quote_asset(base_asset_available=base_asset_qty)
-
-        else:
-            self._provide_liquidity(base_asset_available=base_asset_qty, quote_asset_available=quote_asset_qty)
+        self._provide_liquidity(base_asset_available=base_asset_qty, quote_asset_available=quote_asset_qty)
 
     def _terminate_if_error(func):
+        """
+        Transient exchange errors (retries exhausted, rate limited or circuit open) skip this requote,
+        the next tick tries again. Anything else ends the bot
+        """
         def execute(self):
             try:
                 return func(self)
             except Exception as err:
-                self.terminate()
-                logger.update('debug', traceback.format_exc())
-                raise err
+                if is_transient(err):
+                    self.logger.update('info', f"Skipped requote after transient error: {err}")
+                    return False
 
-        return execute
-
-    def _prevent_multiple_trades_at_once(func):
-        def execute(self):
-            self.in_process = self.in_process if hasattr(self, "in_process") else False
-            if self.in_process:
-                return
-
-            self.in_process = True
-            try:
-                return func(self)
-            except Exception as err:
+                self.terminate()
+                self.logger.update('debug', traceback.format_exc())
                 raise err
-            finally:
-                self.in_process = False
 
         return execute
 
     @_terminate_if_error
-    @_prevent_multiple_trades_at_once
     def _trade(self) -> bool:
         # don't trade if price is not updated
-        if float(TestnetMMState.PRODUCTION_LAST_PRICE) <= 0:
+        if float(self.state.production_last_price) <= 0:
             return False
 
         if self._has_no_open_orders() or \
-           self._has_open_orders_and_production_price_reached():
+           self._has_missing_quotes() or \
+           self._has_open_orders_and_production_price_reached() or \
+           self._has_quotes_off_target():
             self._place_trade()
 
+    @_terminate_if_error
+    def _mirror_depth(self):
+        """
+        Requotes testnet levels whose production counterpart appeared, disappeared or changed size meaningfully
+        """
+        if not self.depth_mirror.book.synced or not self.depth_mirror.due():
+            return
+
+        mid_price = self.depth_mirror.book.mid_price()
+        if mid_price is None:
+            return
+        self._record_last_price(str(mid_price))
+        self.logger.update('production_last_price', str(mid_price))
+
+        to_cancel, to_place = self.depth_mirror.plan()
+
+        for order in to_cancel:
+            self._cancel_order(order['orderId'])
+            self.depth_mirror.record_cancelled(order)
+
+        for side, price, qty in to_place:
+            truncated_qty, truncated_price = self._truncate_quantity(qty), self._truncate_price(price)
+            if Decimal(truncated_qty) * Decimal(truncated_price) <= self._min_notional():
+                continue
+
+            try:
+                place = self._place_bid if side == 'BUY' else self._place_ask
+                order_details = place(truncated_qty, truncated_price)
+            except BinanceRestException as err:
+                # -2010 new order rejected, usually insufficient balance for this level
+                if err.code != -2010:
+                    raise err
+                self.logger.update('info', f"Unable to mirror {side} {truncated_qty} at {truncated_price}: {err.details['msg']}")
+                continue
+            if order_details is None:
+                continue
+
+            self.depth_mirror.record_placed(side, price, qty, order_details['orderId'])
+
     # Stream related Methods
-    def _get_listen_key(self):
-        res = self.rest_client.request("postUserDataStream")
+    def _user_stream_clients(self):
+        return list(self.account_pool.clients) if self.account_pool else [self.rest_client]
+
+    def _get_listen_key(self, rest_client=None):
+        rest_client = rest_client or self.rest_client
+        res = rest_client.request("postUserDataStream")
         self.listen_key = res["listenKey"]
+        self.listen_keys[rest_client] = self.listen_key
+        return self.listen_key
 
     def _keep_listen_key_alive(self):
-        self.last_keep_listen_key_alive_at = datetime.now()
-        self.rest_client.request("putUserDataStream", {"listenKey": self.listen_key})
+        self.last_keep_listen_key_alive_at = self.clock.monotonic()
+        for rest_client, listen_key in self.listen_keys.items():
+            rest_client.request("putUserDataStream", {"listenKey": listen_key})
 
     def _connect_to_testnet_user_stream(self):
-        self._get_listen_key()
-
-        bws = BinanceWebsocketClient(
-            name="testnet",
-            ws_base_url=f"{self.testnet_ws_base_url}/{self.listen_key}",
-            topics=[],
-            message_handler=self._message_handler,
-            close_handler=self._close_handler)
-        bws.connect()
-        return bws
+        """
+        One user data stream per account, all merged into the engine's event queue
+        """
+        streams = []
+        for i, rest_client in enumerate(self._user_stream_clients()):
+            listen_key = self._get_listen_key(rest_client)
+
+            bws = BinanceWebsocketClient(
+                name="testnet" if i == 0 else f"testnet account {i}",
+                ws_base_url=f"{self.testnet_ws_base_url}/{listen_key}",
+                topics=[],
+                message_handler=self.events.put,
+                close_handler=lambda: self.submit(self._close_handler),
+                transport=self.websocket_transport)
+            bws.connect()
+            streams.append(bws)
+        return streams
 
     def _connect_to_production_trade_stream(self):
-        bws = BinanceWebsocketClient(
-            name="production",
-            ws_base_url=self.production_ws_base_url,
-            topics=[BinanceWebsocketClient.agg_trade(self.symbol)],
-            message_handler=self._message_handler,
-            close_handler=self._close_handler)
+        if self.price_bus and not self.depth_mirror:
+            bws = PriceBusReader(self.price_bus, self.symbol, message_handler=self._on_production_message)
+            bws.connect()
+            return bws
+
+        topics = [BinanceWebsocketClient.diff_depth(self.symbol)] if self.depth_mirror else self.price_source.topics(self.symbol)
+        # adaptive spreads need production trades whatever the price source
+        if self.market_stats and BinanceWebsocketClient.agg_trade(self.symbol) not in topics:
+            topics = topics + [BinanceWebsocketClient.agg_trade(self.symbol)]
+
+        if self.production_ws_base_urls:
+            bws = BinanceMultiEndpointWebsocketClient(
+                name="production",
+                ws_base_urls=self.production_ws_base_urls,
+                topics=topics,
+                message_handler=self._on_production_message,
+                close_handler=lambda: self.submit(lambda: self._on_production_stream_closed(bws)),
+                transport=self.websocket_transport,
+                clock=self.clock.monotonic)
+        else:
+            bws = BinanceWebsocketClient(
+                name="production",
+                ws_base_url=self.production_ws_base_url,
+                topics=topics,
+                message_handler=self._on_production_message,
+                close_handler=lambda: self.submit(lambda: self._on_production_stream_closed(bws)),
+                with_receive_time=self.tracer is not None,
+                transport=self.websocket_transport)
         bws.connect()
         return bws
 
+    def _on_production_message(self, msg, received_at=None):
+        """
+        Runs on websocket threads. Without tracing, messages go to the engine's queue as they are
+        """
+        if self.tracer is None:
+            self.events.put(msg)
+        else:
+            self.events.put(partial(self._on_traced_message, msg, received_at, perf_counter()))
+
+    def _on_traced_message(self, msg, received_at, decoded_at):
+        trace = self.tracer.begin()
+        # racing endpoints don't report receive times
+        if received_at is not None:
+            trace.span('decode', received_at, decoded_at)
+        trace.span('queue', decoded_at, trace.started_at)
+        try:
+            self._message_handler(msg)
+        finally:
+            self.tracer.end()
+
+    def _trace_stage(self, name):
+        return self.tracer.stage(name) if self.tracer else nullcontext()
+
     def _message_handler(self, msg):
-        if 'e' in msg and msg['e'] == 'aggTrade':
+        if self.market_stats and msg.get('e') == 'aggTrade':
+            self.market_stats.update(msg['p'], msg['q'], msg['T'] / 1000)
+            if not self.price_source.handles(msg):
+                self.watchdog.record('production', self.symbol)
+                return
+
+        if self.price_source.handles(msg):
             """
-            From aggTrade subscription
-            https://binance-docs.github.io/apidocs/spot/en/#aggregate-trade-streams
+            From the production price subscription, aggTrade or bookTicker
+            Conflated updates return no price and do not trigger a requote
             """
-            self._record_last_price(msg['p'])
-            logger.update('production_last_price', msg['p'])
-            self._trade()
+            self.watchdog.record('production', self.symbol)
+            price = self.price_source.on_message(msg)
+            if price is None:
+                return
+
+            self._on_reference_price(price)
+        elif 'e' in msg and msg['e'] == 'depthUpdate' and self.depth_mirror:
+            """
+            From diff depth subscription
+            https://binance-docs.github.io/apidocs/spot/en/#diff-depth-stream
+            """
+            self.watchdog.record('production', self.symbol)
+            if self.depth_mirror.on_depth_update(msg):
+                self._mirror_depth()
         elif 'e' in msg and msg['e'] == 'executionReport':
-            logger.update('debug', msg)
-            TestnetMMState.update_order_state(msg)
+            self.logger.update('debug', msg)
+            self._on_execution_report(msg)
         else:
-            logger.update('debug', f"Unhandled ws message: {msg}")
+            self.logger.update('debug', f"Unhandled ws message: {msg}")
+
+    def _on_execution_report(self, msg):
+        """
+        Requotes as soon as one of our orders is done instead of waiting for the production price to cross it.
+        The user data stream carries every symbol of the account, engines sharing a key skip each other's reports
+        """
+        if msg['s'] != self.symbol:
+            return
+        if msg['x'] == 'NEW':
+            self._record_ack_latency(msg)
+        if self.tracer:
+            self.tracer.on_execution_report(msg['c'])
+
+        finished_order = self.state.update_order_state(msg)
+        if msg['x'] == 'TRADE' and self.journal:
+            self.journal.record_fill(self.state.fills[-1], self.state.production_last_price)
+
+        if finished_order is None:
+            return
+
+        if self.depth_mirror:
+            self.depth_mirror.forget_order(finished_order['orderId'])
+            self._mirror_depth()
+        else:
+            self._trade()
+
+    def _on_production_stream_closed(self, bws):
+        # connections retired by a reconnect are expected to close
+        if bws is getattr(self, 'bws', bws):
+            self._close_handler()
+
+    def _on_order_gateway_closed(self):
+        """
+        The ws-api connection dropped: reconnect now rather than on the next order.
+        Resting orders stay live and are requoted by the next tick
+        """
+        if not self.keep_alive:
+            return
+
+        self.logger.update('info', "Order gateway connection lost, reconnecting")
+        try:
+            self.order_gateway.connect()
+        except BinanceWebsocketApiConnectionException as err:
+            # the next order request tries again
+            self.logger.update('info', f"Order gateway reconnect failed: {err}")
 
     def _close_handler(self):
         self.terminate()
-        logger.update("info", "WS Connection closed")
+        self.logger.update("info", "WS Connection closed")
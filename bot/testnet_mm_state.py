@@ -1,37 +1,166 @@
-from bot.logger import logger
+from collections import deque
+from types import MappingProxyType
+from typing import NamedTuple
+from bot.logger import get_logger
+
+
+class TestnetMMStateSnapshot(NamedTuple):
+    """
+    Immutable view of TestnetMMState, safe to read from any thread
+    """
+    production_last_price: str
+    open_orders: MappingProxyType
+    past_orders: tuple
+    fills: tuple
+    order_count: int
+    fill_count: int
+    balances: MappingProxyType
 
 
 class TestnetMMState:
-    PRODUCTION_LAST_PRICE = '0'
-    PAST_ORDERS = []
-    OPEN_ORDERS = {
-        'bids': [],
-        'asks': []
-    }
-
-    @staticmethod
-    def clear_open_orders():
-        TestnetMMState.OPEN_ORDERS = {
+    """
+    Engine state of one TestnetMM instance.
+
+    Only the engine thread mutates it, other threads hand their updates to the engine's event queue.
+    Every mutation publishes a new snapshot, readers such as the logger only ever see `snapshot()`,
+    which is a single attribute read and needs no lock.
+    Mutations rebuild only the fields they change, the others are shared with the previous snapshot.
+    Snapshot past orders are frozen as placed, their later status lives in open orders and fills
+    """
+    # https://binance-docs.github.io/apidocs/spot/en/#enum-definitions
+    TERMINAL_ORDER_STATUSES = ('FILLED', 'CANCELED', 'REJECTED', 'EXPIRED', 'EXPIRED_IN_MATCH')
+    # number of past orders and fills kept and included in snapshots, the journal keeps them all
+    SNAPSHOT_HISTORY = 100
+
+    def __init__(self, logger=None):
+        self.logger = logger or get_logger()
+        self.production_last_price = '0'
+        self.balances = {}
+        self.past_orders = deque(maxlen=self.SNAPSHOT_HISTORY)
+        self.fills = deque(maxlen=self.SNAPSHOT_HISTORY)
+        self.order_count = 0
+        self.fill_count = 0
+        self.open_orders = {
+            'bids': [],
+            'asks': []
+        }
+        self._publish()
+
+    def snapshot(self) -> TestnetMMStateSnapshot:
+        return self._snapshot
+
+    def _publish(self):
+        self._snapshot = TestnetMMStateSnapshot(
+            production_last_price=self.production_last_price,
+            open_orders=self._frozen_open_orders(),
+            past_orders=tuple(MappingProxyType(dict(order)) for order in self.past_orders),
+            fills=tuple(MappingProxyType(dict(fill)) for fill in self.fills),
+            order_count=self.order_count,
+            fill_count=self.fill_count,
+            balances=MappingProxyType(dict(self.balances))
+        )
+
+    def _frozen_open_orders(self) -> MappingProxyType:
+        return MappingProxyType({
+            side: tuple(MappingProxyType(dict(order)) for order in orders)
+            for side, orders in self.open_orders.items()
+        })
+
+    def _appended(self, history: tuple, entry: dict) -> tuple:
+        return (history + (MappingProxyType(dict(entry)),))[-self.SNAPSHOT_HISTORY:]
+
+    def _publish_open_orders(self, **changes):
+        self._snapshot = self._snapshot._replace(open_orders=self._frozen_open_orders(), **changes)
+        self.logger.update('open_orders', self._snapshot.open_orders)
+
+    def set_production_last_price(self, price: str):
+        self.production_last_price = price
+        self._snapshot = self._snapshot._replace(production_last_price=price)
+
+    def set_balances(self, balances: dict):
+        """
+        Free balances by asset, as of the latest requote
+        """
+        self.balances = balances
+        self._snapshot = self._snapshot._replace(balances=MappingProxyType(dict(balances)))
+
+    def track_order(self, order_details):
+        side = 'bids' if order_details['side'] == 'BUY' else 'asks'
+        self.past_orders.append(order_details)
+        self.order_count += 1
+        # marketable orders can be done by the time the response arrives
+        if order_details['status'] not in self.TERMINAL_ORDER_STATUSES:
+            self.open_orders[side].append(order_details)
+        self._publish_open_orders(
+            past_orders=self._appended(self._snapshot.past_orders, order_details),
+            order_count=self.order_count
+        )
+
+    def clear_open_orders(self):
+        self.open_orders = {
             'bids': [],
             'asks': []
         }
-        logger.update('open_orders', TestnetMMState.OPEN_ORDERS)
+        self._publish_open_orders()
+
+    def remove_open_order(self, order_id):
+        for side in ('bids', 'asks'):
+            self.open_orders[side] = [
+                order for order in self.open_orders[side] if order['orderId'] != order_id
+            ]
+        self._publish_open_orders()
+
+    def update_order_state(self, payload):
+        """
+        Applies an executionReport to the tracked order
+        https://binance-docs.github.io/apidocs/spot/en/#payload-order-update
 
-    @staticmethod
-    def update_order_state(payload):
-        # https://binance-docs.github.io/apidocs/spot/en/#payload-order-update
+        Every execution type updates status and executed quantity, TRADE also records the fill.
+        Orders reaching a terminal status are removed from open orders right away.
+        Returns the tracked order if it reached a terminal status, otherwise None
+        """
         action = {
             'BUY': 'bids',
             'SELL': 'asks'
         }
+        side = action[payload['S']]
 
+        order = next((o for o in self.open_orders[side] if o['orderId'] == payload["i"]), None)
+
+        changes = {}
         if payload["x"] == "TRADE":
-            for order in TestnetMMState.OPEN_ORDERS[action[payload['S']]]:
-                if order['orderId'] == payload["i"]:
-                    order['executedQty'] = payload["z"]
-                    order['status'] = payload["X"]
-
-            logger.update(
-                'info',
-                f'Order {payload["i"]} updates: executedQty {payload["z"]}; status: {payload["X"]}')
-            logger.update('open_orders', TestnetMMState.OPEN_ORDERS)
+            self.fills.append({
+                'orderId': payload["i"],
+                'clientOrderId': payload["c"],
+                'symbol': payload["s"],
+                'side': payload["S"],
+                'price': payload["L"],
+                'qty': payload["l"],
+                'quoteQty': payload["Y"],
+                'commission': payload["n"],
+                'commissionAsset': payload["N"],
+                'tradeId': payload["t"],
+                'isMaker': payload["m"],
+                'time': payload["T"],
+            })
+            self.fill_count += 1
+            changes = {'fills': self._appended(self._snapshot.fills, self.fills[-1]), 'fill_count': self.fill_count}
+
+        if order is None:
+            self._snapshot = self._snapshot._replace(**changes)
+            return None
+
+        order['executedQty'] = payload["z"]
+        order['status'] = payload["X"]
+
+        self.logger.update(
+            'info',
+            f'Order {payload["i"]} {payload["x"]}: executedQty {payload["z"]}; status: {payload["X"]}')
+
+        if payload["X"] in self.TERMINAL_ORDER_STATUSES:
+            self.open_orders[side].remove(order)
+            self._publish_open_orders(**changes)
+            return order
+
+        self._publish_open_orders(**changes)
+        return None
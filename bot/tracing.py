@@ -0,0 +1,178 @@
+import json
+import math
+import os
+import threading
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from time import perf_counter
+
+
+class Trace:
+    """
+    Spans of one production tick that led to orders, in perf_counter seconds
+    """
+    def __init__(self, trace_id, started_at):
+        self.trace_id = trace_id
+        self.started_at = started_at
+        self.spans = []
+        self.pending_orders = {}
+        self.order_count = 0
+        self.decided_at = None
+
+    def span(self, name, started_at, ended_at, **args):
+        self.spans.append((name, started_at, ended_at, args))
+
+
+class TickTracer:
+    """
+    Traces production ticks through to the exchange's executionReports.
+
+    The engine thread `begin`s a trace per tick and `end`s it once the tick is handled. Ticks without orders are dropped.
+    Orders placed while a trace is current get a newClientOrderId carrying the trace id, executionReports are matched
+    back to the trace by it. A trace is finished once every order got its first executionReport, or after `timeout` seconds.
+
+    Stages: decode (websocket thread), queue (waiting for the engine thread), decide (tick to the first exchange request),
+    cancel (cancelling open orders, including the wait for balances to settle), balances (fetching the account),
+    sign and http of order requests (BinanceClient), ack (order request to response) and executionReport (order request to its first report).
+    Finished traces are appended to `path` in the Chrome trace event format, readable by chrome://tracing and Perfetto
+    https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU
+    """
+    STAGES = ('decode', 'queue', 'decide', 'cancel', 'balances', 'sign', 'http', 'ack', 'executionReport')
+    # requests whose sign and http spans are traced, the others are covered by their own stage
+    ORDER_ENDPOINTS = ('postOrder',)
+
+    def __init__(self, path=None, timeout=10, history=10000, clock=perf_counter):
+        self.path = path
+        self.timeout = timeout
+        self.clock = clock
+        self.current = None
+        self.pending = {}
+        self.durations = {stage: deque(maxlen=history) for stage in self.STAGES}
+        self.exported = 0
+        self._thread_id = None
+        self._file = None
+        self._origin = clock()
+        # durations are read by the health server thread
+        self._lock = threading.Lock()
+
+    def begin(self, started_at=None):
+        self._thread_id = threading.get_ident()
+        self.current = Trace(uuid.uuid4().hex[:16], started_at or self.clock())
+        return self.current
+
+    def end(self):
+        trace, self.current = self.current, None
+        if trace is not None and trace.pending_orders:
+            self.pending[trace.trace_id] = trace
+        self._expire()
+
+    def record(self, name, started_at, ended_at, endpoint=None):
+        """
+        Span recorder for BinanceClient. Requests from other threads, such as time sync, are not part of the tick
+        """
+        if self.current is not None and endpoint in self.ORDER_ENDPOINTS and threading.get_ident() == self._thread_id:
+            self.current.span(name, started_at, ended_at)
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Records the enclosed block of the engine thread as a stage of the current trace, if any
+        """
+        trace = self.current
+        if trace is None:
+            yield
+            return
+        started_at = self.clock()
+        self._decided(trace, started_at)
+        try:
+            yield
+        finally:
+            trace.span(name, started_at, self.clock())
+
+    def _decided(self, trace, at):
+        if trace.decided_at is None:
+            trace.decided_at = at
+            trace.span('decide', trace.started_at, at)
+
+    def client_order_id(self):
+        """
+        newClientOrderId for the next order of the current trace, None outside a trace
+        """
+        trace = self.current
+        if trace is None:
+            return None
+        self._decided(trace, self.clock())
+        trace.order_count += 1
+        return f"tmm-{trace.trace_id}-{trace.order_count}"
+
+    def order_sent(self, client_order_id, sent_at, acked_at):
+        trace = self.current
+        if trace is None or not client_order_id or not client_order_id.startswith(f"tmm-{trace.trace_id}-"):
+            return
+        trace.span('ack', sent_at, acked_at, clientOrderId=client_order_id)
+        trace.pending_orders[client_order_id] = sent_at
+
+    def on_execution_report(self, client_order_id):
+        parts = client_order_id.split('-') if client_order_id else []
+        trace = self.pending.get(parts[1]) if len(parts) == 3 else None
+        if trace is None or client_order_id not in trace.pending_orders:
+            return
+
+        trace.span('executionReport', trace.pending_orders.pop(client_order_id), self.clock(), clientOrderId=client_order_id)
+        if not trace.pending_orders:
+            self._finish(self.pending.pop(trace.trace_id))
+
+    def _expire(self):
+        now = self.clock()
+        for trace_id in [trace_id for trace_id, trace in self.pending.items() if now - trace.started_at > self.timeout]:
+            self._finish(self.pending.pop(trace_id))
+
+    def _finish(self, trace):
+        with self._lock:
+            for name, started_at, ended_at, _ in trace.spans:
+                self.durations[name].append((ended_at - started_at) * 1000)
+        self.exported += 1
+        if self.path:
+            self._export(trace)
+
+    def _export(self, trace):
+        # JSON array format, the closing bracket is optional so events can be appended as traces finish
+        if self._file is None:
+            is_new = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+            self._file = open(self.path, "a")
+            if is_new:
+                self._file.write("[\n")
+
+        for name, started_at, ended_at, args in trace.spans:
+            self._file.write(json.dumps({
+                "name": name,
+                "cat": "tick",
+                "ph": "X",
+                "ts": round((started_at - self._origin) * 1e6, 1),
+                "dur": round((ended_at - started_at) * 1e6, 1),
+                "pid": os.getpid(),
+                "tid": trace.trace_id,
+                "args": dict(args, trace_id=trace.trace_id),
+            }) + ",\n")
+        self._file.flush()
+
+    def summary(self) -> dict:
+        """
+        Nearest-rank p50, p90 and p99 in milliseconds per stage over the latest finished traces
+        """
+        with self._lock:
+            durations = {stage: list(values) for stage, values in self.durations.items()}
+
+        summary = {}
+        for stage, values in durations.items():
+            values = sorted(values)
+            if not values:
+                continue
+            summary[stage] = {
+                'count': len(values),
+                'p50': values[math.ceil(0.5 * len(values)) - 1],
+                'p90': values[math.ceil(0.9 * len(values)) - 1],
+                'p99': values[math.ceil(0.99 * len(values)) - 1],
+            }
+        return summary
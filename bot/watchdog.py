@@ -0,0 +1,30 @@
+import time
+
+
+class FeedWatchdog:
+    """
+    Tracks the age of the last message per (stream, symbol).
+    A watched feed that has been silent for more than `stale_after` seconds is stale,
+    this catches streams that stop without a close frame
+    """
+    def __init__(self, stale_after=10, clock=time.monotonic):
+        self.stale_after = stale_after
+        self.clock = clock
+        self.last_seen = {}
+
+    def watch(self, stream, symbol):
+        """
+        Starts (or restarts) the clock for a feed, it gets a full `stale_after` before it can be reported stale
+        """
+        self.last_seen[(stream, symbol)] = self.clock()
+
+    def record(self, stream, symbol):
+        self.last_seen[(stream, symbol)] = self.clock()
+
+    def ages(self) -> dict:
+        now = self.clock()
+        # dict.copy is atomic, readers on other threads get a consistent view
+        return {feed: now - seen for feed, seen in self.last_seen.copy().items()}
+
+    def stale(self) -> list:
+        return [feed for feed, age in self.ages().items() if age > self.stale_after]
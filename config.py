@@ -4,8 +4,91 @@ import os
 class Config:
     API_KEY = os.getenv("API_KEY")
     API_SECRET = os.getenv("API_SECRET")
+    # optional pool of testnet accounts to spread order load across, as "key1:secret1,key2:secret2"
+    API_CREDENTIALS = [
+        tuple(credential.split(":", 1)) for credential in os.getenv("API_CREDENTIALS", "").split(",") if credential
+    ] or None
     BASE_ASSET = "BTC"
     QUOTE_ASSET = "BUSD"
 
+    # pairs run by supervise.py, sharded across WORKERS processes. None starts one worker per CPU core
+    SYMBOLS = [(BASE_ASSET, QUOTE_ASSET)]
+    WORKERS = None
+    # with supervise.py, one feed handler process holds the production connection and shares the last trade of every pair
+    # with the workers through shared memory. needs the aggTrade price source, mirror mode keeps its own connections
+    PRICE_BUS = False
+
     # this is the rate from which limit prices from last price are determined e.g. last_price * (1 - DISTANCE_FROM_MID_PRICE) for bid orders and last_price * (1 + DISTANCE_FROM_MID_PRICE) for ask orders. a lower number will see more action!
     DISTANCE_FROM_MID_PRICE = "0.0003"
+
+    # how orders are sent to testnet: "rest" sends one HTTPS request per order, "ws-api" keeps one persistent WebSocket API connection
+    ORDER_GATEWAY = "rest"
+
+    # reference price quotes are anchored on: "aggTrade" uses the last traded price, "mid" and "microprice" use production bookTicker
+    PRICE_SOURCE = "aggTrade"
+    # minimum seconds between reference price updates that drive requotes. None uses the price source's default
+    PRICE_MIN_INTERVAL = None
+
+    # "spread" quotes one bid and ask around the production price, "mirror" copies the top DEPTH_LEVELS of the production order book into testnet
+    MODE = "spread"
+    DEPTH_LEVELS = 5
+    # testnet size for a mirrored level, as a ratio of the production size
+    DEPTH_SIZE_RATIO = "0.01"
+    # a mirrored level is only requoted when its size changes by more than this ratio
+    DEPTH_MIN_SIZE_CHANGE = "0.1"
+
+    # production market data endpoints raced against each other, the first copy of each message wins and lagging endpoints are dropped. None uses the single default endpoint
+    PRODUCTION_WS_BASE_URLS = [
+        "wss://stream.binance.com:9443/ws",
+        "wss://stream.binance.com:443/ws",
+        "wss://data-stream.binance.vision/ws",
+    ]
+
+    # socket options and pings of every websocket connection, see TransportProfile. compare profiles with bench_websocket.py
+    WEBSOCKET_TRANSPORT = {
+        "tcp_nodelay": True,
+        "rcvbuf": None,
+        "ping_interval": 20,
+        "ping_timeout": 10,
+        "skip_utf8_validation": True,
+    }
+
+    # seconds without production data before quotes are pulled and the feed is reconnected
+    FEED_STALE_AFTER = 10
+    # port serving /healthz, /readyz, /state and /events, None disables it. supervise.py workers use HEALTH_PORT + worker number
+    HEALTH_PORT = 8080
+    # interface the health server listens on. "0.0.0.0" exposes it to probes from outside the host or container, profiling routes still only answer loopback clients
+    HEALTH_HOST = "127.0.0.1"
+
+    # recvWindow in milliseconds sent with signed requests, None uses Binance's default of 5000
+    RECV_WINDOW = None
+    # seconds between server time offset estimates, None signs requests with the local clock
+    SERVER_TIME_SYNC_INTERVAL = 60
+
+    # "RESULT" copies order details from each order response, "ACK" gets a minimal response and finalizes orders from the user stream
+    ORDER_RESPONSE_TYPE = "RESULT"
+
+    # "fixed" quotes DISTANCE_FROM_MID_PRICE away, "adaptive" widens and tightens quotes with production volatility
+    SPREAD_POLICY = "fixed"
+
+    # Bounds of the adaptive spread policy's distance from mid price
+    MIN_DISTANCE_FROM_MID_PRICE = "0.001"
+    MAX_DISTANCE_FROM_MID_PRICE = "0.05"
+
+    # Directory orders and fills are journaled to for report.py, None disables the journal
+    JOURNAL_DIR = None
+
+    # Directory CPU and memory profiles are written to when profiling is triggered (SIGUSR1, SIGUSR2 or POST /debug/profile/...), None disables the controls
+    PROFILE_DIR = "profiles"
+
+    # share of the inventory's value to hold in the base asset. quotes are skewed toward it instead of placing swap orders:
+    # the side that rebalances is enlarged by INVENTORY_SIZE_SKEW, up to the amount that restores the target, and moved closer to the market by INVENTORY_PRICE_SKEW of the distance, times the imbalance
+    INVENTORY_TARGET_RATIO = "0.5"
+    INVENTORY_SIZE_SKEW = "1"
+    INVENTORY_PRICE_SKEW = "0.5"
+
+    # File finished tick-to-executionReport traces are written to in the Chrome trace format, None disables tracing
+    TRACE_FILE = None
+
+    # TOML file of pairs and their settings for supervise.py, replacing SYMBOLS and the per-pair settings above. See symbols.example.toml
+    SYMBOL_CONFIG_FILE = os.getenv("SYMBOL_CONFIG_FILE")
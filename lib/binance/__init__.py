@@ -1,2 +1,25 @@
-from .rest.client import BinanceClient
-from .websocket.client import BinanceWebsocketClient
+import importlib
+
+# clients are imported on first use, so importing a submodule such as lib.binance.rest.exceptions
+# doesn't pull in requests and websocket-client (PEP 562)
+_CLIENTS = {
+    "BinanceClient": ".rest.client",
+    "BinanceAccountPool": ".rest.account_pool",
+    "BinanceWebsocketClient": ".websocket.client",
+    "BinanceMultiEndpointWebsocketClient": ".websocket.multi_client",
+    "BinanceWebsocketApiClient": ".websocket.api_client",
+}
+
+__all__ = list(_CLIENTS)
+
+
+def __getattr__(name):
+    if name not in _CLIENTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    client = getattr(importlib.import_module(_CLIENTS[name], __name__), name)
+    globals()[name] = client
+    return client
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
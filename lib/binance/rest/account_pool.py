@@ -0,0 +1,54 @@
+import threading
+from lib.clock import REAL_CLOCK
+from lib.binance.rest.client import BinanceClient
+
+
+class BinanceAccountPool:
+    """
+    Spreads requests over several API key/secret pairs, each with its own rate limit budget.
+
+    Usage is read from the X-MBX-USED-WEIGHT-1M and X-MBX-ORDER-COUNT-10S headers of each account's responses.
+    A routing key (a symbol, or a symbol and ladder level) sticks to its account while that account has more than
+    `reserve` of its budget left, after that it moves to the account with the most spare budget
+    """
+    def __init__(
+        self,
+        base_url="https://api.binance.com",
+        credentials=None,
+        weight_limit=1200,
+        order_limit=50,
+        reserve=0.2,
+        clock=REAL_CLOCK
+    ):
+        self.clients = [BinanceClient(base_url, key, secret, clock=clock) for key, secret in (credentials or [])]
+        if not self.clients:
+            raise ValueError("BinanceAccountPool needs at least one API key and secret")
+
+        self.weight_limit = weight_limit
+        self.order_limit = order_limit
+        self.reserve = reserve
+        self.assignments = {}
+        self._lock = threading.Lock()
+
+    def spare_budget(self, client: BinanceClient) -> float:
+        """
+        Fraction of the tightest limit still available, 1 is unused and 0 is exhausted
+        """
+        used_weight = client.rate_limit_usage.get("x-mbx-used-weight-1m", 0) / self.weight_limit
+        used_orders = client.rate_limit_usage.get("x-mbx-order-count-10s", 0) / self.order_limit
+        return max(0.0, 1 - max(used_weight, used_orders))
+
+    def client_for(self, routing_key) -> BinanceClient:
+        with self._lock:
+            client = self.assignments.get(routing_key)
+            if client is None or self.spare_budget(client) <= self.reserve:
+                # ties go to the account with the fewest routing keys
+                client = max(self.clients, key=lambda c: (self.spare_budget(c), -self._assigned_count(c)))
+                self.assignments[routing_key] = client
+            return client
+
+    def _assigned_count(self, client):
+        return sum(1 for assigned in self.assignments.values() if assigned is client)
+
+    def request_all(self, endpoint, params=None) -> list:
+        return [client.request(endpoint, params) for client in self.clients]
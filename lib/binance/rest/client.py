@@ -1,17 +1,38 @@
 import hmac
 import hashlib
 import requests
+from collections import deque
+from time import perf_counter
 from lib.binance.rest.exceptions import BinanceMissingEndpointException, BinanceAPICredentialsException, BinanceMissingParameterException, BinanceRestException
-from lib.binance.rest.util import encoded_string, get_timestamp, clean_none_value
+from lib.clock import REAL_CLOCK
+from lib.binance.rest.util import encoded_string, get_timestamp, clean_none_value, new_client_order_id
+from lib.binance.rest.policy import RetryPolicy, CircuitBreaker, classify_error, FATAL
 
 
 class BinanceClient:
     endpoints = {
+        "getServerTime": {
+            "http_method": "GET",
+            "path": "/api/v3/time",
+            "is_signed": False
+        },
         "getExchangeInfo": {
             "http_method": "GET",
             "path": "/api/v3/exchangeInfo",
             "is_signed": False
         },
+        "getDepth": {
+            "http_method": "GET",
+            "path": "/api/v3/depth",
+            "is_signed": False,
+            "required_params": ["symbol"]
+        },
+        "getAvgPrice": {
+            "http_method": "GET",
+            "path": "/api/v3/avgPrice",
+            "is_signed": False,
+            "required_params": ["symbol"]
+        },
         "getAccount": {
             "http_method": "GET",
             "path": "/api/v3/account",
@@ -23,6 +44,18 @@ class BinanceClient:
             "is_signed": True,
             "required_params": ["symbol", "side", "type", "timeInForce", "quantity", "price"]
         },
+        "getOrder": {
+            "http_method": "GET",
+            "path": "/api/v3/order",
+            "is_signed": True,
+            "required_params": ["symbol"]
+        },
+        "deleteOrder": {
+            "http_method": "DELETE",
+            "path": "/api/v3/order",
+            "is_signed": True,
+            "required_params": ["symbol"]
+        },
         "deleteOpenOrders": {
             "http_method": "DELETE",
             "path": "/api/v3/openOrders",
@@ -42,25 +75,64 @@ class BinanceClient:
         }
     }
 
-    def __init__(self, base_url="https://api.binance.com", key="", secret=""):
+    def __init__(
+        self,
+        base_url="https://api.binance.com",
+        key="",
+        secret="",
+        retry_policy=None,
+        circuit_breaker_options=None,
+        recv_window=None,
+        clock=REAL_CLOCK
+    ):
         self.base_url = base_url
         self.key = key
         self.secret = secret
+        self.recv_window = recv_window
+        # request timestamps, retry backoffs and circuit breaker timeouts, a VirtualClock in simulations
+        self.clock = clock
+        # server time minus local time, kept up to date by ServerTimeEstimator
+        self.time_offset_ms = 0
+        self._hmac_key = None
+        self._hmac = None
+        self.retry_policy = retry_policy or RetryPolicy(sleep=clock.sleep)
+        self.circuit_breaker_options = circuit_breaker_options or {}
+        self.circuit_breakers = {}
+        # latest X-MBX-USED-WEIGHT-* and X-MBX-ORDER-COUNT-* response headers, keyed by lowercased header name
+        self.rate_limit_usage = {}
+        self.request_count = 0
+        self.error_count = 0
+        # success flag of the most recent requests, for the recent error rate
+        self.recent_results = deque(maxlen=100)
+        # optional callable(name, started_at, ended_at, endpoint) receiving perf_counter times of the "sign" and "http" stages
+        self.span_recorder = None
 
-    def _sign_request(self, payload=None):
-        if payload is None:
-            payload = {}
-        payload["timestamp"] = get_timestamp()
-        query_string = self._prepare_params(payload)
-        signature = self._get_sign(query_string)
-        payload["signature"] = signature
-        return payload
+    def _signed_querystring(self, params=None, endpoint=None):
+        """
+        Encodes the payload once and appends the signature of that exact string
+        """
+        payload = clean_none_value(params) if params else {}
+        if self.recv_window is not None:
+            payload["recvWindow"] = self.recv_window
+        payload["timestamp"] = get_timestamp(self.clock) + self.time_offset_ms
+        started_at = perf_counter() if self.span_recorder else None
+        query_string = encoded_string(payload)
+        query_string = f"{query_string}&signature={self._get_sign(query_string)}"
+        if self.span_recorder:
+            self.span_recorder("sign", started_at, perf_counter(), endpoint)
+        return query_string
 
     def _prepare_params(self, params):
         return encoded_string(clean_none_value(params))
 
     def _get_sign(self, data):
-        m = hmac.new(self.secret.encode("utf-8"), data.encode("utf-8"), hashlib.sha256)
+        # the HMAC is keyed once per secret, each signature only hashes the payload
+        if self._hmac_key != self.secret:
+            self._hmac = hmac.new(self.secret.encode("utf-8"), digestmod=hashlib.sha256)
+            self._hmac_key = self.secret
+
+        m = self._hmac.copy()
+        m.update(data.encode("utf-8"))
         return m.hexdigest()
 
     def _dispatch_request(self, http_method, url_path, url_querystring):
@@ -97,7 +169,7 @@ class BinanceClient:
 
     def _prepare_querystring(self, endpoint, params):
         if self.endpoints[endpoint]["is_signed"]:
-            return self._prepare_params(self._sign_request(params))
+            return self._signed_querystring(params, endpoint)
         elif params:
             return self._prepare_params(params)
 
@@ -105,29 +177,112 @@ class BinanceClient:
 
     def _check_response(self, endpoint, res):
         if res.status_code < 200 or res.status_code > 299:
+            try:
+                details = res.json()
+            except ValueError:
+                # e.g. a gateway's HTML error page, the status code still tells whether to retry
+                details = {'msg': res.text}
             raise BinanceRestException(
                 reason=res.reason,
                 status_code=res.status_code,
                 http_method=self.endpoints[endpoint]["http_method"],
                 path=self.endpoints[endpoint]["path"],
-                details=res.json()
+                details=details
+            )
+
+    def _record_rate_limit_usage(self, res):
+        # https://binance-docs.github.io/apidocs/spot/en/#limits
+        for header, value in res.headers.items():
+            header = header.lower()
+            if header.startswith("x-mbx-used-weight-") or header.startswith("x-mbx-order-count-"):
+                self.rate_limit_usage[header] = int(value)
+
+    def _circuit_breaker(self, endpoint):
+        if endpoint not in self.circuit_breakers:
+            self.circuit_breakers[endpoint] = CircuitBreaker(endpoint, **dict({'clock': self.clock.monotonic}, **self.circuit_breaker_options))
+        return self.circuit_breakers[endpoint]
+
+    def _send(self, endpoint, params):
+        querystring = self._prepare_querystring(endpoint, params)
+
+        self.request_count += 1
+        started_at = perf_counter() if self.span_recorder else None
+        try:
+            res = self._dispatch_request(
+                self.endpoints[endpoint]["http_method"],
+                self.endpoints[endpoint]["path"],
+                querystring
             )
+            if self.span_recorder:
+                self.span_recorder("http", started_at, perf_counter(), endpoint)
+
+            self._record_rate_limit_usage(res)
+            self._check_response(endpoint, res)
+        except Exception as err:
+            self.error_count += 1
+            self.recent_results.append(False)
+            raise err
+
+        self.recent_results.append(True)
+        return res.json()
+
+    def _is_duplicate_order(self, err):
+        return isinstance(err, BinanceRestException) and isinstance(err.details, dict) and \
+            err.details.get('code') == -2010 and err.details.get('msg') == 'Duplicate order sent.'
+
+    def _recover_order(self, params):
+        """
+        A retried order was rejected as a duplicate, so an earlier attempt did reach the exchange. Return that order
+        """
+        order = self._send("getOrder", {
+            "symbol": params["symbol"],
+            "origClientOrderId": params["newClientOrderId"]
+        })
+        order.setdefault("transactTime", order.get("time"))
+        return order
 
     def request(self, endpoint, params=None):
+        """
+        Transient errors are retried as per `retry_policy`, consecutive transient errors open the endpoint's circuit.
+        Orders get a newClientOrderId up front, so a retry can never place the same order twice
+        """
         self._verify_endpoint(endpoint)
         self._verify_api_credentials(endpoint)
         self._verify_parameters(endpoint, params)
 
-        params = params if params else {}
+        params = dict(params) if params else {}
+        if endpoint == "postOrder" and "newClientOrderId" not in params:
+            params["newClientOrderId"] = new_client_order_id()
 
-        querystring = self._prepare_querystring(endpoint, params)
+        circuit_breaker = self._circuit_breaker(endpoint)
+        attempt = 0
+        while True:
+            circuit_breaker.before_request()
+            try:
+                # each attempt is signed with a fresh timestamp
+                res = self._send(endpoint, dict(params))
+            except Exception as err:
+                if endpoint == "postOrder" and attempt > 0 and self._is_duplicate_order(err):
+                    circuit_breaker.record_success()
+                    return self._recover_order(params)
 
-        res = self._dispatch_request(
-            self.endpoints[endpoint]["http_method"],
-            self.endpoints[endpoint]["path"],
-            querystring
-        )
+                kind = classify_error(err)
+                if kind == FATAL:
+                    # the exchange answered, it is not an incident
+                    circuit_breaker.record_success()
+                else:
+                    circuit_breaker.record_failure()
 
-        self._check_response(endpoint, res)
+                if not self.retry_policy.should_retry(attempt, kind) or circuit_breaker.state == CircuitBreaker.OPEN:
+                    raise err
 
-        return res.json()
+                self.retry_policy.sleep(self.retry_policy.delay(attempt, kind))
+                attempt += 1
+                continue
+
+            circuit_breaker.record_success()
+            return res
+
+    def recent_error_rate(self) -> float:
+        results = list(self.recent_results)
+        return results.count(False) / len(results) if results else 0.0
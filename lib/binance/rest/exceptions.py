@@ -25,7 +25,15 @@ class BinanceRestException(Exception):
 
     @property
     def code(self):
-        return self.details['code']
+        # None when the response body wasn't one of Binance's JSON errors
+        return self.details.get('code') if isinstance(self.details, dict) else None
 
     def __str__(self) -> str:
         return f"{self.status_code} {self.reason} {self.http_method} {self.path} {self.details}"
+
+
+class BinanceCircuitOpenException(Exception):
+    def __init__(self, endpoint, retry_in):
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        super().__init__(f"Circuit open for {endpoint}, retry in {retry_in:.1f}s")
@@ -0,0 +1,109 @@
+import random
+import time
+from requests.exceptions import ConnectionError, Timeout
+from lib.binance.rest.exceptions import BinanceRestException, BinanceCircuitOpenException
+from lib.binance.websocket.exceptions import BinanceWebsocketApiConnectionException, BinanceWebsocketApiTimeoutException
+
+RETRYABLE = "retryable"
+RATE_LIMITED = "rate_limited"
+FATAL = "fatal"
+
+# https://github.com/binance/binance-spot-api-docs/blob/master/errors.md
+RETRYABLE_CODES = (
+    -1001,  # DISCONNECTED
+    -1006,  # UNEXPECTED_RESP
+    -1007,  # TIMEOUT
+    -1021,  # INVALID_TIMESTAMP
+)
+RATE_LIMITED_CODES = (
+    -1003,  # TOO_MANY_REQUESTS
+    -1015,  # TOO_MANY_ORDERS
+)
+
+
+def classify_error(err) -> str:
+    """
+    retryable: the request may succeed if sent again
+    rate_limited: the request may succeed after backing off for longer
+    fatal: sending it again won't help
+    """
+    if isinstance(err, (ConnectionError, Timeout, BinanceWebsocketApiConnectionException, BinanceWebsocketApiTimeoutException)):
+        return RETRYABLE
+
+    if isinstance(err, BinanceRestException):
+        code = err.details.get('code') if isinstance(err.details, dict) else None
+        if err.status_code in (418, 429) or code in RATE_LIMITED_CODES:
+            return RATE_LIMITED
+        if err.status_code >= 500 or code in RETRYABLE_CODES:
+            return RETRYABLE
+
+    return FATAL
+
+
+def is_transient(err) -> bool:
+    return isinstance(err, BinanceCircuitOpenException) or classify_error(err) != FATAL
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter, rate limited errors back off from a longer base delay
+    """
+    def __init__(
+        self,
+        max_attempts=3,
+        base_delay=0.1,
+        rate_limited_base_delay=1.0,
+        max_delay=5.0,
+        sleep=time.sleep,
+        random=random.random
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.rate_limited_base_delay = rate_limited_base_delay
+        self.max_delay = max_delay
+        self.sleep = sleep
+        self.random = random
+
+    def should_retry(self, attempt, kind) -> bool:
+        return kind != FATAL and attempt + 1 < self.max_attempts
+
+    def delay(self, attempt, kind) -> float:
+        base = self.rate_limited_base_delay if kind == RATE_LIMITED else self.base_delay
+        return self.random() * min(self.max_delay, base * 2 ** attempt)
+
+
+class CircuitBreaker:
+    """
+    Sheds load on an endpoint during exchange incidents.
+    After `failure_threshold` consecutive transient failures the circuit opens and requests fail fast for `reset_timeout` seconds,
+    then a single trial request is let through (half open): success closes the circuit, failure opens it again
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, endpoint, failure_threshold=5, reset_timeout=30, clock=time.monotonic):
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+
+    def before_request(self):
+        if self.state == self.OPEN:
+            elapsed = self.clock() - self.opened_at
+            if elapsed < self.reset_timeout:
+                raise BinanceCircuitOpenException(self.endpoint, self.reset_timeout - elapsed)
+            self.state = self.HALF_OPEN
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = self.clock()
@@ -0,0 +1,56 @@
+import threading
+from collections import deque
+from lib.clock import REAL_CLOCK
+
+
+class ServerTimeEstimator:
+    """
+    Estimates the offset between the local clock and Binance server time, so signed requests
+    are not rejected with -1021 when the container's clock drifts.
+
+    Each sample brackets /api/v3/time with local timestamps and assumes the server time was read half way.
+    The sample with the smallest round trip has the tightest error bound, so the offset comes from the
+    minimum RTT sample of the last `window` samples. The offset is applied to every client in `clients`
+    """
+    def __init__(self, clients, interval=60, window=10, samples_per_round=3, clock_ms=lambda: REAL_CLOCK.time() * 1000):
+        self.clients = list(clients)
+        self.interval = interval
+        self.samples = deque(maxlen=window)
+        self.samples_per_round = samples_per_round
+        self.clock_ms = clock_ms
+        self.offset_ms = 0
+        self._stop = threading.Event()
+
+    def sample(self):
+        sent_at = self.clock_ms()
+        server_time = self.clients[0].request("getServerTime")["serverTime"]
+        received_at = self.clock_ms()
+
+        rtt = received_at - sent_at
+        self.samples.append((rtt, server_time - (sent_at + received_at) / 2))
+
+        _, offset = min(self.samples)
+        self.offset_ms = int(round(offset))
+        for client in self.clients:
+            client.time_offset_ms = self.offset_ms
+
+    def sync(self):
+        for _ in range(self.samples_per_round):
+            self.sample()
+
+    def start(self):
+        self.sync()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.sync()
+            except Exception as err:
+                # keep the last estimate, the next round tries again
+                print(f"Server time sync failed: {err}")
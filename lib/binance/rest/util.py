@@ -1,13 +1,14 @@
-import time
+import uuid
 from urllib.parse import urlencode
+from lib.clock import REAL_CLOCK
 
 
 def encoded_string(query):
     return urlencode(query, True).replace("%40", "@")
 
 
-def get_timestamp():
-    return int(time.time() * 1000)
+def get_timestamp(clock=REAL_CLOCK):
+    return int(clock.time() * 1000)
 
 
 def clean_none_value(d) -> dict:
@@ -16,3 +17,8 @@ def clean_none_value(d) -> dict:
         if d[k] is not None:
             out[k] = d[k]
     return out
+
+
+def new_client_order_id(prefix="tmm-"):
+    # https://binance-docs.github.io/apidocs/spot/en/#new-order-trade newClientOrderId: ^[\.A-Z\:/a-z0-9_-]{1,36}$
+    return f"{prefix}{uuid.uuid4().hex}"[:36]
@@ -0,0 +1,192 @@
+import hmac
+import hashlib
+import itertools
+import json
+import threading
+from time import perf_counter
+from lib.clock import REAL_CLOCK
+from lib.binance.rest.util import encoded_string, get_timestamp, clean_none_value
+from lib.binance.websocket.transport import TransportProfile, ConnectionStats
+from lib.binance.websocket.exceptions import BinanceWebsocketApiException, BinanceWebsocketApiTimeoutException, BinanceWebsocketApiConnectionException
+
+
+class _PendingRequest:
+    def __init__(self):
+        self.event = threading.Event()
+        self.response = None
+
+
+class BinanceWebsocketApiClient:
+    """
+    Client for the Binance WebSocket API (ws-api)
+    https://binance-docs.github.io/apidocs/websocket_api/en/
+
+    Requests share one persistent connection. Every request carries an id,
+    responses are matched back to the waiting caller by that id.
+    A connection that dropped is made again by the next request, unless `disconnect` closed it.
+    """
+    def __init__(
+        self,
+        name="ws-api",
+        ws_api_base_url="wss://ws-api.binance.com:443/ws-api/v3",
+        key="",
+        secret="",
+        timeout=5,
+        transport=None,
+        clock=REAL_CLOCK,
+        close_handler=None
+    ):
+        """
+        `transport` is a TransportProfile, socket options and pings of the connection. `stats` counts its traffic
+        `clock` timestamps signed requests
+        `close_handler` is called when the connection drops, not when `disconnect` closes it
+        """
+        self.name = name
+        self.url = ws_api_base_url
+        self.key = key
+        self.secret = secret
+        self.timeout = timeout
+        self.clock = clock
+        self.close_handler = close_handler
+        self.transport = transport or TransportProfile()
+        self.stats = ConnectionStats()
+        # server time minus local time, kept up to date by ServerTimeEstimator
+        self.time_offset_ms = 0
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._connected = threading.Event()
+        self._closing = False
+
+    def connect(self):
+        # websocket-client is only loaded once a connection is made
+        import websocket
+
+        print(f"{self.name}: Attempting to connect")
+        self._closing = False
+        self.ws = websocket.WebSocketApp(
+            self.url,
+            on_message=self._on_message,
+            on_close=self._on_close,
+            on_open=self._on_open,
+            on_error=self._on_error,
+            on_pong=self._on_pong
+        )
+
+        self.wst = threading.Thread(target=lambda: self.ws.run_forever(**self.transport.run_forever_options()))
+        self.wst.daemon = True
+        self.wst.start()
+
+        if not self._connected.wait(self.timeout):
+            raise BinanceWebsocketApiConnectionException(f"{self.name}: Unable to connect to {self.url}")
+
+    def disconnect(self):
+        self._closing = True
+        self.ws.close()
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    def request(self, method, params=None, is_signed=False):
+        """
+        Sends `method` and blocks until its response arrives or `timeout` elapses
+        """
+        if not self._connected.is_set() and hasattr(self, 'ws') and not self._closing:
+            self.connect()
+
+        if not self._connected.is_set():
+            raise BinanceWebsocketApiConnectionException(f"{self.name}: Not connected")
+
+        params = clean_none_value(params) if params else {}
+        if is_signed:
+            params = self._sign_request(params)
+
+        request_id = str(next(self._ids))
+        pending = _PendingRequest()
+        with self._pending_lock:
+            self._pending[request_id] = pending
+
+        try:
+            self.ws.send(json.dumps({
+                "id": request_id,
+                "method": method,
+                "params": params
+            }))
+
+            if not pending.event.wait(self.timeout):
+                raise BinanceWebsocketApiTimeoutException(method, request_id, self.timeout)
+        finally:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+
+        return self._check_response(method, pending.response)
+
+    def _sign_request(self, params):
+        # ws-api signs the alphabetically sorted parameters, including apiKey
+        params["apiKey"] = self.key
+        params["timestamp"] = get_timestamp(self.clock) + self.time_offset_ms
+        query_string = encoded_string(sorted(params.items()))
+        params["signature"] = hmac.new(self.secret.encode("utf-8"), query_string.encode("utf-8"), hashlib.sha256).hexdigest()
+        return params
+
+    def _check_response(self, method, response):
+        if response.get("status", 200) < 200 or response.get("status", 200) > 299:
+            raise BinanceWebsocketApiException(
+                status_code=response.get("status"),
+                method=method,
+                details=response.get("error", {})
+            )
+
+        return response.get("result")
+
+    def _on_message(self, _, message):
+        received_at = perf_counter()
+        response = json.loads(message)
+        self.stats.on_message(len(message), (perf_counter() - received_at) * 1000)
+
+        with self._pending_lock:
+            pending = self._pending.get(str(response.get("id")))
+
+        # late responses to requests that already timed out are dropped
+        if pending:
+            pending.response = response
+            pending.event.set()
+
+    def _on_pong(self, ws, _):
+        self.stats.on_pong((ws.last_pong_tm - ws.last_ping_tm) * 1000 if ws.last_ping_tm else None)
+
+    def connection_stats(self) -> dict:
+        # keyed by name, user stream urls carry the listen key
+        return {self.name: self.stats.as_dict()}
+
+    def _on_open(self, ws):
+        print(f"{self.name}: Connection opened")
+        if ws is self.ws:
+            self._connected.set()
+
+    def _on_close(self, ws, close_status_code, close_msg):
+        print(f"{self.name}: Connection closed {close_status_code}: {close_msg}")
+        self._on_connection_lost(ws)
+
+    def _on_error(self, ws, error):
+        print(f"{self.name}: Connection error {error}")
+        self._on_connection_lost(ws)
+
+    def _on_connection_lost(self, ws):
+        # a connection replaced by a reconnect is expected to close
+        if ws is not self.ws or not self._connected.is_set():
+            return
+
+        self._connected.clear()
+        self._fail_pending_requests()
+        if self.close_handler and not self._closing:
+            self.close_handler()
+
+    def _fail_pending_requests(self):
+        with self._pending_lock:
+            pending_requests = list(self._pending.values())
+
+        for pending in pending_requests:
+            pending.response = {"status": 503, "error": {"code": -1001, "msg": "Internal error; unable to process your request. Please try again."}}
+            pending.event.set()
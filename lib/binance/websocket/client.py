@@ -1,6 +1,7 @@
-import websocket
 import threading
 import json
+from time import perf_counter
+from lib.binance.websocket.transport import TransportProfile, ConnectionStats
 
 
 class BinanceWebsocketClient:
@@ -10,13 +11,22 @@ class BinanceWebsocketClient:
         ws_base_url="wss://stream.binance.com:9443/ws",
         topics=[],
         message_handler=None,
-        close_handler=None
+        close_handler=None,
+        with_receive_time=False,
+        transport=None
     ):
+        """
+        With `with_receive_time`, `message_handler` is also passed the perf_counter time the message was received at, before decoding
+        `transport` is a TransportProfile, socket options and pings of the connection. `stats` counts its traffic
+        """
         self.name = name
         self.url = ws_base_url
         self.topics = topics
         self.message_handler = message_handler
         self.close_handler = close_handler
+        self.with_receive_time = with_receive_time
+        self.transport = transport or TransportProfile()
+        self.stats = ConnectionStats()
 
     @staticmethod
     def agg_trade(symbol="btcusdt"):
@@ -26,17 +36,25 @@ class BinanceWebsocketClient:
     def book_ticker(symbol="btcusdt"):
         return f"{symbol.lower()}@bookTicker"
 
+    @staticmethod
+    def diff_depth(symbol="btcusdt", update_speed="100ms"):
+        return f"{symbol.lower()}@depth@{update_speed}"
+
     def connect(self):
+        # websocket-client is only loaded once a connection is made
+        import websocket
+
         print(f"{self.name}: Attempting to connect")
         self.ws = websocket.WebSocketApp(
             self.url,
             on_message=self._on_message,
             on_close=self._on_close,
             on_open=self._on_open,
-            on_error=self._on_error
+            on_error=self._on_error,
+            on_pong=self._on_pong
         )
 
-        self.wst = threading.Thread(target=lambda: self.ws.run_forever())
+        self.wst = threading.Thread(target=lambda: self.ws.run_forever(**self.transport.run_forever_options()))
         self.wst.daemon = True
         self.wst.start()
 
@@ -47,8 +65,21 @@ class BinanceWebsocketClient:
         self.ws.send(json.dumps(cmd))
 
     def _on_message(self, _, message):
-        if self.message_handler:
-            self.message_handler(json.loads(message))
+        received_at = perf_counter()
+        msg = json.loads(message)
+        self.stats.on_message(len(message), (perf_counter() - received_at) * 1000)
+
+        if self.message_handler and self.with_receive_time:
+            self.message_handler(msg, received_at)
+        elif self.message_handler:
+            self.message_handler(msg)
+
+    def _on_pong(self, ws, _):
+        self.stats.on_pong((ws.last_pong_tm - ws.last_ping_tm) * 1000 if ws.last_ping_tm else None)
+
+    def connection_stats(self) -> dict:
+        # keyed by name, user stream urls carry the listen key
+        return {self.name: self.stats.as_dict()}
 
     def _on_open(self, _):
         print(f"{self.name}: Connection opened")
@@ -0,0 +1,26 @@
+from lib.binance.rest.exceptions import BinanceRestException
+
+
+class BinanceWebsocketApiException(BinanceRestException):
+    """
+    Error response from the WebSocket API.
+    Shares the REST exception's shape (`code`, `details`) so callers can handle both gateways the same way
+    """
+    def __init__(self, status_code, method, details):
+        super().__init__(
+            reason=details.get('msg', '') if isinstance(details, dict) else '',
+            status_code=status_code,
+            http_method="WS",
+            path=method,
+            details=details
+        )
+
+
+class BinanceWebsocketApiTimeoutException(Exception):
+    def __init__(self, method, request_id, timeout):
+        super().__init__(f"{method} request {request_id} timed out after {timeout}s")
+
+
+class BinanceWebsocketApiConnectionException(Exception):
+    def __init__(self, msg):
+        super().__init__(msg)
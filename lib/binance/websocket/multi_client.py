@@ -0,0 +1,132 @@
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+from lib.binance.websocket.client import BinanceWebsocketClient
+
+
+class BinanceMultiEndpointWebsocketClient:
+    """
+    Subscribes to the same topics on several market data endpoints and forwards whichever copy of a message arrives first.
+
+    Messages are deduplicated by their exchange id (aggTrade id, or the update id of depth and bookTicker).
+    For every duplicate, the delay behind the first copy is folded into an EWMA per endpoint;
+    once an endpoint has `min_samples` samples and lags by more than `max_lag` seconds it is dropped,
+    as long as another endpoint is left. `close_handler` is only called once every endpoint is gone
+    """
+    def __init__(
+        self,
+        name="default",
+        ws_base_urls=("wss://stream.binance.com:9443/ws",),
+        topics=[],
+        message_handler=None,
+        close_handler=None,
+        max_lag=0.25,
+        lag_alpha=0.1,
+        min_samples=50,
+        dedupe_window=10000,
+        clock=time.monotonic,
+        transport=None
+    ):
+        self.name = name
+        self.urls = list(ws_base_urls)
+        self.topics = topics
+        self.message_handler = message_handler
+        self.close_handler = close_handler
+        self.max_lag = max_lag
+        self.lag_alpha = lag_alpha
+        self.min_samples = min_samples
+        self.dedupe_window = dedupe_window
+        self.clock = clock
+        self.transport = transport
+        self.clients = {}
+        self.active = set()
+        self.stats = {url: {'lag': 0.0, 'samples': 0, 'first': 0} for url in self.urls}
+        self._seen = OrderedDict()
+        self._lock = threading.Lock()
+
+    def connect(self):
+        for url in self.urls:
+            client = BinanceWebsocketClient(
+                name=f"{self.name} {url}",
+                ws_base_url=url,
+                topics=self.topics,
+                message_handler=partial(self._on_endpoint_message, url),
+                close_handler=partial(self._on_endpoint_close, url),
+                transport=self.transport)
+            self.clients[url] = client
+            self.active.add(url)
+            client.connect()
+
+    def disconnect(self):
+        with self._lock:
+            urls, self.active = list(self.active), set()
+
+        for url in urls:
+            self.clients[url].disconnect()
+
+    @staticmethod
+    def _message_key(msg):
+        if 'e' in msg and msg['e'] == 'aggTrade':
+            return ('aggTrade', msg['s'], msg['a'])
+        if 'e' in msg and msg['e'] == 'depthUpdate':
+            return ('depthUpdate', msg['s'], msg['u'])
+        if 'u' in msg and 's' in msg:
+            return ('bookTicker', msg['s'], msg['u'])
+        return None
+
+    def _on_endpoint_message(self, url, msg):
+        # subscription acknowledgements
+        if 'result' in msg and 'id' in msg:
+            return
+
+        key = self._message_key(msg)
+        now = self.clock()
+        to_drop = None
+
+        with self._lock:
+            if url not in self.active:
+                return
+
+            if key is None or key not in self._seen:
+                if key is not None:
+                    self._seen[key] = now
+                    if len(self._seen) > self.dedupe_window:
+                        self._seen.popitem(last=False)
+                self.stats[url]['first'] += 1
+                self._record_lag(url, 0.0)
+                if self.message_handler:
+                    self.message_handler(msg)
+            else:
+                self._record_lag(url, now - self._seen[key])
+
+            if self._is_lagging(url) and len(self.active) > 1:
+                self.active.discard(url)
+                to_drop = url
+
+        if to_drop:
+            print(f"{self.name}: Dropping {to_drop}, lagging {self.stats[to_drop]['lag'] * 1000:.1f}ms behind")
+            self.clients[to_drop].disconnect()
+
+    def _record_lag(self, url, lag):
+        stats = self.stats[url]
+        stats['lag'] = lag if stats['samples'] == 0 else (1 - self.lag_alpha) * stats['lag'] + self.lag_alpha * lag
+        stats['samples'] += 1
+
+    def _is_lagging(self, url):
+        return self.stats[url]['samples'] >= self.min_samples and self.stats[url]['lag'] > self.max_lag
+
+    def connection_stats(self) -> dict:
+        """
+        Transport stats of every endpoint connected, including dropped ones
+        """
+        return {client.name: dict(client.stats.as_dict(), active=url in self.active) for url, client in self.clients.items()}
+
+    def _on_endpoint_close(self, url):
+        with self._lock:
+            was_active = url in self.active
+            self.active.discard(url)
+            all_closed = was_active and len(self.active) == 0
+
+        if all_closed and self.close_handler:
+            self.close_handler()
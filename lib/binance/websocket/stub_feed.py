@@ -0,0 +1,139 @@
+import base64
+import hashlib
+import json
+import socket
+import struct
+import threading
+
+_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+OPCODE_TEXT, OPCODE_CLOSE, OPCODE_PING, OPCODE_PONG = 0x1, 0x8, 0x9, 0xA
+
+
+class StubFeedServer:
+    """
+    Local WebSocket server (RFC 6455) standing in for a Binance market data endpoint, for tests and transport benchmarks.
+
+    Every connection gets its own iterable from `messages()`, streamed as JSON text frames once the client subscribes.
+    Items are taken from the iterable as they are sent, a generator can stamp its messages with the send time.
+    Pings are answered with pongs, subscriptions are acknowledged like Binance does
+    """
+    def __init__(self, messages=lambda: (), host="127.0.0.1", port=0, sndbuf=None):
+        self.messages = messages
+        self.sndbuf = sndbuf
+        self.sock = socket.create_server((host, port))
+        self.url = f"ws://{host}:{self.sock.getsockname()[1]}/ws"
+        self.connections = []
+        self.sent = 0
+        self._stopped = threading.Event()
+
+    def start(self):
+        threading.Thread(target=self._accept, name="stub-feed", daemon=True).start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        self.sock.close()
+        for conn in self.connections:
+            try:
+                conn.close()
+            except OSError:
+                pass
+
+    def _accept(self):
+        while not self._stopped.is_set():
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            if self.sndbuf:
+                conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.sndbuf)
+            self.connections.append(conn)
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _handshake(self, conn):
+        request = b""
+        while b"\r\n\r\n" not in request:
+            chunk = conn.recv(4096)
+            if not chunk:
+                raise ConnectionError("closed during handshake")
+            request += chunk
+
+        headers = dict(
+            line.split(": ", 1) for line in request.decode("latin-1").split("\r\n")[1:] if ": " in line
+        )
+        key = {name.lower(): value for name, value in headers.items()}["sec-websocket-key"]
+        accept = base64.b64encode(hashlib.sha1((key + _GUID).encode()).digest()).decode()
+        conn.sendall((
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept}\r\n\r\n"
+        ).encode())
+
+    def _serve(self, conn):
+        lock = threading.Lock()
+        try:
+            self._handshake(conn)
+            while not self._stopped.is_set():
+                opcode, payload = self._read_frame(conn)
+                if opcode == OPCODE_PING:
+                    with lock:
+                        conn.sendall(self.frame(payload, OPCODE_PONG))
+                elif opcode == OPCODE_CLOSE:
+                    with lock:
+                        conn.sendall(self.frame(payload[:2], OPCODE_CLOSE))
+                    return
+                elif opcode == OPCODE_TEXT:
+                    command = json.loads(payload)
+                    with lock:
+                        conn.sendall(self.frame(json.dumps({"result": None, "id": command.get("id")}).encode()))
+                    if command.get("method") == "SUBSCRIBE":
+                        threading.Thread(target=self._stream, args=(conn, lock), daemon=True).start()
+        except (ConnectionError, OSError):
+            return
+        finally:
+            conn.close()
+
+    def _stream(self, conn, lock):
+        try:
+            for msg in self.messages():
+                frame = self.frame(json.dumps(msg).encode())
+                with lock:
+                    conn.sendall(frame)
+                self.sent += 1
+        except OSError:
+            return
+
+    @staticmethod
+    def frame(payload: bytes, opcode=OPCODE_TEXT) -> bytes:
+        # server frames are never masked
+        header = bytes([0x80 | opcode])
+        if len(payload) < 126:
+            header += bytes([len(payload)])
+        elif len(payload) < 1 << 16:
+            header += bytes([126]) + struct.pack("!H", len(payload))
+        else:
+            header += bytes([127]) + struct.pack("!Q", len(payload))
+        return header + payload
+
+    @staticmethod
+    def _recv_exact(conn, size):
+        data = b""
+        while len(data) < size:
+            chunk = conn.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("closed")
+            data += chunk
+        return data
+
+    def _read_frame(self, conn):
+        first, second = self._recv_exact(conn, 2)
+        length = second & 0x7F
+        if length == 126:
+            length = struct.unpack("!H", self._recv_exact(conn, 2))[0]
+        elif length == 127:
+            length = struct.unpack("!Q", self._recv_exact(conn, 8))[0]
+        # client frames are always masked
+        mask = self._recv_exact(conn, 4) if second & 0x80 else b"\x00\x00\x00\x00"
+        payload = self._recv_exact(conn, length)
+        return first & 0x0F, bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
@@ -0,0 +1,79 @@
+import socket
+from typing import NamedTuple, Optional
+
+
+class TransportProfile(NamedTuple):
+    """
+    Socket and keepalive options of one websocket connection.
+
+    `tcp_nodelay` disables Nagle's algorithm, so small frames such as pongs and ws-api requests aren't held back.
+    `rcvbuf` sets SO_RCVBUF in bytes, None keeps the OS default. A larger buffer absorbs bursts while the handler is busy.
+    `ping_interval` is the number of seconds between client pings, 0 only answers the server's pings.
+    A connection without a pong within `ping_timeout` seconds is closed, so a dead link is noticed without waiting on TCP.
+    `skip_utf8_validation` skips websocket-client's pure Python UTF-8 check of every text frame.
+
+    websocket-client doesn't implement permessage-deflate, frames are always uncompressed
+    """
+    tcp_nodelay: bool = True
+    rcvbuf: Optional[int] = None
+    ping_interval: float = 0
+    ping_timeout: Optional[float] = None
+    skip_utf8_validation: bool = False
+
+    def sockopt(self) -> list:
+        options = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1 if self.tcp_nodelay else 0)]
+        if self.rcvbuf:
+            options.append((socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf))
+        return options
+
+    def run_forever_options(self) -> dict:
+        """
+        Keyword arguments for WebSocketApp.run_forever
+        """
+        return {
+            'sockopt': self.sockopt(),
+            'ping_interval': self.ping_interval,
+            'ping_timeout': self.ping_timeout,
+            'skip_utf8_validation': self.skip_utf8_validation,
+        }
+
+
+class ConnectionStats:
+    """
+    Counters of one websocket connection, updated by its receiving thread.
+    `handler_delay` is the time from a frame being handed over by websocket-client to the message handler being called,
+    i.e. decoding. `ping_rtt` is the time from the last client ping to its pong. Both in milliseconds,
+    as the latest value, an EWMA with weight `alpha` and the maximum
+    """
+    def __init__(self, alpha=0.05):
+        self.alpha = alpha
+        self.messages = 0
+        self.bytes = 0
+        self.pongs = 0
+        self.handler_delay = {'last': None, 'ewma': None, 'max': None}
+        self.ping_rtt = {'last': None, 'ewma': None, 'max': None}
+
+    def _observe(self, measure, value):
+        measure['last'] = value
+        measure['ewma'] = value if measure['ewma'] is None else measure['ewma'] + self.alpha * (value - measure['ewma'])
+        measure['max'] = value if measure['max'] is None else max(measure['max'], value)
+
+    def on_message(self, size, handler_delay_ms):
+        self.messages += 1
+        # Binance payloads are ASCII JSON, characters are bytes
+        self.bytes += size
+        self._observe(self.handler_delay, handler_delay_ms)
+
+    def on_pong(self, rtt_ms):
+        self.pongs += 1
+        if rtt_ms is not None and rtt_ms >= 0:
+            self._observe(self.ping_rtt, rtt_ms)
+
+    def as_dict(self) -> dict:
+        return {
+            'messages': self.messages,
+            'bytes': self.bytes,
+            'pongs': self.pongs,
+            'handler_delay_ms': dict(self.handler_delay),
+            'ping_rtt_ms': dict(self.ping_rtt),
+        }
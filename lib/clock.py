@@ -0,0 +1,72 @@
+import queue
+import threading
+import time
+from datetime import datetime
+
+
+class RealClock:
+    """
+    The machine's clocks: `time` is wall clock seconds since the epoch, for timestamps sent to the exchange,
+    `monotonic` is for intervals and timeouts, `sleep` and `wait` block the calling thread
+    """
+    def time(self) -> float:
+        return time.time()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+    def wait(self, events: queue.Queue, timeout):
+        """
+        Next item of `events`, waiting up to `timeout` seconds for one. Raises queue.Empty if none came
+        """
+        return events.get(timeout=timeout)
+
+    def now(self) -> datetime:
+        return datetime.fromtimestamp(self.time())
+
+
+class VirtualClock(RealClock):
+    """
+    A clock that only moves when told to, for simulations and tests.
+
+    `sleep` returns at once after moving the clock forward, so waits cost no real time.
+    `wait` doesn't wait for items put by other threads either, with none queued it moves the clock by the whole timeout.
+    A replay moves it with `advance_to` to each event's own timestamp, hours of trading then take as long as processing them.
+    `time` and `monotonic` read the same value, it never goes backwards
+    """
+    def __init__(self, start=0.0):
+        self._now = float(start)
+        self._lock = threading.Lock()
+
+    def time(self) -> float:
+        return self._now
+
+    def monotonic(self) -> float:
+        return self._now
+
+    def sleep(self, seconds):
+        self.advance(seconds)
+
+    def wait(self, events: queue.Queue, timeout):
+        try:
+            return events.get_nowait()
+        except queue.Empty:
+            self.advance(timeout)
+            raise
+
+    def advance(self, seconds):
+        with self._lock:
+            self._now += max(seconds, 0)
+
+    def advance_to(self, timestamp):
+        """
+        Moves the clock to `timestamp` seconds since the epoch, if it is later than now
+        """
+        with self._lock:
+            self._now = max(self._now, float(timestamp))
+
+
+REAL_CLOCK = RealClock()
@@ -0,0 +1,30 @@
+import argparse
+from config import Config
+from bot.analytics import load_journal, summarize
+
+
+def _format(value, spec):
+    return "-" if value is None else format(value, spec)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarizes journaled orders and fills per symbol")
+    parser.add_argument("journal_dir", nargs="?", default=Config.JOURNAL_DIR)
+    args = parser.parse_args()
+
+    if args.journal_dir is None:
+        parser.error("no journal directory, pass one or set JOURNAL_DIR")
+
+    for symbol, (orders, fills) in load_journal(args.journal_dir).items():
+        summary = summarize(orders, fills)
+        ttf = summary['time_to_fill']
+        print(f"{symbol}")
+        print(f"  orders {summary['orders']}, fills {summary['fills']}, fill rate {_format(summary['fill_rate'], '.2%')}, filled qty {_format(summary['filled_qty_ratio'], '.2%')}")
+        print(f"  volume {summary['volume']:.8f}, notional {summary['notional']:.2f}")
+        print(f"  time to fill p50 {_format(ttf['p50'], '.1f')}s, p90 {_format(ttf['p90'], '.1f')}s, p99 {_format(ttf['p99'], '.1f')}s")
+        print(f"  realized spread {_format(summary['realized_spread_bps'], '.2f')}bps")
+        print(f"  inventory {summary['inventory']:.8f}, max {summary['max_inventory']:.8f}, drift/day {_format(summary['inventory_drift_per_day'], '.8f')}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+import argparse
+import json
+import random
+import time
+from config import Config
+from lib.clock import VirtualClock
+from bot.simulator import SimulatedBinanceClient
+from bot.testnet_mm import TestnetMM
+
+
+class SimulatedTestnetMM(TestnetMM):
+    """
+    TestnetMM against a SimulatedBinanceClient, counting requotes
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.requotes = 0
+
+    def _place_trade(self):
+        self.requotes += 1
+        super()._place_trade()
+
+
+def synthetic_trades(symbol, ticks, price=20000.0, volatility=0.0002, seed=1):
+    """
+    aggTrade messages of a random walk, 10 trades per second
+    """
+    rng = random.Random(seed)
+    for i in range(ticks):
+        price *= 1 + rng.gauss(0, volatility)
+        yield {'e': 'aggTrade', 's': symbol, 'a': i, 'p': f"{price:.2f}", 'q': f"{rng.expovariate(20):.5f}", 'T': 1669812778000 + i * 100}
+
+
+def recorded_trades(path):
+    """
+    aggTrade messages recorded one JSON object per line
+    """
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Runs the engine against a simulated exchange and reports its throughput")
+    parser.add_argument("--trades", help="file of recorded aggTrade messages, one JSON object per line. Synthetic trades if omitted")
+    parser.add_argument("--ticks", type=int, default=100000, help="number of synthetic trades")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    # bot time follows the trades' own timestamps, waits such as the one after cancels cost no real time
+    clock = VirtualClock()
+
+    mm = SimulatedTestnetMM(
+        Config.BASE_ASSET,
+        Config.QUOTE_ASSET,
+        distance_from_mid_price=Config.DISTANCE_FROM_MID_PRICE,
+        price_source="aggTrade",
+        price_min_interval=0,
+        order_response_type=Config.ORDER_RESPONSE_TYPE,
+        spread_policy=Config.SPREAD_POLICY,
+        min_distance_from_mid_price=Config.MIN_DISTANCE_FROM_MID_PRICE,
+        max_distance_from_mid_price=Config.MAX_DISTANCE_FROM_MID_PRICE,
+        server_time_sync_interval=None,
+        rest_client=SimulatedBinanceClient(Config.BASE_ASSET, Config.QUOTE_ASSET, clock=clock),
+        clock=clock
+    )
+    mm.logger.clear_screen = False
+    mm.logger.seconds_between_log_refresh = 5
+    exchange = mm.rest_client
+    exchange.execution_handler = mm.events.put
+    mm._get_asset_filters()
+    mm.keep_alive = True
+
+    trades = recorded_trades(args.trades) if args.trades else synthetic_trades(mm.symbol, args.ticks, seed=args.seed)
+
+    ticks = 0
+    started_at_bot_time = None
+    started_at = time.perf_counter()
+    for msg in trades:
+        clock.advance_to(msg['T'] / 1000)
+        if started_at_bot_time is None:
+            started_at_bot_time = clock.monotonic()
+        exchange.on_trade(msg)
+        mm.events.put(msg)
+        while not mm.events.empty():
+            mm._process_next_event(timeout=0)
+        ticks += 1
+        if not mm.keep_alive:
+            break
+    elapsed = time.perf_counter() - started_at
+
+    snapshot = mm.state.snapshot()
+    print(f"ticks: {ticks} in {elapsed:.2f}s, {ticks / elapsed:.0f} ticks/s, {clock.monotonic() - started_at_bot_time:.0f}s of bot time")
+    print(f"requotes: {mm.requotes}, {mm.requotes / elapsed:.0f} requotes/s")
+    print(f"orders: {snapshot.order_count}, fills: {snapshot.fill_count}, requests: {exchange.request_count}")
+    print(f"balances: {exchange._get_account({})['balances']}")
+
+
+if __name__ == '__main__':
+    main()
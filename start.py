@@ -1,15 +1,55 @@
 from config import Config
 from bot.testnet_mm import TestnetMM
+from bot.health_server import HealthServer
+from bot.profiler import ProfilingControls
+from bot.state_stream import StateStream
 
 
 def main():
-    TestnetMM(
+    mm = TestnetMM(
         Config.BASE_ASSET,
         Config.QUOTE_ASSET,
         Config.API_KEY,
         Config.API_SECRET,
-        distance_from_mid_price=Config.DISTANCE_FROM_MID_PRICE
-    ).run()
+        distance_from_mid_price=Config.DISTANCE_FROM_MID_PRICE,
+        order_gateway=Config.ORDER_GATEWAY,
+        price_source=Config.PRICE_SOURCE,
+        price_min_interval=Config.PRICE_MIN_INTERVAL,
+        mode=Config.MODE,
+        depth_levels=Config.DEPTH_LEVELS,
+        depth_size_ratio=Config.DEPTH_SIZE_RATIO,
+        depth_min_size_change=Config.DEPTH_MIN_SIZE_CHANGE,
+        testnet_api_credentials=Config.API_CREDENTIALS,
+        production_ws_base_urls=Config.PRODUCTION_WS_BASE_URLS,
+        feed_stale_after=Config.FEED_STALE_AFTER,
+        recv_window=Config.RECV_WINDOW,
+        server_time_sync_interval=Config.SERVER_TIME_SYNC_INTERVAL,
+        order_response_type=Config.ORDER_RESPONSE_TYPE,
+        spread_policy=Config.SPREAD_POLICY,
+        min_distance_from_mid_price=Config.MIN_DISTANCE_FROM_MID_PRICE,
+        max_distance_from_mid_price=Config.MAX_DISTANCE_FROM_MID_PRICE,
+        journal_dir=Config.JOURNAL_DIR,
+        trace_file=Config.TRACE_FILE,
+        inventory_target_ratio=Config.INVENTORY_TARGET_RATIO,
+        inventory_size_skew=Config.INVENTORY_SIZE_SKEW,
+        inventory_price_skew=Config.INVENTORY_PRICE_SKEW,
+        websocket_transport=Config.WEBSOCKET_TRANSPORT
+    )
+
+    profiling = ProfilingControls(Config.PROFILE_DIR) if Config.PROFILE_DIR is not None else None
+    if profiling:
+        profiling.install_signal_handlers()
+
+    if Config.HEALTH_PORT is not None:
+        HealthServer(
+            [mm],
+            host=Config.HEALTH_HOST,
+            port=Config.HEALTH_PORT,
+            post_routes=profiling.routes() if profiling else None,
+            routes=StateStream([mm]).routes()
+        ).start()
+
+    mm.run()
 
 
 if __name__ == '__main__':
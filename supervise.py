@@ -0,0 +1,45 @@
+from config import Config
+from bot.supervisor import Supervisor
+
+
+def main():
+    Supervisor(
+        Config.SYMBOLS,
+        workers=Config.WORKERS,
+        engine_options={
+            'testnet_api_key': Config.API_KEY,
+            'testnet_api_secret': Config.API_SECRET,
+            'distance_from_mid_price': Config.DISTANCE_FROM_MID_PRICE,
+            'order_gateway': Config.ORDER_GATEWAY,
+            'price_source': Config.PRICE_SOURCE,
+            'price_min_interval': Config.PRICE_MIN_INTERVAL,
+            'mode': Config.MODE,
+            'depth_levels': Config.DEPTH_LEVELS,
+            'depth_size_ratio': Config.DEPTH_SIZE_RATIO,
+            'depth_min_size_change': Config.DEPTH_MIN_SIZE_CHANGE,
+            'testnet_api_credentials': Config.API_CREDENTIALS,
+            'production_ws_base_urls': Config.PRODUCTION_WS_BASE_URLS,
+            'feed_stale_after': Config.FEED_STALE_AFTER,
+            'recv_window': Config.RECV_WINDOW,
+            'server_time_sync_interval': Config.SERVER_TIME_SYNC_INTERVAL,
+            'order_response_type': Config.ORDER_RESPONSE_TYPE,
+            'spread_policy': Config.SPREAD_POLICY,
+            'min_distance_from_mid_price': Config.MIN_DISTANCE_FROM_MID_PRICE,
+            'max_distance_from_mid_price': Config.MAX_DISTANCE_FROM_MID_PRICE,
+            'journal_dir': Config.JOURNAL_DIR,
+            'trace_file': Config.TRACE_FILE,
+            'inventory_target_ratio': Config.INVENTORY_TARGET_RATIO,
+            'inventory_size_skew': Config.INVENTORY_SIZE_SKEW,
+            'inventory_price_skew': Config.INVENTORY_PRICE_SKEW,
+            'websocket_transport': Config.WEBSOCKET_TRANSPORT,
+        },
+        health_port=Config.HEALTH_PORT,
+        health_host=Config.HEALTH_HOST,
+        profile_dir=Config.PROFILE_DIR,
+        symbol_config_file=Config.SYMBOL_CONFIG_FILE,
+        price_bus=Config.PRICE_BUS
+    ).run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+import pytest
+from lib.binance import BinanceAccountPool
+from tests.binance.mock_responses import MOCK_RESPONSES
+
+base_url = "https://testnet.binance.vision"
+
+
+def test_rate_limit_usage_is_read_from_headers(requests_mock):
+    from lib.binance import BinanceClient
+
+    requests_mock.get(f'{base_url}/api/v3/exchangeInfo', json=MOCK_RESPONSES['getExchangeInfo'],
+                      headers={'X-MBX-USED-WEIGHT-1M': '10', 'X-MBX-ORDER-COUNT-10S': '3'})
+    client = BinanceClient(base_url=base_url)
+    client.request('getExchangeInfo')
+
+    assert client.rate_limit_usage == {'x-mbx-used-weight-1m': 10, 'x-mbx-order-count-10s': 3}
+
+
+def test_pool_requires_credentials():
+    with pytest.raises(ValueError):
+        BinanceAccountPool(base_url, [])
+
+
+def test_routing_keys_are_spread_and_sticky():
+    pool = BinanceAccountPool(base_url, [('key1', 'secret1'), ('key2', 'secret2')])
+
+    btc, eth = pool.client_for('BTCBUSD'), pool.client_for('ETHBUSD')
+    assert btc is not eth
+    assert pool.client_for('BTCBUSD') is btc
+
+
+def test_routing_moves_off_exhausted_account():
+    pool = BinanceAccountPool(base_url, [('key1', 'secret1'), ('key2', 'secret2')], order_limit=50, reserve=0.2)
+
+    first = pool.client_for('BTCBUSD')
+    first.rate_limit_usage['x-mbx-order-count-10s'] = 45
+
+    assert pool.spare_budget(first) == pytest.approx(0.1)
+    assert pool.client_for('BTCBUSD') is not first
+
+
+def test_pooled_gateway_cancels_on_the_placing_account(requests_mock):
+    from bot.order_gateway import PooledRestOrderGateway
+
+    requests_mock.post(f'{base_url}/api/v3/order', json=MOCK_RESPONSES['postOrder'])
+    requests_mock.delete(f'{base_url}/api/v3/openOrders', json=[])
+    pool = BinanceAccountPool(base_url, [('key1', 'secret1'), ('key2', 'secret2')])
+    gateway = PooledRestOrderGateway(pool)
+
+    gateway.place_order({"symbol": "BTCBUSD", "side": "SELL", "type": "LIMIT", "timeInForce": "GTC", "quantity": "0.001", "price": "15000"})
+    gateway.cancel_open_orders("BTCBUSD")
+
+    api_keys = [request.headers['X-MBX-APIKEY'] for request in requests_mock.request_history]
+    assert api_keys == ['key1', 'key1']
+    assert gateway.order_accounts == {}
@@ -0,0 +1,64 @@
+import pytest
+from lib.binance import BinanceClient
+from lib.binance.rest.exceptions import BinanceRestException, BinanceCircuitOpenException
+from lib.clock import VirtualClock
+from tests.binance.mock_responses import MOCK_RESPONSES
+
+base_url = "https://testnet.binance.vision"
+
+
+def test_virtual_clock_moves_only_forward():
+    clock = VirtualClock(1669812778)
+
+    clock.sleep(3600)
+    assert clock.time() == clock.monotonic() == 1669812778 + 3600
+
+    clock.advance_to(1669812778)
+    assert clock.time() == 1669812778 + 3600
+    clock.advance_to(1669812778 + 7200.5)
+    assert clock.time() == 1669812778 + 7200.5
+    assert clock.now().year == 2022
+
+
+def test_virtual_clock_waits_for_events_without_blocking():
+    import queue
+
+    clock = VirtualClock()
+    events = queue.Queue()
+    events.put('event')
+
+    assert clock.wait(events, 1) == 'event'
+    assert clock.monotonic() == 0
+    with pytest.raises(queue.Empty):
+        clock.wait(events, 1)
+    assert clock.monotonic() == 1
+
+
+def test_signed_requests_are_stamped_by_the_client_clock(requests_mock):
+    requests_mock.get(f'{base_url}/api/v3/account', json=MOCK_RESPONSES['getAccount'])
+    client = BinanceClient(base_url=base_url, key="key", secret="secret", clock=VirtualClock(1669812778.5))
+    client.time_offset_ms = 250
+
+    client.request('getAccount')
+
+    assert requests_mock.last_request.qs['timestamp'] == ['1669812778750']
+
+
+def test_retry_backoff_and_open_circuit_run_on_the_client_clock(requests_mock):
+    requests_mock.get(f'{base_url}/api/v3/exchangeInfo', [
+        {'status_code': 503, 'json': {'code': -1000, 'msg': 'unavailable'}},
+        {'status_code': 503, 'json': {'code': -1000, 'msg': 'unavailable'}},
+        {'status_code': 503, 'json': {'code': -1000, 'msg': 'unavailable'}},
+        {'json': MOCK_RESPONSES['getExchangeInfo']},
+    ])
+    clock = VirtualClock()
+    client = BinanceClient(base_url=base_url, circuit_breaker_options={'failure_threshold': 3, 'reset_timeout': 30}, clock=clock)
+
+    with pytest.raises(BinanceRestException):
+        client.request('getExchangeInfo')
+    assert clock.monotonic() > 0
+    with pytest.raises(BinanceCircuitOpenException):
+        client.request('getExchangeInfo')
+
+    clock.advance(30)
+    assert client.request('getExchangeInfo') == MOCK_RESPONSES['getExchangeInfo']
@@ -0,0 +1,72 @@
+from unittest.mock import MagicMock
+from lib.binance import BinanceMultiEndpointWebsocketClient
+
+urls = ['wss://a/ws', 'wss://b/ws']
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def connected_client(**kwargs):
+    client = BinanceMultiEndpointWebsocketClient(ws_base_urls=urls, message_handler=MagicMock(), close_handler=MagicMock(), **kwargs)
+    for url in urls:
+        client.clients[url] = MagicMock()
+        client.active.add(url)
+    return client
+
+
+def agg_trade(trade_id, price='1000'):
+    return {'e': 'aggTrade', 's': 'BTCBUSD', 'a': trade_id, 'p': price}
+
+
+def test_first_copy_wins_and_duplicates_are_dropped():
+    client = connected_client()
+
+    client._on_endpoint_message('wss://b/ws', agg_trade(1))
+    client._on_endpoint_message('wss://a/ws', agg_trade(1))
+    client._on_endpoint_message('wss://a/ws', agg_trade(2))
+    client._on_endpoint_message('wss://a/ws', {'result': None, 'id': 1})
+
+    assert [c.args[0]['a'] for c in client.message_handler.call_args_list] == [1, 2]
+    assert client.stats['wss://b/ws']['first'] == 1
+    assert client.stats['wss://a/ws']['first'] == 1
+
+
+def test_lagging_endpoint_is_dropped():
+    clock = FakeClock()
+    client = connected_client(clock=clock, max_lag=0.1, min_samples=3)
+
+    for trade_id in range(3):
+        client._on_endpoint_message('wss://a/ws', agg_trade(trade_id))
+        clock.now += 0.5
+        client._on_endpoint_message('wss://b/ws', agg_trade(trade_id))
+
+    assert client.active == {'wss://a/ws'}
+    assert client.clients['wss://b/ws'].disconnect.called
+    assert not client.close_handler.called
+
+
+def test_last_endpoint_is_never_dropped_for_lag():
+    clock = FakeClock()
+    client = connected_client(clock=clock, max_lag=0.1, min_samples=1)
+    client.active.discard('wss://a/ws')
+
+    client._seen[('aggTrade', 'BTCBUSD', 1)] = 0.0
+    clock.now = 1.0
+    client._on_endpoint_message('wss://b/ws', agg_trade(1))
+
+    assert client.active == {'wss://b/ws'}
+
+
+def test_close_handler_only_when_all_endpoints_closed():
+    client = connected_client()
+
+    client._on_endpoint_close('wss://a/ws')
+    assert not client.close_handler.called
+    client._on_endpoint_close('wss://b/ws')
+    assert client.close_handler.called
@@ -0,0 +1,148 @@
+import pytest
+import requests
+import requests_mock as rm
+from unittest.mock import MagicMock
+from lib.binance import BinanceClient
+from lib.binance.rest.exceptions import BinanceRestException, BinanceCircuitOpenException
+from lib.binance.rest.policy import RetryPolicy, CircuitBreaker, classify_error, RETRYABLE, RATE_LIMITED, FATAL
+from tests.binance.mock_responses import MOCK_RESPONSES
+
+base_url = "https://testnet.binance.vision"
+
+order = {
+    "symbol": "BTCBUSD",
+    "side": "SELL",
+    "type": "LIMIT",
+    "timeInForce": "GTC",
+    "quantity": "0.001",
+    "price": "15000"
+}
+
+
+def rest_exception(status_code, code):
+    return BinanceRestException('reason', status_code, 'GET', '/', {'code': code, 'msg': ''})
+
+
+def test_classify_error():
+    assert classify_error(requests.exceptions.ConnectionError()) == RETRYABLE
+    assert classify_error(rest_exception(502, -1000)) == RETRYABLE
+    assert classify_error(rest_exception(400, -1021)) == RETRYABLE
+    assert classify_error(rest_exception(429, -1003)) == RATE_LIMITED
+    assert classify_error(rest_exception(400, -2010)) == FATAL
+    assert classify_error(ValueError()) == FATAL
+
+
+def test_ws_api_connection_loss_is_retryable():
+    from lib.binance.websocket.exceptions import BinanceWebsocketApiConnectionException, BinanceWebsocketApiTimeoutException
+
+    assert classify_error(BinanceWebsocketApiConnectionException("ws-api: Not connected")) == RETRYABLE
+    assert classify_error(BinanceWebsocketApiTimeoutException("order.place", "1", 5)) == RETRYABLE
+
+
+def test_retry_delay_is_jittered_and_capped():
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.3, random=lambda: 1.0)
+    assert [policy.delay(attempt, RETRYABLE) for attempt in range(4)] == [0.1, 0.2, 0.3, 0.3]
+    assert RetryPolicy(random=lambda: 0.5).delay(0, RATE_LIMITED) == 0.5
+
+
+def test_transient_errors_are_retried(requests_mock):
+    requests_mock.get(f'{base_url}/api/v3/exchangeInfo', [
+        {'status_code': 503, 'json': {'code': -1000, 'msg': 'unavailable'}},
+        {'json': MOCK_RESPONSES['getExchangeInfo']},
+    ])
+    sleep = MagicMock()
+    client = BinanceClient(base_url=base_url, retry_policy=RetryPolicy(sleep=sleep))
+
+    assert client.request('getExchangeInfo') == MOCK_RESPONSES['getExchangeInfo']
+    assert sleep.call_count == 1
+
+
+def test_gateway_error_pages_are_retried(requests_mock):
+    requests_mock.get(f'{base_url}/api/v3/exchangeInfo', [
+        {'status_code': 502, 'text': '<html><body><h1>502 Bad Gateway</h1></body></html>', 'headers': {'Content-Type': 'text/html'}},
+        {'json': MOCK_RESPONSES['getExchangeInfo']},
+    ])
+    sleep = MagicMock()
+    client = BinanceClient(base_url=base_url, retry_policy=RetryPolicy(sleep=sleep))
+
+    assert client.request('getExchangeInfo') == MOCK_RESPONSES['getExchangeInfo']
+    assert sleep.call_count == 1
+
+
+def test_gateway_error_page_is_reported_with_its_status(requests_mock):
+    requests_mock.get(f'{base_url}/api/v3/exchangeInfo', status_code=502, text='<html>502 Bad Gateway</html>')
+    client = BinanceClient(base_url=base_url, retry_policy=RetryPolicy(sleep=MagicMock()))
+
+    with pytest.raises(BinanceRestException) as err:
+        client.request('getExchangeInfo')
+    assert err.value.status_code == 502
+    assert err.value.code is None
+    assert err.value.details == {'msg': '<html>502 Bad Gateway</html>'}
+    assert classify_error(err.value) == RETRYABLE
+
+
+def test_fatal_errors_are_not_retried(requests_mock):
+    requests_mock.get(f'{base_url}/api/v3/exchangeInfo', status_code=400, json={'code': -1100, 'msg': 'bad'})
+    client = BinanceClient(base_url=base_url, retry_policy=RetryPolicy(sleep=MagicMock()))
+
+    with pytest.raises(BinanceRestException):
+        client.request('getExchangeInfo')
+    assert requests_mock.call_count == 1
+
+
+@rm.Mocker(kw='mock')
+def test_retried_order_keeps_client_order_id_and_recovers_duplicate(**kwargs):
+    kwargs['mock'].post(f'{base_url}/api/v3/order', [
+        {'status_code': 504, 'json': {'code': -1007, 'msg': 'Timeout waiting for response from backend server.'}},
+        {'status_code': 400, 'json': {'code': -2010, 'msg': 'Duplicate order sent.'}},
+    ])
+    existing = dict(MOCK_RESPONSES['postOrder'], time=1669736174076)
+    del existing['transactTime']
+    kwargs['mock'].get(f'{base_url}/api/v3/order', json=existing)
+
+    client = BinanceClient(base_url=base_url, key="key", secret="secret", retry_policy=RetryPolicy(sleep=MagicMock()))
+    res = client.request('postOrder', order)
+
+    client_order_ids = [r.qs['newclientorderid'][0] for r in kwargs['mock'].request_history if r.method == 'POST']
+    assert len(client_order_ids) == 2 and client_order_ids[0] == client_order_ids[1]
+    assert kwargs['mock'].request_history[-1].qs['origclientorderid'][0] == client_order_ids[0]
+    assert res['orderId'] == existing['orderId']
+    assert res['transactTime'] == existing['time']
+
+
+def test_circuit_breaker_opens_and_half_opens():
+    now = [0.0]
+    breaker = CircuitBreaker('postOrder', failure_threshold=2, reset_timeout=30, clock=lambda: now[0])
+
+    breaker.record_failure()
+    breaker.before_request()
+    breaker.record_failure()
+    with pytest.raises(BinanceCircuitOpenException):
+        breaker.before_request()
+
+    now[0] = 31
+    breaker.before_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    now[0] = 62
+    breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_open_circuit_fails_fast(requests_mock):
+    requests_mock.get(f'{base_url}/api/v3/exchangeInfo', status_code=502, json={'code': -1000, 'msg': 'down'})
+    client = BinanceClient(
+        base_url=base_url,
+        retry_policy=RetryPolicy(max_attempts=1),
+        circuit_breaker_options={'failure_threshold': 2}
+    )
+
+    for _ in range(2):
+        with pytest.raises(BinanceRestException):
+            client.request('getExchangeInfo')
+    with pytest.raises(BinanceCircuitOpenException):
+        client.request('getExchangeInfo')
+    assert requests_mock.call_count == 2
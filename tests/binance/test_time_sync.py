@@ -0,0 +1,42 @@
+import hmac
+import hashlib
+from urllib.parse import parse_qsl
+from unittest.mock import MagicMock
+from lib.binance import BinanceClient
+from lib.binance.rest.time_sync import ServerTimeEstimator
+
+
+def test_offset_comes_from_minimum_rtt_sample():
+    clients = [MagicMock(), MagicMock()]
+    # (sent_at, received_at, server_time): the second sample has the smallest round trip
+    samples = [(1000, 1100, 1550), (2000, 2010, 2505), (3000, 3200, 3700)]
+    clients[0].request.side_effect = [{'serverTime': server_time} for _, _, server_time in samples]
+    local_times = iter([t for sent_at, received_at, _ in samples for t in (sent_at, received_at)])
+
+    estimator = ServerTimeEstimator(clients, clock_ms=lambda: next(local_times))
+    estimator.sync()
+
+    assert estimator.offset_ms == 500
+    assert [client.time_offset_ms for client in clients] == [500, 500]
+
+
+def test_signed_querystring_is_built_in_one_pass():
+    client = BinanceClient(key='key', secret='secret', recv_window=3000)
+    client.time_offset_ms = 1000
+
+    querystring = client._signed_querystring({'symbol': 'BTCBUSD', 'price': None})
+    payload, signature = querystring.rsplit('&signature=', 1)
+
+    params = dict(parse_qsl(payload))
+    assert list(params) == ['symbol', 'recvWindow', 'timestamp']
+    assert params['recvWindow'] == '3000'
+    assert signature == hmac.new(b'secret', payload.encode(), hashlib.sha256).hexdigest()
+
+
+def test_signing_key_follows_secret_changes():
+    client = BinanceClient(key='key', secret='secret')
+    first = client._get_sign('a=1')
+    client.secret = 'other'
+
+    assert client._get_sign('a=1') != first
+    assert client._get_sign('a=1') == hmac.new(b'other', b'a=1', hashlib.sha256).hexdigest()
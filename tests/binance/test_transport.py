@@ -0,0 +1,93 @@
+import socket
+import time
+import pytest
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_run_forever_options():
+    from lib.binance.websocket.transport import TransportProfile
+
+    options = TransportProfile(rcvbuf=1 << 20, ping_interval=20, ping_timeout=10).run_forever_options()
+
+    assert options['sockopt'] == [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20),
+    ]
+    assert (options['ping_interval'], options['ping_timeout']) == (20, 10)
+    assert TransportProfile(tcp_nodelay=False).sockopt() == [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 0)]
+
+
+def test_connection_stats():
+    from lib.binance.websocket.transport import ConnectionStats
+
+    stats = ConnectionStats(alpha=0.5)
+    stats.on_message(100, 0.2)
+    stats.on_message(50, 0.4)
+    stats.on_pong(3.0)
+    stats.on_pong(None)
+
+    assert stats.as_dict() == {
+        'messages': 2,
+        'bytes': 150,
+        'pongs': 2,
+        'handler_delay_ms': {'last': 0.4, 'ewma': pytest.approx(0.3), 'max': 0.4},
+        'ping_rtt_ms': {'last': 3.0, 'ewma': 3.0, 'max': 3.0},
+    }
+
+
+@pytest.fixture
+def stub_feed():
+    from lib.binance.websocket.stub_feed import StubFeedServer
+
+    trades = [{'e': 'aggTrade', 's': 'BTCBUSD', 'a': i, 'p': '20000.00', 'q': '0.01'} for i in range(3)]
+    server = StubFeedServer(lambda: iter(trades)).start()
+    yield server
+    server.stop()
+
+
+def test_profile_is_applied_and_traffic_counted(stub_feed):
+    from lib.binance.websocket.client import BinanceWebsocketClient
+    from lib.binance.websocket.transport import TransportProfile
+
+    received = []
+    client = BinanceWebsocketClient(
+        ws_base_url=stub_feed.url,
+        topics=[BinanceWebsocketClient.agg_trade('btcbusd')],
+        message_handler=received.append,
+        transport=TransportProfile(rcvbuf=65536, ping_interval=0.2, ping_timeout=0.1)
+    )
+    client.connect()
+    try:
+        assert wait_until(lambda: len(received) == 4 and client.stats.pongs > 0)
+
+        sock = client.ws.sock.sock
+        assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) >= 65536
+    finally:
+        client.disconnect()
+
+    stats = client.connection_stats()['default']
+    # the subscription acknowledgement and 3 trades
+    assert stats['messages'] == 4
+    assert stats['bytes'] > 0
+    assert stats['handler_delay_ms']['max'] >= 0
+    assert stats['ping_rtt_ms']['last'] >= 0
+
+
+def test_engine_passes_its_transport_profile_to_every_connection():
+    from bot.testnet_mm import TestnetMM
+    from lib.binance.websocket.transport import TransportProfile
+
+    mm = TestnetMM(order_gateway="ws-api", websocket_transport={'rcvbuf': 1 << 20, 'ping_interval': 20})
+
+    assert mm.websocket_transport == TransportProfile(rcvbuf=1 << 20, ping_interval=20)
+    assert mm.order_gateway.ws_api_client.transport is mm.websocket_transport
+    assert mm.health()['websocket'] == {'testnet ws-api': mm.order_gateway.ws_api_client.stats.as_dict()}
@@ -0,0 +1,95 @@
+import json
+import threading
+import pytest
+from unittest.mock import MagicMock
+from lib.binance import BinanceWebsocketApiClient
+from lib.binance.websocket.exceptions import BinanceWebsocketApiException, BinanceWebsocketApiTimeoutException, BinanceWebsocketApiConnectionException
+
+
+def connected_client(respond=None, timeout=1):
+    client = BinanceWebsocketApiClient(key="key", secret="secret", timeout=timeout)
+    client.ws = MagicMock()
+    client._connected.set()
+
+    def send(data):
+        request = json.loads(data)
+        client.sent = request
+        if respond:
+            response = respond(request)
+            threading.Thread(target=lambda: client._on_message(None, json.dumps(response))).start()
+
+    client.ws.send.side_effect = send
+    return client
+
+
+def test_request_is_correlated_by_id():
+    client = connected_client(lambda req: {"id": req["id"], "status": 200, "result": {"orderId": 1}})
+    assert client.request("order.place", {"symbol": "BTCBUSD"}) == {"orderId": 1}
+
+
+def test_late_response_for_other_request_is_ignored():
+    client = connected_client(lambda req: {"id": "unknown", "status": 200, "result": {}}, timeout=0.05)
+    with pytest.raises(BinanceWebsocketApiTimeoutException):
+        client.request("order.place", {"symbol": "BTCBUSD"})
+    assert client._pending == {}
+
+
+def test_error_response_raises():
+    client = connected_client(lambda req: {"id": req["id"], "status": 400, "error": {"code": -2011, "msg": "Unknown order sent."}})
+    with pytest.raises(BinanceWebsocketApiException) as e_info:
+        client.request("openOrders.cancelAll", {"symbol": "BTCBUSD"}, is_signed=True)
+    assert e_info.value.code == -2011
+
+
+def test_signed_request_includes_api_key_and_signature():
+    client = connected_client(lambda req: {"id": req["id"], "status": 200, "result": {}})
+    client.request("order.place", {"symbol": "BTCBUSD"}, is_signed=True)
+    assert client.sent["params"]["apiKey"] == "key"
+    assert "timestamp" in client.sent["params"]
+    assert len(client.sent["params"]["signature"]) == 64
+
+
+def test_request_when_not_connected():
+    client = BinanceWebsocketApiClient()
+    with pytest.raises(BinanceWebsocketApiConnectionException):
+        client.request("ping")
+
+
+def test_pending_requests_fail_on_close():
+    client = connected_client(timeout=1)
+    client.ws.send.side_effect = lambda data: threading.Thread(target=lambda: client._on_close(client.ws, 1006, "")).start()
+    with pytest.raises(BinanceWebsocketApiException):
+        client.request("order.place", {"symbol": "BTCBUSD"})
+
+
+def test_dropped_connection_is_reported_and_made_again_by_the_next_request():
+    close_handler = MagicMock()
+    client = connected_client(lambda req: {"id": req["id"], "status": 200, "result": {}})
+    client.close_handler = close_handler
+    client._on_error(client.ws, ConnectionResetError())
+    client._on_close(client.ws, 1006, "")
+    close_handler.assert_called_once()
+
+    client.connect = MagicMock(side_effect=client._connected.set)
+    assert client.request("order.place", {"symbol": "BTCBUSD"}) == {}
+    client.connect.assert_called_once()
+
+
+def test_disconnect_does_not_reconnect():
+    close_handler = MagicMock()
+    client = connected_client()
+    client.close_handler = close_handler
+    client.connect = MagicMock()
+    client.disconnect()
+    client._on_close(client.ws, 1000, "")
+
+    with pytest.raises(BinanceWebsocketApiConnectionException):
+        client.request("order.place", {"symbol": "BTCBUSD"})
+    client.connect.assert_not_called()
+    close_handler.assert_not_called()
+
+
+def test_replaced_connection_closing_is_ignored():
+    client = connected_client()
+    client._on_close(MagicMock(), 1000, "")
+    assert client.connected
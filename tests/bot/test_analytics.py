@@ -0,0 +1,78 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+
+def fill(order_id, side, price, qty, time, is_maker=True):
+    return {'orderId': order_id, 'side': side, 'price': price, 'qty': qty, 'time': time, 'isMaker': is_maker}
+
+
+def order(order_id, side, price, qty, time):
+    return {'orderId': order_id, 'side': side, 'price': price, 'origQty': qty, 'transactTime': time}
+
+
+@pytest.fixture
+def journal(tmp_path):
+    from bot.journal import TradeJournal
+
+    journal = TradeJournal(str(tmp_path), 'BTCBUSD')
+    journal.record_order(order(1, 'BUY', '99', '1', 1000), '100')
+    journal.record_order(order(2, 'SELL', '101', '1', 1000), '100')
+    journal.record_order(order(3, 'BUY', '98', '2', 5000), '100')
+    journal.record_fill(fill(1, 'BUY', '99', '0.5', 3000), '100')
+    journal.record_fill(fill(1, 'BUY', '99', '0.5', 4000), '100')
+    journal.record_fill(fill(2, 'SELL', '101', '1', 11000), '100')
+    journal.close()
+    return tmp_path
+
+
+def test_journal_is_memory_mapped_as_columns(journal):
+    from bot.analytics import load_journal
+
+    orders, fills = load_journal(str(journal))['BTCBUSD']
+
+    assert isinstance(orders, np.memmap)
+    assert orders['order_id'].tolist() == [1, 2, 3]
+    assert orders['side'].tolist() == [1, -1, 1]
+    assert fills['qty'].tolist() == [0.5, 0.5, 1.0]
+
+
+def test_partially_written_rows_are_ignored(journal):
+    from bot.analytics import load_journal
+
+    with open(journal / 'BTCBUSD' / 'fills.bin', 'ab') as f:
+        f.write(b'\x01\x02\x03')
+
+    _, fills = load_journal(str(journal))['BTCBUSD']
+    assert len(fills) == 3
+
+
+def test_summary(journal):
+    from bot.analytics import load_journal, summarize, time_to_fill
+
+    orders, fills = load_journal(str(journal))['BTCBUSD']
+
+    assert sorted(time_to_fill(orders, fills).tolist()) == [2.0, 10.0]
+
+    summary = summarize(orders, fills)
+    assert summary['orders'] == 3
+    assert summary['fills'] == 3
+    assert summary['fill_rate'] == pytest.approx(2 / 3)
+    assert summary['filled_qty_ratio'] == pytest.approx(0.5)
+    assert summary['realized_spread_bps'] == pytest.approx(100)
+    assert summary['inventory'] == pytest.approx(0)
+    assert summary['max_inventory'] == pytest.approx(1)
+
+
+def test_summary_without_fills(tmp_path):
+    from bot.journal import TradeJournal
+    from bot.analytics import load_journal, summarize
+
+    journal = TradeJournal(str(tmp_path), 'ETHBUSD')
+    journal.record_order(order(1, 'BUY', '99', '1', 1000), '100')
+    journal.close()
+
+    summary = summarize(*load_journal(str(tmp_path))['ETHBUSD'])
+    assert summary['fill_rate'] == 0
+    assert summary['time_to_fill']['p50'] is None
+    assert summary['realized_spread_bps'] is None
@@ -0,0 +1,104 @@
+import pytest
+from decimal import Decimal
+from unittest.mock import MagicMock
+from tests.bot.mock_responses import MOCK_RESPONSES
+
+
+def snapshot(last_update_id=100):
+    return {
+        'lastUpdateId': last_update_id,
+        'bids': [['999.00', '1.0'], ['998.00', '2.0'], ['997.00', '3.0']],
+        'asks': [['1001.00', '1.0'], ['1002.00', '2.0'], ['1003.00', '3.0']]
+    }
+
+
+def depth_update(first_id, last_id, bids=[], asks=[]):
+    return {'e': 'depthUpdate', 's': 'BTCBUSD', 'U': first_id, 'u': last_id, 'b': bids, 'a': asks}
+
+
+def test_order_book_side_is_sorted():
+    from bot.order_book import OrderBookSide
+
+    bids = OrderBookSide(descending=True)
+    for price in ['5', '1', '3']:
+        bids.update(Decimal(price), Decimal('1'))
+    bids.update(Decimal('3'), Decimal('0'))
+
+    assert bids.top(2) == [(Decimal('5'), Decimal('1')), (Decimal('1'), Decimal('1'))]
+
+
+def test_buffered_events_are_replayed_after_snapshot():
+    from bot.order_book import LocalOrderBook
+
+    book = LocalOrderBook('BTCBUSD')
+    assert book.apply_diff(depth_update(95, 100, bids=[['999.00', '5.0']])) is False
+    book.apply_diff(depth_update(101, 102, bids=[['999.50', '1.0']], asks=[['1001.00', '0']]))
+    book.apply_snapshot(snapshot())
+
+    assert book.last_update_id == 102
+    assert book.bids.top(1) == [(Decimal('999.50'), Decimal('1.0'))]
+    assert book.bids.top(2)[1] == (Decimal('999.00'), Decimal('1.0'))
+    assert book.asks.top(1) == [(Decimal('1002.00'), Decimal('2.0'))]
+
+
+def test_gap_marks_book_out_of_sync():
+    from bot.order_book import LocalOrderBook, OrderBookOutOfSyncException
+
+    book = LocalOrderBook('BTCBUSD')
+    book.apply_snapshot(snapshot())
+    with pytest.raises(OrderBookOutOfSyncException):
+        book.apply_diff(depth_update(105, 106))
+    assert not book.synced
+
+
+def test_depth_mirror_resyncs_on_gap():
+    from bot.depth_mirror import DepthMirror
+
+    rest_client = MagicMock()
+    rest_client.request.return_value = snapshot()
+    mirror = DepthMirror('BTCBUSD', rest_client, levels=2)
+
+    assert mirror.on_depth_update(depth_update(101, 101))
+    assert rest_client.request.call_count == 1
+
+    rest_client.request.return_value = snapshot(200)
+    assert mirror.on_depth_update(depth_update(150, 201))
+    assert rest_client.request.call_count == 2
+    assert mirror.book.last_update_id == 201
+
+
+def test_depth_mirror_plans_only_meaningful_changes():
+    from bot.depth_mirror import DepthMirror
+
+    mirror = DepthMirror('BTCBUSD', MagicMock(), levels=1, min_size_change='0.1', min_interval=0)
+    mirror.book.apply_snapshot(snapshot())
+
+    to_cancel, to_place = mirror.plan()
+    assert to_cancel == []
+    assert to_place == [('BUY', Decimal('999.00'), Decimal('1.0')), ('SELL', Decimal('1001.00'), Decimal('1.0'))]
+    for side, price, qty in to_place:
+        mirror.record_placed(side, price, qty, f'{side}-{price}')
+
+    mirror.book.apply_diff(depth_update(101, 101, bids=[['999.00', '1.05']], asks=[['1001.00', '2.0']]))
+    to_cancel, to_place = mirror.plan()
+    assert [order['orderId'] for order in to_cancel] == ['SELL-1001.00']
+    assert to_place == [('SELL', Decimal('1001.00'), Decimal('2.0'))]
+
+
+def test_mirror_mode_places_levels_on_testnet(requests_mock):
+    from bot.testnet_mm import TestnetMM
+
+    requests_mock.get('https://testnet.binance.vision/api/v3/exchangeInfo', json=MOCK_RESPONSES['getExchangeInfo'])
+    requests_mock.get('https://api.binance.com/api/v3/depth', json=snapshot())
+
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret', mode="mirror", depth_levels=1, depth_size_ratio="1")
+    mm._get_asset_filters()
+    mm._record_last_price = MagicMock()
+    mm._place_bid = MagicMock(return_value={'orderId': 1})
+    mm._place_ask = MagicMock(return_value={'orderId': 2})
+
+    mm._message_handler(depth_update(101, 101))
+
+    mm._place_bid.assert_called_with('1.000000', '999.00')
+    mm._place_ask.assert_called_with('1.000000', '1001.00')
+    assert len(mm.depth_mirror.mirrored) == 2
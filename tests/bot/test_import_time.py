@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# cumulative `python -X importtime` budget in milliseconds, best of 3 runs.
+# Generous against machine noise, they catch a new heavy dependency or work done at import
+IMPORT_BUDGETS_MS = {
+    'bot.testnet_mm': 400,
+    'start': 400,
+    'supervise': 150,
+    'report': 400,
+    'bot.journal': 25,
+    'bot.symbol_config': 80,
+    'lib.binance.rest.exceptions': 25,
+}
+
+# modules that must not be loaded by importing the key, only once they are used
+DEFERRED_IMPORTS = {
+    'bot.testnet_mm': ['websocket'],
+    'supervise': ['requests', 'websocket', 'bot.testnet_mm', 'bot.logger'],
+    'report': ['requests', 'websocket', 'bot.logger'],
+    'bot.journal': ['numpy', 'requests', 'websocket'],
+    'lib.binance.rest.exceptions': ['requests', 'websocket'],
+}
+
+
+def import_time_ms(module):
+    res = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'], cwd=ROOT, capture_output=True, text=True, check=True)
+    for line in res.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        _, cumulative, name = line.split('|')
+        if name.strip() == module and not name.startswith('  '):
+            return int(cumulative) / 1000
+    raise AssertionError(f"{module} not in the import time report")
+
+
+def loaded_modules(module, candidates):
+    code = f'import sys, {module}; print(" ".join(m for m in {candidates!r} if m in sys.modules))'
+    res = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return res.stdout.split()
+
+
+@pytest.mark.parametrize('module, budget', IMPORT_BUDGETS_MS.items())
+def test_import_time_budget(module, budget):
+    if module == 'report':
+        pytest.importorskip('numpy')
+
+    assert min(import_time_ms(module) for _ in range(3)) < budget
+
+
+@pytest.mark.parametrize('module, deferred', DEFERRED_IMPORTS.items())
+def test_imports_are_deferred(module, deferred):
+    assert loaded_modules(module, deferred) == []
+
+
+def test_logger_is_created_on_first_use():
+    code = 'import logging, bot.testnet_mm; print(len(logging.getLogger("TestnetMM").handlers))'
+    res = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+    assert res.stdout.strip() == '0'
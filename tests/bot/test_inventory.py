@@ -0,0 +1,82 @@
+import pytest
+from decimal import Decimal
+
+
+def test_imbalance():
+    from bot.inventory import InventoryManager
+
+    inventory = InventoryManager()
+
+    assert inventory.update('1', '1000', Decimal('1000')) == 0
+    assert inventory.update('0', '1000', Decimal('1000')) == -1
+    assert inventory.update('1', '0', Decimal('1000')) == 1
+    assert inventory.update('3', '1000', Decimal('1000')) == Decimal('0.5')
+
+
+def test_imbalance_against_an_uneven_target():
+    from bot.inventory import InventoryManager
+
+    inventory = InventoryManager(target_ratio='0.2')
+
+    assert inventory.update('1', '4000', Decimal('1000')) == 0
+    assert inventory.update('1', '9000', Decimal('1000')) == Decimal('-0.5')
+    assert inventory.update('6', '4000', Decimal('1000')) == Decimal('0.5')
+
+
+def test_balanced_quotes_are_symmetric():
+    from bot.inventory import InventoryManager
+
+    (bid_qty, bid_price), (ask_qty, ask_price) = InventoryManager().quotes('2', '2000', Decimal('1000'), Decimal('0.01'))
+
+    # half of each asset, a full fill leaves the other half
+    assert (bid_qty, ask_qty) == (1, 1)
+    assert (bid_price, ask_price) == (990, 1010)
+
+
+def test_long_base_enlarges_and_tightens_the_ask():
+    from bot.inventory import InventoryManager
+
+    (bid_qty, bid_price), (ask_qty, ask_price) = InventoryManager().quotes('3', '1000', Decimal('1000'), Decimal('0.01'))
+
+    # selling 1 of 3 restores the 2000/2000 target
+    assert ask_qty == 1
+    assert bid_qty == Decimal('0.5')
+    assert ask_price == pytest.approx(1007.5)
+    assert bid_price == pytest.approx(987.5)
+
+
+def test_one_sided_inventory_quotes_only_the_rebalancing_side():
+    from bot.inventory import InventoryManager
+
+    (bid_qty, _), (ask_qty, _) = InventoryManager().quotes('0', '10000', Decimal('1000'), Decimal('0.01'))
+
+    assert ask_qty == 0
+    assert bid_qty == 5
+
+
+def test_without_skew_sizes_are_capped_by_balances_only():
+    from bot.inventory import InventoryManager
+
+    inventory = InventoryManager(size_skew='0', price_skew='0')
+    (bid_qty, bid_price), (ask_qty, ask_price) = inventory.quotes('1', '10000', Decimal('1000'), Decimal('0.01'))
+
+    assert bid_qty == pytest.approx(2.75)
+    assert ask_qty == Decimal('0.5')
+    assert (bid_price, ask_price) == (990, 1010)
+
+
+@pytest.mark.parametrize('base_qty, quote_qty', [('2', '2000'), ('3', '1000'), ('1', '10000'), ('0.2', '1000')])
+def test_both_sides_stay_funded_after_a_full_fill(base_qty, quote_qty):
+    from bot.inventory import InventoryManager
+
+    inventory = InventoryManager(target_ratio='0.4')
+    price, distance = Decimal('1000'), Decimal('0.01')
+    (bid_qty, bid_price), (ask_qty, ask_price) = inventory.quotes(base_qty, quote_qty, price, distance)
+
+    for base_after, quote_after in (
+        (Decimal(base_qty) + bid_qty, Decimal(quote_qty) - bid_qty * bid_price),
+        (Decimal(base_qty) - ask_qty, Decimal(quote_qty) + ask_qty * ask_price),
+    ):
+        (bid_after, _), (ask_after, _) = inventory.quotes(base_after, quote_after, price, distance)
+        assert bid_after > 0 and ask_after > 0
+        assert -1 < inventory.imbalance < 1
@@ -0,0 +1,105 @@
+import pytest
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+
+def test_window_expires_old_trades_and_keeps_vwap():
+    from bot.market_stats import MarketStats
+
+    stats = MarketStats(window=10)
+    stats.update('100', '1', 0)
+    stats.update('102', '1', 5)
+    assert stats.vwap() == pytest.approx(101)
+
+    stats.update('104', '2', 12)
+
+    assert len(stats.trades) == 2
+    assert stats.vwap() == pytest.approx((102 + 104 * 2) / 3)
+
+
+def test_ring_buffer_is_bounded():
+    from bot.market_stats import MarketStats
+
+    stats = MarketStats(window=1000, max_trades=3)
+    for i in range(10):
+        stats.update('100', '1', i)
+
+    assert len(stats.trades) == 3
+    assert stats.trades.volume == pytest.approx(3)
+
+
+def test_trade_rate():
+    from bot.market_stats import MarketStats
+
+    stats = MarketStats(window=10)
+    for i in range(21):
+        stats.update('100', '1', i * 0.5)
+
+    assert stats.trade_rate() == pytest.approx(2)
+
+
+def test_volatility_follows_returns():
+    from bot.market_stats import MarketStats
+
+    quiet, volatile = MarketStats(), MarketStats()
+    for i in range(100):
+        quiet.update('100' if i % 2 else '100.01', '1', i)
+        volatile.update('100' if i % 2 else '101', '1', i)
+
+    assert quiet.volatility() == 0 or quiet.volatility() < volatile.volatility()
+    assert volatile.volatility() > 0
+
+
+def test_spread_policy_uses_default_distance_until_warmed_up():
+    from bot.market_stats import MarketStats, SpreadPolicy
+
+    policy = SpreadPolicy('0.01', min_samples=20)
+    stats = MarketStats()
+    stats.update('100', '1', 0)
+
+    assert policy.distance(stats) == Decimal('0.01')
+
+
+def test_spread_policy_is_bounded():
+    from bot.market_stats import MarketStats, SpreadPolicy
+
+    policy = SpreadPolicy('0.01', min_distance='0.001', max_distance='0.05', min_samples=5)
+    quiet, volatile = MarketStats(), MarketStats()
+    for i in range(50):
+        quiet.update('100', '1', i)
+        volatile.update('100' if i % 2 else '120', '1', i)
+
+    assert policy.distance(quiet) == Decimal('0.001')
+    assert policy.distance(volatile) == Decimal('0.05')
+
+
+def test_spread_policy_requotes_when_target_moves():
+    from bot.market_stats import MarketStats, SpreadPolicy
+
+    policy = SpreadPolicy('0.01', min_distance='0.001', min_samples=5)
+    stats = MarketStats()
+    for i in range(50):
+        stats.update('100', '1', i)
+
+    assert policy.should_requote(Decimal('0.01'), stats)
+    assert not policy.should_requote(Decimal('0.001'), stats)
+
+
+def test_adaptive_engine_feeds_stats_and_requotes_off_target_quotes():
+    from bot.testnet_mm import TestnetMM
+
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret', price_source='mid', spread_policy='adaptive')
+    mm.state.production_last_price = '100'
+    mm.state.open_orders = {'bids': [{'orderId': 1, 'price': '99'}], 'asks': [{'orderId': 2, 'price': '101'}]}
+    mm.quoted_distance = Decimal('0.01')
+    mm._place_trade = MagicMock()
+
+    for i in range(30):
+        mm._message_handler({'e': 'aggTrade', 's': 'BTCBUSD', 'a': i, 'p': '100', 'q': '1', 'T': i * 1000})
+
+    assert mm.market_stats.samples == 29
+    assert mm._place_trade.call_count == 0
+
+    mm._trade()
+    assert mm._place_trade.called
+    assert mm.health()['market']['distance_from_mid_price'] == '0.001'
@@ -0,0 +1,107 @@
+import pytest
+from unittest.mock import MagicMock
+from tests.bot.mock_responses import MOCK_RESPONSES
+
+
+def test_rest_gateway_places_orders_over_rest(requests_mock):
+    from lib.binance import BinanceClient
+    from bot.order_gateway import RestOrderGateway
+
+    requests_mock.post('https://testnet.binance.vision/api/v3/order', json=MOCK_RESPONSES['postOrderBuySuccess'])
+    gateway = RestOrderGateway(BinanceClient('https://testnet.binance.vision', 'key', 'secret'))
+
+    assert gateway.place_order({
+        "symbol": "BTCBUSD",
+        "side": "BUY",
+        "type": "LIMIT",
+        "timeInForce": "GTC",
+        "quantity": "0.001",
+        "price": "15000"
+    }) == MOCK_RESPONSES['postOrderBuySuccess']
+
+
+def test_ws_api_gateway_uses_signed_requests():
+    from bot.order_gateway import WebsocketApiOrderGateway
+
+    client = MagicMock()
+    gateway = WebsocketApiOrderGateway(client)
+    gateway.place_order({"symbol": "BTCBUSD"})
+    client.request.assert_called_with("order.place", {"symbol": "BTCBUSD"}, is_signed=True)
+
+    gateway.cancel_open_orders("BTCBUSD")
+    client.request.assert_called_with("openOrders.cancelAll", {"symbol": "BTCBUSD"}, is_signed=True)
+
+
+def test_ws_api_gateway_cancels_over_fallback_when_disconnected():
+    from bot.order_gateway import WebsocketApiOrderGateway
+    from lib.binance.websocket.exceptions import BinanceWebsocketApiConnectionException, BinanceWebsocketApiTimeoutException
+
+    client = MagicMock()
+    fallback = MagicMock()
+    gateway = WebsocketApiOrderGateway(client, fallback=fallback)
+
+    client.request.side_effect = BinanceWebsocketApiConnectionException("ws-api: Not connected")
+    gateway.cancel_open_orders("BTCBUSD")
+    fallback.cancel_open_orders.assert_called_with("BTCBUSD")
+
+    client.request.side_effect = BinanceWebsocketApiTimeoutException("order.cancel", "2", 5)
+    gateway.cancel_order("BTCBUSD", 1)
+    fallback.cancel_order.assert_called_with("BTCBUSD", 1)
+
+    # orders are never placed twice
+    with pytest.raises(BinanceWebsocketApiTimeoutException):
+        gateway.place_order({"symbol": "BTCBUSD"})
+    fallback.place_order.assert_not_called()
+
+
+def test_terminate_cancels_over_rest_when_ws_api_is_down(requests_mock):
+    from bot.testnet_mm import TestnetMM
+    from lib.binance.websocket.exceptions import BinanceWebsocketApiConnectionException
+
+    requests_mock.delete('https://testnet.binance.vision/api/v3/openOrders', json=[])
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret', order_gateway="ws-api")
+    mm._timeout = MagicMock()
+    mm.order_gateway.ws_api_client.request = MagicMock(side_effect=BinanceWebsocketApiConnectionException("testnet ws-api: Not connected"))
+
+    mm.terminate()
+    assert requests_mock.last_request.method == 'DELETE'
+    assert requests_mock.last_request.qs['symbol'] == ['btcbusd']
+
+
+def test_ws_api_connection_loss_reconnects_on_the_engine_thread():
+    from bot.testnet_mm import TestnetMM
+    from lib.binance.websocket.exceptions import BinanceWebsocketApiConnectionException
+
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret', order_gateway="ws-api")
+    mm.keep_alive = True
+    mm.order_gateway.connect = MagicMock(side_effect=BinanceWebsocketApiConnectionException("testnet ws-api: Unable to connect"))
+
+    mm.order_gateway.ws_api_client.close_handler()
+    mm._process_next_event(timeout=0)
+    mm.order_gateway.connect.assert_called_once()
+    assert mm.keep_alive
+
+
+def test_testnet_mm_accepts_any_gateway():
+    from bot.testnet_mm import TestnetMM
+    from bot.order_gateway import RestOrderGateway, WebsocketApiOrderGateway
+
+    assert isinstance(TestnetMM('BTC', 'BUSD', 'key', 'secret').order_gateway, RestOrderGateway)
+    assert isinstance(TestnetMM('BTC', 'BUSD', 'key', 'secret', order_gateway="ws-api").order_gateway, WebsocketApiOrderGateway)
+
+    gateway = MagicMock()
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret', order_gateway=gateway)
+    mm._timeout = MagicMock()
+    mm._cancel_open_orders()
+    gateway.cancel_open_orders.assert_called_with('BTCBUSD')
+
+
+def test_incomplete_gateway_fails_on_construction():
+    from bot.order_gateway import OrderGateway
+
+    class PlaceOnlyGateway(OrderGateway):
+        def place_order(self, params):
+            return {}
+
+    with pytest.raises(TypeError):
+        PlaceOnlyGateway()
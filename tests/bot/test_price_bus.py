@@ -0,0 +1,184 @@
+import multiprocessing
+import pytest
+from unittest.mock import MagicMock
+
+
+@pytest.fixture
+def bus(tmp_path):
+    from bot.price_bus import PriceBus
+
+    bus = PriceBus.create(['btcbusd', 'ETHBUSD'], path=str(tmp_path / 'prices'))
+    yield bus
+    bus.close()
+
+
+def test_read_before_first_trade(bus):
+    assert bus.symbols == ['BTCBUSD', 'ETHBUSD']
+    assert bus.read('BTCBUSD') is None
+    assert bus.sequence('BTCBUSD') == 0
+
+
+def test_publish_and_read(bus):
+    bus.publish('BTCBUSD', '16500.01000000', '0.00100000', 1669812778000, 7)
+    bus.publish('BTCBUSD', '16500.02000000', '0.00200000', 1669812778001, 8)
+
+    assert bus.read('BTCBUSD') == (4, '16500.02000000', '0.00200000', 1669812778001, 8)
+    assert bus.read('ETHBUSD') is None
+
+
+def test_slots_do_not_share_cache_lines(bus):
+    from bot.price_bus import SLOT_SIZE
+
+    offsets = sorted(bus.slots.values())
+    assert offsets[0] % SLOT_SIZE == 0
+    assert offsets[1] - offsets[0] == SLOT_SIZE
+
+
+def test_attached_bus_sees_published_trades(bus):
+    from bot.price_bus import PriceBus
+
+    other = PriceBus.attach(bus.path)
+    bus.publish('ETHBUSD', '1200.00', '1.5', 1669812778000, 1)
+
+    assert other.symbols == bus.symbols
+    assert other.read('ETHBUSD') == (2, '1200.00', '1.5', 1669812778000, 1)
+    other.close()
+
+
+def test_attach_rejects_other_files(tmp_path):
+    from bot.price_bus import PriceBus
+
+    path = tmp_path / 'other'
+    path.write_bytes(b'\0' * 256)
+    with pytest.raises(ValueError):
+        PriceBus.attach(str(path))
+
+
+def test_owner_unlinks_on_close(tmp_path):
+    import os
+    from bot.price_bus import PriceBus
+
+    bus = PriceBus.create(['BTCBUSD'], path=str(tmp_path / 'prices'))
+    bus.close()
+    assert not os.path.exists(bus.path)
+
+
+def test_writer_stopped_halfway(bus):
+    from bot.price_bus import SEQUENCE
+
+    bus.publish('BTCBUSD', '16500.00', '0.001', 1669812778000, 1)
+    SEQUENCE.pack_into(bus.buffer, bus.slots['BTCBUSD'], 3)
+
+    # readers give up instead of spinning forever, the next writer carries on from an even sequence
+    assert bus.read('BTCBUSD') is None
+    bus.publish('BTCBUSD', '16501.00', '0.002', 1669812778001, 2)
+    assert bus.read('BTCBUSD') == (6, '16501.00', '0.002', 1669812778001, 2)
+
+
+def test_reader_emits_new_trades_as_agg_trades(bus):
+    from bot.price_bus import PriceBusReader
+
+    handler = MagicMock()
+    reader = PriceBusReader(bus.path, 'btcbusd', message_handler=handler)
+    reader.bus = bus
+
+    assert not reader.poll()
+    bus.publish('BTCBUSD', '16500.00', '0.001', 1669812778000, 1)
+    bus.publish('BTCBUSD', '16501.00', '0.002', 1669812778001, 2)
+    assert reader.poll()
+    assert not reader.poll()
+
+    # conflated into the latest trade
+    handler.assert_called_once_with({'e': 'aggTrade', 's': 'BTCBUSD', 'a': 2, 'p': '16501.00', 'q': '0.002', 'T': 1669812778001})
+    assert reader.connection_stats() == {'price bus': {'messages': 1, 'sequence': 4}}
+
+
+def test_reader_skips_the_trade_on_the_bus_when_connecting(bus):
+    from bot.price_bus import PriceBusReader
+
+    handler = MagicMock()
+    bus.publish('BTCBUSD', '16500.00', '0.001', 1669812778000, 1)
+    reader = PriceBusReader(bus.path, 'BTCBUSD', message_handler=handler, poll_interval=60)
+    reader.connect()
+    mapping = reader.bus.mapping
+    try:
+        assert not reader.poll()
+        bus.publish('BTCBUSD', '16501.00', '0.002', 1669812778001, 2)
+        assert reader.poll()
+    finally:
+        reader.disconnect()
+
+    handler.assert_called_once_with({'e': 'aggTrade', 's': 'BTCBUSD', 'a': 2, 'p': '16501.00', 'q': '0.002', 'T': 1669812778001})
+    # reconnects don't leak mappings
+    assert mapping.closed
+    assert not reader.thread.is_alive()
+
+
+def test_reader_rejects_unpublished_symbol(bus):
+    from bot.price_bus import PriceBusReader
+
+    with pytest.raises(ValueError):
+        PriceBusReader(bus.path, 'BNBBUSD').connect()
+
+
+def _publish_from_child(path):
+    from bot.price_bus import PriceBus
+
+    bus = PriceBus.attach(path)
+    for i in range(1000):
+        bus.publish('ETHBUSD', f"{1200 + i}.00", '1.0', 1669812778000 + i, i)
+    bus.close()
+
+
+def test_trades_published_by_another_process(bus):
+    process = multiprocessing.get_context("spawn").Process(target=_publish_from_child, args=(bus.path,))
+    process.start()
+    process.join(30)
+
+    assert process.exitcode == 0
+    assert bus.read('ETHBUSD') == (2000, '2199.00', '1.0', 1669812778999, 999)
+
+
+def test_engine_reads_production_trades_from_the_bus(bus):
+    from bot.testnet_mm import TestnetMM
+
+    mm = TestnetMM('BTC', 'BUSD', price_bus=bus.path)
+    mm._trade = MagicMock()
+    mm.bws = mm._connect_to_production_trade_stream()
+    bus.publish('BTCBUSD', '16500.00', '0.001', 1669812778000, 1)
+
+    mm._process_next_event(timeout=1)
+    mm.bws.disconnect()
+
+    assert mm.state.production_last_price == '16500.00'
+    assert mm._trade.called
+    assert mm._websocket_summary() == {'price bus': {'messages': 1, 'sequence': 2}}
+
+
+def test_engine_needs_agg_trades_for_the_bus(bus):
+    from bot.testnet_mm import TestnetMM
+
+    with pytest.raises(ValueError):
+        TestnetMM('BTC', 'BUSD', price_source='mid', price_bus=bus.path)
+
+
+def test_supervisor_creates_bus_and_restarts_feed_handler():
+    import os
+    from bot.supervisor import Supervisor, FEED_HANDLER
+
+    supervisor = Supervisor([('BTC', 'BUSD'), ('ETH', 'BUSD')], workers=2, price_bus=True, clock=lambda: 0)
+    supervisor.context = MagicMock()
+    supervisor._create_price_bus()
+    supervisor._spawn(FEED_HANDLER)
+
+    assert supervisor.bus.symbols == ['BTCBUSD', 'ETHBUSD']
+    assert supervisor.engine_options['price_bus'] == supervisor.bus.path
+    assert supervisor.context.Process.call_args.kwargs['args'][1] == ["wss://stream.binance.com:9443/ws"]
+
+    supervisor.processes[FEED_HANDLER].is_alive.return_value = False
+    supervisor._check_workers()
+    assert FEED_HANDLER in supervisor.restart_at
+
+    path = supervisor.bus.path
+    supervisor.terminate()
+    assert not os.path.exists(path)
@@ -0,0 +1,96 @@
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def book_ticker(bid, bid_qty, ask, ask_qty):
+    return {'u': 400900217, 's': 'BTCBUSD', 'b': bid, 'B': bid_qty, 'a': ask, 'A': ask_qty}
+
+
+def test_agg_trade_price_source():
+    from bot.price_source import AggTradePriceSource
+
+    source = AggTradePriceSource()
+    assert source.topics('BTCBUSD') == ['btcbusd@aggTrade']
+    assert source.handles({'e': 'aggTrade', 'p': '1000'})
+    assert not source.handles(book_ticker('999', '1', '1001', '1'))
+    assert source.on_message({'e': 'aggTrade', 'p': '1000'}) == '1000'
+
+
+def test_book_ticker_mid_and_microprice():
+    from bot.price_source import BookTickerPriceSource
+
+    mid = BookTickerPriceSource("mid", min_interval=0)
+    assert mid.topics('BTCBUSD') == ['btcbusd@bookTicker']
+    assert mid.handles(book_ticker('999', '1', '1001', '3'))
+    assert not mid.handles({'e': 'aggTrade', 'p': '1000'})
+    assert Decimal(mid.on_message(book_ticker('999', '1', '1001', '3'))) == Decimal('1000')
+
+    microprice = BookTickerPriceSource("microprice", min_interval=0)
+    # heavier ask size pulls the price toward the bid
+    assert Decimal(microprice.on_message(book_ticker('999', '1', '1001', '3'))) == Decimal('999.5')
+
+
+def test_conflator_rate_caps_and_keeps_latest():
+    from bot.price_source import PriceConflator
+
+    clock = FakeClock()
+    conflator = PriceConflator(min_interval=0.1, clock=clock)
+
+    assert conflator.update('1000') == '1000'
+    assert conflator.update('1001') is None
+    assert conflator.update('1002') is None
+    assert conflator.due_in() == 0.1
+
+    clock.now = 0.2
+    assert conflator.due_in() == 0
+    assert conflator.flush() == '1002'
+    assert conflator.due_in() is None
+    assert conflator.update('1002') is None
+
+
+def test_message_handler_requotes_on_reference_price_only():
+    from bot.testnet_mm import TestnetMM
+
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret', price_source="mid", price_min_interval=60)
+    mm._trade = MagicMock()
+    mm._record_last_price = MagicMock()
+
+    mm._message_handler(book_ticker('999', '1', '1001', '1'))
+    mm._message_handler(book_ticker('998', '1', '1000', '1'))
+
+    assert mm._trade.call_count == 1
+    mm._record_last_price.assert_called_once_with('1000')
+
+
+def test_held_back_price_is_quoted_when_production_goes_quiet():
+    from lib.clock import VirtualClock
+    from bot.testnet_mm import TestnetMM
+
+    clock = VirtualClock()
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret', price_source="mid", price_min_interval=0.5, clock=clock)
+    mm._trade = MagicMock()
+    mm.bws = MagicMock()
+    mm.order_gateway = MagicMock()
+    mm.keep_alive = True
+    mm.last_keep_listen_key_alive_at = clock.monotonic()
+
+    mm._message_handler(book_ticker('999', '1', '1001', '1'))
+    mm._message_handler(book_ticker('998', '1', '1000', '1'))
+    assert mm.state.production_last_price == '1000'
+    # the engine waits for events no longer than until the held back price is due
+    assert mm._idle_timeout() == 0.5
+
+    clock.advance(0.5)
+    mm._check_feeds = MagicMock(side_effect=lambda: setattr(mm, 'keep_alive', False))
+    mm._keep_alive()
+
+    assert mm.state.production_last_price == '999'
+    assert mm._trade.call_count == 2
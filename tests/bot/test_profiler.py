@@ -0,0 +1,73 @@
+import json
+import threading
+from urllib.request import urlopen, Request
+
+
+def busy(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_sampling_profiler_collects_stacks_of_other_threads():
+    from bot.profiler import SamplingProfiler
+
+    stop = threading.Event()
+    worker = threading.Thread(target=busy, args=(stop,), name="busy-worker", daemon=True)
+    worker.start()
+
+    profiler = SamplingProfiler(interval=0.001)
+    profiler.start()
+    while profiler.sample_count < 20:
+        stop.wait(0.01)
+    profiler.stop()
+    stop.set()
+
+    collapsed = profiler.collapsed()
+    assert "busy-worker;" in collapsed
+    assert "test_profiler:busy:" in collapsed
+    assert "sampling-profiler" not in collapsed
+    assert not profiler.running
+
+
+def test_memory_diff_traces_between_two_calls():
+    import tracemalloc
+    from bot.profiler import MemoryProfiler
+
+    profiler = MemoryProfiler()
+    try:
+        assert "tracemalloc started" in profiler.diff()
+        retained = [bytearray(1024) for _ in range(100)]
+        assert "test_profiler.py" in profiler.diff()
+        assert not tracemalloc.is_tracing()
+        assert "tracemalloc started" in profiler.diff()
+    finally:
+        profiler.stop()
+    assert retained
+    assert not tracemalloc.is_tracing()
+
+
+def test_profiling_over_http(tmp_path):
+    from bot.health_server import HealthServer
+    from bot.profiler import ProfilingControls
+
+    controls = ProfilingControls(str(tmp_path), interval=0.001)
+    server = HealthServer([], host="127.0.0.1", port=0, post_routes=controls.routes()).start()
+
+    def post(path):
+        with urlopen(Request(f"http://127.0.0.1:{server.port}{path}", method="POST")) as res:
+            return json.loads(res.read())
+
+    try:
+        post('/debug/profile/cpu/start')
+        while controls.cpu.sample_count < 5:
+            threading.Event().wait(0.01)
+        path = post('/debug/profile/cpu/stop')['path']
+        memory_path = post('/debug/profile/memory')['path']
+    finally:
+        controls.memory.stop()
+        server.stop()
+
+    with open(path) as f:
+        assert "MainThread;" in f.read()
+    with open(memory_path) as f:
+        assert "tracemalloc started" in f.read()
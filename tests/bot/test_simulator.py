@@ -0,0 +1,98 @@
+import pytest
+from lib.binance.rest.exceptions import BinanceRestException
+
+
+def trade(price, qty, time=1669812778000):
+    return {'e': 'aggTrade', 's': 'BTCBUSD', 'a': 1, 'p': price, 'q': qty, 'T': time}
+
+
+def order(side, price, qty):
+    return {'symbol': 'BTCBUSD', 'side': side, 'type': 'LIMIT', 'timeInForce': 'GTC', 'quantity': qty, 'price': price}
+
+
+@pytest.fixture
+def exchange():
+    from bot.simulator import SimulatedBinanceClient
+
+    reports = []
+    exchange = SimulatedBinanceClient('BTC', 'BUSD', balances={'BTC': '1', 'BUSD': '10000'}, execution_handler=reports.append)
+    exchange.reports = reports
+    return exchange
+
+
+def balances(exchange):
+    return {b['asset']: (b['free'], b['locked']) for b in exchange.request('getAccount')['balances']}
+
+
+def test_orders_lock_funds_and_report_new(exchange):
+    res = exchange.request('postOrder', order('BUY', '1000', '1'))
+
+    assert res['status'] == 'NEW'
+    assert res['clientOrderId'].startswith('tmm-')
+    assert balances(exchange)['BUSD'] == ('9000', '1000')
+    assert [r['x'] for r in exchange.reports] == ['NEW']
+
+
+def test_insufficient_balance_is_rejected(exchange):
+    with pytest.raises(BinanceRestException) as err:
+        exchange.request('postOrder', order('SELL', '1000', '2'))
+
+    assert err.value.code == -2010
+
+
+def test_trades_fill_in_price_time_priority(exchange):
+    first = exchange.request('postOrder', order('BUY', '1000', '1'))
+    second = exchange.request('postOrder', order('BUY', '1000', '1'))
+    better = exchange.request('postOrder', order('BUY', '1001', '1'))
+
+    exchange.on_trade(trade('1001.5', '5'))
+    assert not [r for r in exchange.reports if r['x'] == 'TRADE']
+
+    exchange.on_trade(trade('1000', '1.5'))
+
+    fills = [(r['i'], r['l'], r['X']) for r in exchange.reports if r['x'] == 'TRADE']
+    assert fills == [(better['orderId'], '1', 'FILLED'), (first['orderId'], '0.5', 'PARTIALLY_FILLED')]
+    assert second['orderId'] in exchange.orders
+    assert balances(exchange)['BTC'] == ('2.5', '0')
+
+
+def test_cancel_releases_funds(exchange):
+    res = exchange.request('postOrder', order('SELL', '1000', '0.5'))
+    exchange.request('deleteOrder', {'symbol': 'BTCBUSD', 'orderId': res['orderId']})
+
+    assert balances(exchange)['BTC'] == ('1.0', '0.0')
+    assert exchange.reports[-1]['X'] == 'CANCELED'
+
+    with pytest.raises(BinanceRestException) as err:
+        exchange.request('deleteOpenOrders', {'symbol': 'BTCBUSD'})
+    assert err.value.code == -2011
+
+
+def test_ack_responses(exchange):
+    res = exchange.request('postOrder', dict(order('BUY', '1000', '1'), newOrderRespType='ACK'))
+
+    assert set(res) == {'symbol', 'orderId', 'clientOrderId', 'transactTime'}
+
+
+def test_engine_trades_against_simulated_exchange(exchange):
+    from lib.clock import VirtualClock
+    from bot.testnet_mm import TestnetMM
+
+    clock = VirtualClock()
+    mm = TestnetMM('BTC', 'BUSD', distance_from_mid_price='0.001', price_min_interval=0, rest_client=exchange, clock=clock)
+    exchange.execution_handler = mm.events.put
+    mm._get_asset_filters()
+
+    for i, price in enumerate(['20000', '20000', '19970', '20000']):
+        msg = trade(price, '1', 1669812778000 + i)
+        exchange.on_trade(msg)
+        mm.events.put(msg)
+        while not mm.events.empty():
+            mm._process_next_event(timeout=0)
+
+    snapshot = mm.state.snapshot()
+    assert snapshot.fill_count >= 1
+    assert len(snapshot.open_orders['bids']) == 1
+    assert len(snapshot.open_orders['asks']) == 1
+    # the wait for balances after each cancel passed on the virtual clock only
+    assert clock.monotonic() >= 1
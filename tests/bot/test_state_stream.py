@@ -0,0 +1,65 @@
+import json
+import threading
+from urllib.request import urlopen
+
+
+class FakeEngine:
+    def __init__(self, symbol):
+        from bot.testnet_mm_state import TestnetMMState
+
+        self.symbol = symbol
+        self.state = TestnetMMState()
+
+
+def read_event(res):
+    lines = []
+    while True:
+        line = res.readline().decode("utf-8").rstrip("\n")
+        if line == "" and lines:
+            break
+        if line and not line.startswith(":"):
+            lines.append(line)
+    event = lines[0].split(": ", 1)[1]
+    return event, json.loads(lines[1].split(": ", 1)[1])
+
+
+def test_diff_views_only_keeps_changed_keys():
+    from bot.state_stream import diff_views
+
+    assert diff_views({'a': 1, 'b': [1]}, {'a': 1, 'b': [1, 2]}) == {'b': [1, 2]}
+
+
+def test_state_and_event_stream():
+    from bot.health_server import HealthServer
+    from bot.state_stream import StateStream
+
+    btc, eth = FakeEngine('BTCBUSD'), FakeEngine('ETHBUSD')
+    btc.state.set_production_last_price('1000')
+    # the stream only looks at the engines when the test lets it
+    tick = threading.Semaphore(0)
+    stream = StateStream([btc, eth], sleep=lambda interval: tick.acquire())
+    server = HealthServer([], host="127.0.0.1", port=0, routes=stream.routes()).start()
+
+    try:
+        with urlopen(f"http://127.0.0.1:{server.port}/state") as res:
+            state = json.loads(res.read())
+        assert state['BTCBUSD']['production_last_price'] == '1000'
+        assert state['ETHBUSD']['open_orders'] == {'bids': [], 'asks': []}
+
+        with urlopen(f"http://127.0.0.1:{server.port}/events?interval=0.01", timeout=5) as res:
+            assert res.headers['Content-Type'] == 'text/event-stream'
+            event, data = read_event(res)
+            assert event == 'snapshot'
+            assert set(data) == {'BTCBUSD', 'ETHBUSD'}
+
+            # updates between two reads are coalesced into one delta with the latest values
+            btc.state.set_production_last_price('1001')
+            btc.state.set_production_last_price('1002')
+            btc.state.set_balances({'BTC': '1', 'BUSD': '1000'})
+            tick.release()
+            event, data = read_event(res)
+            assert event == 'delta'
+            assert data == {'BTCBUSD': {'production_last_price': '1002', 'balances': {'BTC': '1', 'BUSD': '1000'}}}
+    finally:
+        tick.release()
+        server.stop()
@@ -0,0 +1,78 @@
+import logging
+from unittest.mock import MagicMock
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def supervisor_with_fake_workers(clock, **kwargs):
+    from bot.supervisor import Supervisor
+
+    supervisor = Supervisor([('BTC', 'BUSD'), ('ETH', 'BUSD'), ('BNB', 'BUSD')], workers=2, clock=clock, **kwargs)
+    supervisor.context = MagicMock()
+    return supervisor
+
+
+def test_shard_symbols():
+    from bot.supervisor import shard_symbols
+
+    assert shard_symbols(['a', 'b', 'c'], 2) == [['a', 'c'], ['b']]
+    assert shard_symbols(['a'], 4) == [['a']]
+
+
+def test_price_bus_rejects_book_ticker_price_source():
+    import pytest
+    from bot.supervisor import Supervisor
+
+    with pytest.raises(ValueError):
+        Supervisor([('BTC', 'BUSD')], price_bus=True, engine_options={'price_source': 'mid'})
+    assert Supervisor([('BTC', 'BUSD')], price_bus=True, engine_options={'price_source': 'aggTrade'}).price_bus
+
+
+def test_crashed_worker_restarts_with_backoff():
+    clock = FakeClock()
+    supervisor = supervisor_with_fake_workers(clock, initial_backoff=1, max_backoff=4, stable_after=60)
+    supervisor._spawn(0)
+    supervisor.processes[0].is_alive.return_value = False
+
+    restarts = []
+    for _ in range(4):
+        supervisor._check_workers()
+        restarts.append(supervisor.restart_at[0] - clock.now)
+        clock.now = supervisor.restart_at[0]
+        supervisor._check_workers()
+        supervisor.processes[0].is_alive.return_value = False
+
+    assert restarts == [1, 2, 4, 4]
+    assert supervisor.context.Process.call_count == 5
+
+
+def test_backoff_resets_after_stable_run():
+    clock = FakeClock()
+    supervisor = supervisor_with_fake_workers(clock, initial_backoff=1, stable_after=60)
+    supervisor.backoff[0] = 32
+    supervisor._spawn(0)
+    supervisor.processes[0].is_alive.return_value = False
+
+    clock.now = 120
+    supervisor._check_workers()
+    assert supervisor.restart_at[0] == 121
+
+
+def test_ipc_metrics_and_logs_are_collected(caplog):
+    clock = FakeClock()
+    supervisor = supervisor_with_fake_workers(clock)
+
+    supervisor._handle_ipc(('metrics', 1, {'ETHBUSD': {'open_bids': 1}}))
+    record = logging.LogRecord('TestnetMM', logging.INFO, '', 0, 'Placed order', None, None)
+    record.processName = 'testnet-mm-worker-1'
+    with caplog.at_level(logging.INFO, logger='TestnetMMSupervisor'):
+        supervisor._handle_ipc(record)
+
+    assert supervisor.metrics == {1: {'ETHBUSD': {'open_bids': 1}}}
+    assert '[testnet-mm-worker-1] Placed order' in caplog.text
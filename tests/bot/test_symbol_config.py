@@ -0,0 +1,128 @@
+import os
+import pytest
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+CONFIG = """
+[defaults]
+distance_from_mid_price = "0.0003"
+
+[[symbols]]
+base_asset = "btc"
+quote_asset = "busd"
+spread_policy = "adaptive"
+
+[[symbols]]
+base_asset = "ETH"
+quote_asset = "BUSD"
+distance_from_mid_price = 0.0005
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / 'symbols.toml'
+    path.write_text(CONFIG)
+    return path
+
+
+def test_load_applies_defaults(config_file):
+    from bot.symbol_config import load_symbol_config
+
+    config = load_symbol_config(str(config_file))
+
+    assert list(config) == ['BTCBUSD', 'ETHBUSD']
+    assert config['BTCBUSD'].distance_from_mid_price == '0.0003'
+    assert config['BTCBUSD'].spread_policy == 'adaptive'
+    assert config['ETHBUSD'].distance_from_mid_price == '0.0005'
+    assert config['ETHBUSD'].engine_options()['mode'] == 'spread'
+
+
+@pytest.mark.parametrize('entry,error', [
+    ('base_asset = "BTC"\nquote_asset = "BUSD"\nspread = "0.1"', 'Unknown settings'),
+    ('base_asset = "BTC"', "'quote_asset'"),
+    ('base_asset = "BTC"\nquote_asset = "BUSD"\nmode = "ladder"', "'mode'"),
+    ('base_asset = "BTC"\nquote_asset = "BUSD"\ndistance_from_mid_price = "1.5"', 'between 0 and 1'),
+    ('base_asset = "BTC"\nquote_asset = "BUSD"\ndepth_size_ratio = "a lot"', 'must be a number'),
+    ('base_asset = "BTC"\nquote_asset = "BUSD"\ndepth_levels = 0', 'positive integer'),
+    ('base_asset = "BTC"\nquote_asset = "BUSD"\nmin_distance_from_mid_price = "0.1"', 'above'),
+])
+def test_invalid_entries_are_rejected(tmp_path, entry, error):
+    from bot.exceptions import SymbolConfigException
+    from bot.symbol_config import load_symbol_config
+
+    path = tmp_path / 'symbols.toml'
+    path.write_text(f"[[symbols]]\n{entry}\n")
+
+    with pytest.raises(SymbolConfigException, match=error):
+        load_symbol_config(str(path))
+
+
+def test_diff_only_reports_changed_settings(config_file):
+    from bot.symbol_config import load_symbol_config, diff_symbol_config
+
+    old = load_symbol_config(str(config_file))
+    new = dict(old)
+    new['BTCBUSD'] = old['BTCBUSD']._replace(distance_from_mid_price='0.001')
+    del new['ETHBUSD']
+
+    assert diff_symbol_config(old, new) == ([], ['ETHBUSD'], {'BTCBUSD': {'distance_from_mid_price': '0.001'}})
+
+
+def test_watcher_reloads_on_change_and_keeps_valid_config(config_file):
+    from bot.symbol_config import SymbolConfigWatcher
+
+    on_change, on_error = MagicMock(), MagicMock()
+    watcher = SymbolConfigWatcher(str(config_file), on_change, on_error)
+
+    config_file.write_text(CONFIG.replace('0.0005', '0.0007'))
+    os.utime(config_file, (watcher.mtime + 1, watcher.mtime + 1))
+    watcher.check()
+    on_change.assert_called_once_with([], [], {'ETHBUSD': {'distance_from_mid_price': '0.0007'}})
+
+    config_file.write_text(CONFIG + '\n[[symbols]]\nbase_asset = "BTC"\nquote_asset = "BUSD"\n')
+    watcher.reload()
+    assert 'listed twice' in on_error.call_args.args[0]
+    assert watcher.config['ETHBUSD'].distance_from_mid_price == '0.0007'
+    assert on_change.call_count == 1
+
+
+def test_apply_settings_requotes_on_next_tick_without_cancelling():
+    from bot.testnet_mm import TestnetMM
+
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret', distance_from_mid_price='0.01')
+    mm.state.production_last_price = '1000'
+    mm.state.open_orders = {'bids': [{'orderId': 1, 'price': '990'}], 'asks': [{'orderId': 2, 'price': '1010'}]}
+    mm.quoted_distance = Decimal('0.01')
+    mm._place_trade = MagicMock()
+    mm._cancel_open_orders = MagicMock()
+
+    mm._trade()
+    assert not mm._place_trade.called
+
+    mm.apply_settings(distance_from_mid_price='0.005')
+    assert not mm._cancel_open_orders.called
+
+    mm._trade()
+    assert mm._place_trade.called
+
+
+def test_apply_settings_switches_spread_policy():
+    from bot.testnet_mm import TestnetMM
+
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret')
+    mm.apply_settings(spread_policy='adaptive', max_distance_from_mid_price='0.02')
+
+    assert mm.spread_policy.max_distance == Decimal('0.02')
+    assert mm.market_stats is not None
+
+    mm.apply_settings(spread_policy='fixed')
+    assert mm.spread_policy is None
+
+
+def test_supervisor_takes_pairs_from_symbol_config(config_file):
+    from bot.supervisor import Supervisor
+
+    supervisor = Supervisor([], workers=1, symbol_config_file=str(config_file))
+
+    assert supervisor.shards == [[('BTC', 'BUSD'), ('ETH', 'BUSD')]]
@@ -0,0 +1,118 @@
+import pytest
+from decimal import Decimal
+from tests.bot.mock_responses import MOCK_RESPONSES
+
+
+def btcbusd_info(**overrides):
+    info = next(s for s in MOCK_RESPONSES['getExchangeInfo']['symbols'] if s['symbol'] == 'BTCBUSD')
+    return dict(info, **overrides)
+
+
+def test_valid_order_is_unchanged():
+    from bot.symbol_filters import SymbolFilters
+
+    filters = SymbolFilters(btcbusd_info())
+
+    assert filters.validate('BUY', '0.001000', '16000.00') == ('0.001000', '16000.00')
+    assert filters.summary()['adjustments'] == {}
+
+
+def test_rounds_price_away_from_the_mid_and_floors_quantity():
+    from bot.symbol_filters import SymbolFilters
+
+    filters = SymbolFilters(btcbusd_info())
+
+    assert filters.validate('BUY', '0.0012345', '16000.019') == ('0.00123400', '16000.01000000')
+    assert filters.validate('SELL', '0.0012345', '16000.011') == ('0.00123400', '16000.02000000')
+    assert filters.adjustments == {'price': 2, 'quantity': 2}
+
+
+def test_caps_quantity_at_max_qty_and_max_notional():
+    from bot.symbol_filters import SymbolFilters
+
+    filters = SymbolFilters(btcbusd_info())
+    qty, _ = filters.validate('BUY', '1000', '16000.00')
+    assert Decimal(qty) == Decimal('900')
+
+    filters = SymbolFilters(btcbusd_info(filters=[
+        {'filterType': 'LOT_SIZE', 'minQty': '0.00001000', 'maxQty': '9000.00000000', 'stepSize': '0.00001000'},
+        {'filterType': 'NOTIONAL', 'minNotional': '5.00000000', 'applyMinToMarket': True, 'maxNotional': '1000.00000000', 'applyMaxToMarket': False, 'avgPriceMins': 5},
+    ]))
+    qty, _ = filters.validate('SELL', '1', '16000')
+    assert Decimal(qty) == Decimal('0.0625')
+
+
+def test_clamps_price_into_the_percent_band_once_the_average_price_is_known():
+    from bot.symbol_filters import SymbolFilters
+
+    filters = SymbolFilters(btcbusd_info())
+    assert filters.validate('BUY', '1', '100.00') == ('1', '100.00')
+
+    filters.reference_price = Decimal('16000')
+    _, price = filters.validate('BUY', '1', '100.00')
+    assert Decimal(price) == Decimal('3200')
+    _, price = filters.validate('SELL', '0.001', '90000.00')
+    assert Decimal(price) == Decimal('80000')
+
+
+def test_percent_price_by_side():
+    from bot.symbol_filters import SymbolFilters
+
+    filters = SymbolFilters(btcbusd_info(filters=[
+        {'filterType': 'PRICE_FILTER', 'minPrice': '0.01000000', 'maxPrice': '1000000.00000000', 'tickSize': '0.01000000'},
+        {'filterType': 'PERCENT_PRICE_BY_SIDE', 'bidMultiplierUp': '1.2', 'bidMultiplierDown': '0.8', 'askMultiplierUp': '1.5', 'askMultiplierDown': '0.9', 'avgPriceMins': 5},
+    ]))
+    filters.reference_price = Decimal('100')
+
+    assert Decimal(filters.validate('BUY', '1', '130')[1]) == Decimal('120')
+    assert Decimal(filters.validate('SELL', '1', '130')[1]) == Decimal('130')
+    assert Decimal(filters.validate('SELL', '1', '85')[1]) == Decimal('90')
+
+
+@pytest.mark.parametrize('symbol_info, side, qty, price, open_orders, filter_type', [
+    ({}, 'BUY', '0.0000001', '16000', 0, 'LOT_SIZE'),
+    ({}, 'BUY', '0.0001', '16000', 0, 'MIN_NOTIONAL'),
+    ({}, 'SELL', '0.001', '16000', 200, 'MAX_NUM_ORDERS'),
+    ({'status': 'BREAK'}, 'SELL', '0.001', '16000', 0, 'STATUS'),
+    ({'orderTypes': ['MARKET']}, 'SELL', '0.001', '16000', 0, 'ORDER_TYPE'),
+])
+def test_rejects_orders_that_cannot_be_fixed(symbol_info, side, qty, price, open_orders, filter_type):
+    from bot.symbol_filters import SymbolFilters
+    from bot.exceptions import TestnetMMOrderRejectedException
+
+    filters = SymbolFilters(btcbusd_info(**symbol_info))
+
+    with pytest.raises(TestnetMMOrderRejectedException) as err:
+        filters.validate(side, qty, price, open_orders=open_orders)
+
+    assert err.value.filter_type == filter_type
+    assert filters.summary()['rejections_avoided'] == {filter_type: 1}
+
+
+def test_rejected_order_is_not_sent(requests_mock):
+    from bot.testnet_mm import TestnetMM
+
+    requests_mock.get('https://testnet.binance.vision/api/v3/exchangeInfo', json=MOCK_RESPONSES['getExchangeInfo'])
+    post_order = requests_mock.post('https://testnet.binance.vision/api/v3/order', json=MOCK_RESPONSES['postOrder'])
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret')
+    mm._get_asset_filters()
+
+    assert mm._place_bid('0.0001', '16000.00') is None
+    assert not post_order.called
+    assert list(mm.state.past_orders) == []
+    assert mm.health()['filters']['rejections_avoided'] == {'MIN_NOTIONAL': 1}
+
+
+def test_average_price_is_refreshed_at_most_every_interval(requests_mock):
+    from bot.testnet_mm import TestnetMM
+
+    requests_mock.get('https://testnet.binance.vision/api/v3/exchangeInfo', json=MOCK_RESPONSES['getExchangeInfo'])
+    avg_price = requests_mock.get('https://testnet.binance.vision/api/v3/avgPrice', json=MOCK_RESPONSES['getAvgPrice'])
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret')
+    mm._get_asset_filters()
+
+    mm._refresh_avg_price()
+    mm._refresh_avg_price()
+
+    assert avg_price.call_count == 1
+    assert mm.symbol_filters.reference_price == Decimal('16500')
@@ -8,42 +8,154 @@ from tests.bot.mock_responses import MOCK_RESPONSES
 def test_default_state():
     from bot.testnet_mm_state import TestnetMMState
 
-    assert TestnetMMState.PRODUCTION_LAST_PRICE == '0'
-    assert TestnetMMState.PAST_ORDERS == []
-    assert TestnetMMState.OPEN_ORDERS == {
+    state = TestnetMMState()
+    assert state.production_last_price == '0'
+    assert list(state.past_orders) == []
+    assert list(state.fills) == []
+    assert state.open_orders == {
         'bids': [],
         'asks': []
     }
 
+def test_state_is_per_instance():
+    from bot.testnet_mm import TestnetMM
+
+    mm, other = TestnetMM('BTC', 'BUSD'), TestnetMM('ETH', 'BUSD')
+    mm._record_last_price('1000')
+
+    assert mm.state.production_last_price == '1000'
+    assert other.state.production_last_price == '0'
+
+def test_engines_in_one_process_log_separately():
+    from bot.testnet_mm import TestnetMM
+
+    mm, other = TestnetMM('BTC', 'BUSD'), TestnetMM('ETH', 'BUSD')
+    mm.logger.update('production_last_price', '16500')
+    other.logger.update('production_last_price', '1200')
+
+    assert mm.logger is not other.logger
+    assert mm.state.logger is mm.logger
+    assert mm.logger.log_history['production_last_price'] == '16500'
+    assert other.logger.log_history['production_last_price'] == '1200'
+
+def test_snapshot_is_immutable_and_detached():
+    from bot.testnet_mm_state import TestnetMMState
+
+    state = TestnetMMState()
+    state.track_order({'orderId': 1, 'side': 'BUY', 'price': '995', 'status': 'NEW'})
+    snapshot = state.snapshot()
+
+    state.set_production_last_price('1000')
+    state.open_orders['bids'][0]['status'] = 'PARTIALLY_FILLED'
+
+    assert snapshot.production_last_price == '0'
+    assert snapshot.open_orders['bids'][0]['status'] == 'NEW'
+    assert state.snapshot().production_last_price == '1000'
+    with pytest.raises(TypeError):
+        snapshot.open_orders['bids'][0]['status'] = 'FILLED'
+
+def test_price_tick_shares_unchanged_snapshot_fields():
+    from bot.testnet_mm_state import TestnetMMState
+
+    state = TestnetMMState()
+    state.track_order({'orderId': 1, 'side': 'BUY', 'price': '995', 'status': 'NEW'})
+    before = state.snapshot()
+    state.set_production_last_price('1000')
+    after = state.snapshot()
+
+    assert after.production_last_price == '1000'
+    assert after.open_orders is before.open_orders
+    assert after.past_orders is before.past_orders
+    assert after.fills is before.fills
+
+def test_history_is_bounded_and_counts_are_not():
+    from bot.testnet_mm_state import TestnetMMState
+
+    state = TestnetMMState()
+    for order_id in range(TestnetMMState.SNAPSHOT_HISTORY + 5):
+        state.track_order({'orderId': order_id, 'side': 'BUY', 'price': '995', 'status': 'FILLED'})
+
+    snapshot = state.snapshot()
+    assert len(state.past_orders) == TestnetMMState.SNAPSHOT_HISTORY
+    assert snapshot.past_orders[0]['orderId'] == 5
+    assert snapshot.order_count == TestnetMMState.SNAPSHOT_HISTORY + 5
+
+def test_events_from_other_threads_are_processed_on_engine_thread():
+    import threading
+    from bot.testnet_mm import TestnetMM
+
+    mm = TestnetMM('BTC', 'BUSD')
+    mm._trade = MagicMock()
+    threading.Thread(target=lambda: mm.events.put({'e': 'aggTrade', 'p': '1000'})).start()
+    mm.submit(lambda: mm._record_last_price('1001'))
+
+    mm._process_next_event(timeout=1)
+    mm._process_next_event(timeout=1)
+
+    assert mm.state.production_last_price == '1001'
+    assert mm._trade.called
+
 def test_run():
-    import datetime
+    from lib.clock import VirtualClock
     from bot.testnet_mm import TestnetMM
 
-    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret')
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret', clock=VirtualClock(100))
 
     mm._cancel_open_orders = MagicMock()
     mm._connect_to_production_trade_stream = MagicMock()
     mm._keep_alive = MagicMock()
     mm._get_asset_filters = MagicMock()
     mm._connect_to_testnet_user_stream = MagicMock()
+    mm._start_server_time_sync = MagicMock()
 
     mm.run()
 
-    assert hasattr(mm, 'last_keep_listen_key_alive_at')
-    assert type(mm.last_keep_listen_key_alive_at) == datetime.datetime
+    assert mm.last_keep_listen_key_alive_at == 100
     assert mm.keep_alive == True
     assert mm._cancel_open_orders.called
     assert mm._connect_to_production_trade_stream.called
     assert mm._keep_alive.called
     assert mm._get_asset_filters.called
     assert mm._connect_to_testnet_user_stream.called
+    assert mm._start_server_time_sync.called
+
+def test_keep_alive_refreshes_listen_keys_on_the_engine_clock():
+    from lib.clock import VirtualClock
+    from bot.testnet_mm import TestnetMM
+
+    clock = VirtualClock()
+    mm = TestnetMM('BTC', 'BUSD', clock=clock)
+    mm.keep_alive = True
+    mm.last_keep_listen_key_alive_at = clock.monotonic()
+    mm.bws = MagicMock()
+    mm.order_gateway = MagicMock()
+    mm._keep_listen_key_alive = MagicMock(side_effect=lambda: setattr(mm, 'keep_alive', False))
+
+    mm._keep_alive()
+
+    # idle waits pass on the virtual clock, stopped at the first refresh
+    assert mm.logger.clock is clock
+    assert mm._keep_listen_key_alive.call_count == 1
+    assert 50 * 60 < clock.monotonic() <= 50 * 60 + 2
+
+def test_racing_endpoints_run_on_the_engine_clock():
+    from lib.clock import VirtualClock
+    from bot.testnet_mm import TestnetMM
+
+    clock = VirtualClock(100)
+    mm = TestnetMM('BTC', 'BUSD', production_ws_base_urls=['wss://a/ws', 'wss://b/ws'], clock=clock)
+
+    with patch('bot.testnet_mm.BinanceMultiEndpointWebsocketClient.connect'):
+        bws = mm._connect_to_production_trade_stream()
+
+    clock.advance(5)
+    assert bws.clock() == clock.monotonic()
 
 def test_trade_without_last_price():
     from bot.testnet_mm import TestnetMM
-    from bot.testnet_mm_state import TestnetMMState
 
     mm = TestnetMM('BTC', 'BUSD')
-    assert TestnetMMState.PRODUCTION_LAST_PRICE == '0'
+    assert mm.state.production_last_price == '0'
     assert mm._trade() == False
 
 @rm.Mocker(kw='mock')
@@ -65,7 +177,6 @@ def test_get_balances(**kwargs):
 @rm.Mocker(kw='mock')
 def test_trade_without_funds(**kwargs):
     from bot.testnet_mm import TestnetMM
-    from bot.testnet_mm_state import TestnetMMState
     from bot.exceptions import TestnetMMInsufficientFundsException
 
     base_asset, quote_asset = 'BTC', 'BUSD'
@@ -75,32 +186,34 @@ def test_trade_without_funds(**kwargs):
     mm._get_asset_filters()
 
     kwargs['mock'].get(rm.ANY, json=MOCK_RESPONSES['getAccountWithoutBalance'])
+    kwargs['mock'].get('https://testnet.binance.vision/api/v3/avgPrice', json=MOCK_RESPONSES['getAvgPrice'])
     assert mm._get_balances(base_asset, quote_asset) == ('0.00000000', '0.00000000')
 
     mm._cancel_open_orders = MagicMock()
     with pytest.raises(TestnetMMInsufficientFundsException):
-        TestnetMMState.PRODUCTION_LAST_PRICE = '1'
+        mm.state.production_last_price = '1'
         mm._trade()
 
 @rm.Mocker(kw='mock')
 def test_trade_with_quote_asset_and_no_base_asset(**kwargs):
     from bot.testnet_mm import TestnetMM
-    from bot.testnet_mm_state import TestnetMMState
     base_asset, quote_asset = 'BTC', 'BUSD'
 
     mm = TestnetMM(base_asset, quote_asset, 'key', 'secret')
     kwargs['mock'].get('https://testnet.binance.vision/api/v3/exchangeInfo', json=MOCK_RESPONSES['getExchangeInfo'])
     mm._get_asset_filters()
-    mm._buy_base_asset = MagicMock()
+    mm._place_bid = MagicMock()
+    mm._place_ask = MagicMock()
     mm._cancel_open_orders = MagicMock()
-    # min notional is 10, so any value below or equal to 10 (accounting for fees) is insufficient
+    # min notional is 10, half of that can't fund an ask even at a price skewed away from the market
     price = 10000
-    btc_balance = 10 / price
-    TestnetMMState.PRODUCTION_LAST_PRICE = str(price)
+    btc_balance = 5 / price
+    mm.state.production_last_price = str(price)
 
     mock_response = MOCK_RESPONSES['getAccountWithoutBase']
     mock_response['balances'].append({'asset': 'BTC', 'free': str(btc_balance), 'locked': '0.00000000'})
     kwargs['mock'].get(rm.ANY, json=mock_response)
+    kwargs['mock'].get('https://testnet.binance.vision/api/v3/avgPrice', json=MOCK_RESPONSES['getAvgPrice'])
 
     base_asset_qty, quote_asset_qty = mm._get_balances(base_asset, quote_asset)
     assert float(quote_asset_qty) > 0
@@ -108,20 +221,23 @@ def test_trade_with_quote_asset_and_no_base_asset(**kwargs):
 
     mm._trade()
     assert mm._cancel_open_orders.called
-    assert mm._buy_base_asset.called
+    # no swap order, the base asset is bought back through the bid alone
+    assert mm._place_bid.called
+    assert not mm._place_ask.called
+    assert mm.quoted_sides == {'bids'}
 
 
 @rm.Mocker(kw='mock')
 def test_trade_with_base_asset_and_no_quote_asset(**kwargs):
     from bot.testnet_mm import TestnetMM
-    from bot.testnet_mm_state import TestnetMMState
 
     base_asset, quote_asset = 'BTC', 'BUSD'
 
     mm = TestnetMM(base_asset, quote_asset, 'key', 'secret')
     kwargs['mock'].get('https://testnet.binance.vision/api/v3/exchangeInfo', json=MOCK_RESPONSES['getExchangeInfo'])
     mm._get_asset_filters()
-    mm._buy_quote_asset = MagicMock()
+    mm._place_bid = MagicMock()
+    mm._place_ask = MagicMock()
     mm._cancel_open_orders = MagicMock()
     # min notional is 10, so any value below or equal to 10 (accounting for fees) is insufficient
     busd_balance = 10
@@ -129,22 +245,25 @@ def test_trade_with_base_asset_and_no_quote_asset(**kwargs):
     mock_response = MOCK_RESPONSES['getAccountWithoutQuote']
     mock_response['balances'].append({'asset': 'BUSD', 'free': f'{busd_balance}.00000000', 'locked': '0.00000000'})
     kwargs['mock'].get(rm.ANY, json=mock_response)
+    kwargs['mock'].get('https://testnet.binance.vision/api/v3/avgPrice', json=MOCK_RESPONSES['getAvgPrice'])
     base_asset_qty, quote_asset_qty = mm._get_balances(base_asset, quote_asset)
     assert float(quote_asset_qty) == busd_balance
     assert float(base_asset_qty) > 0
 
-    TestnetMMState.PRODUCTION_LAST_PRICE = '10000'
+    mm.state.production_last_price = '10000'
     mm._trade()
     assert mm._cancel_open_orders.called
-    assert mm._buy_quote_asset.called
+    assert mm._place_ask.called
+    assert not mm._place_bid.called
+    assert mm.quoted_sides == {'asks'}
 
 @rm.Mocker(kw='mock')
 def test_trade_with_sufficient_base_asset_and_quote_asset(**kwargs):
     from bot.testnet_mm import TestnetMM
-    from bot.testnet_mm_state import TestnetMMState
 
     kwargs['mock'].get(rm.ANY, json=MOCK_RESPONSES['getAccountWithBalance'])
     kwargs['mock'].get('https://testnet.binance.vision/api/v3/exchangeInfo', json=MOCK_RESPONSES['getExchangeInfo'])
+    kwargs['mock'].get('https://testnet.binance.vision/api/v3/avgPrice', json=MOCK_RESPONSES['getAvgPrice'])
 
     base_asset, quote_asset = 'BTC', 'BUSD'
 
@@ -157,7 +276,7 @@ def test_trade_with_sufficient_base_asset_and_quote_asset(**kwargs):
     assert float(quote_asset_qty) > 0
     assert float(base_asset_qty) > 0
 
-    TestnetMMState.PRODUCTION_LAST_PRICE = '1000'
+    mm.state.production_last_price = '1000'
     mm._trade()
     assert mm._cancel_open_orders.called
     mm._provide_liquidity.assert_called_with(
@@ -181,90 +300,137 @@ def test_truncate_quantity(setup_filters):
 def test_truncate_price(setup_filters):
     from decimal import Decimal
     mm = setup_filters
-    assert mm._truncate_price(Decimal('126.395930294')) == '126.390000'
+    assert mm._truncate_price(Decimal('126.395930294')) == '126.39'
 
-def test_buy_base_asset(requests_mock):
-    from decimal import Decimal
-    from bot.testnet_mm import TestnetMM
-    from bot.testnet_mm_state import TestnetMMState
 
+def _exchange_info_with(symbol, filters):
+    from copy import deepcopy
 
-    quote_asset_qty = '10000'
-    distance_from_mid_price = '0.1'
-    TestnetMMState.PRODUCTION_LAST_PRICE = 1000
+    info = deepcopy(MOCK_RESPONSES['getExchangeInfo'])
+    btcbusd = next(s for s in info['symbols'] if s['symbol'] == 'BTCBUSD')
+    info['symbols'].append(dict(btcbusd, symbol=symbol, filters=filters))
+    return info
 
-    mm = TestnetMM(distance_from_mid_price=distance_from_mid_price)
-    requests_mock.get('https://testnet.binance.vision/api/v3/exchangeInfo', json=MOCK_RESPONSES['getExchangeInfo'])
-    mm._get_asset_filters()
 
-    mm._place_bid = MagicMock()
-    mm._buy_base_asset(quote_asset_qty)
+def test_integer_step_symbol(requests_mock):
+    from decimal import Decimal
+    from bot.testnet_mm import TestnetMM
 
-    bid_price = Decimal(TestnetMMState.PRODUCTION_LAST_PRICE) * (Decimal('1') - Decimal(distance_from_mid_price))
-    bid_quantity = Decimal(quote_asset_qty) / Decimal('2') / bid_price
+    requests_mock.get('https://testnet.binance.vision/api/v3/exchangeInfo', json=_exchange_info_with('SHIBBUSD', [
+        {'filterType': 'PRICE_FILTER', 'minPrice': '0.00000001', 'maxPrice': '1.00000000', 'tickSize': '0.00000001'},
+        {'filterType': 'LOT_SIZE', 'minQty': '1.00000000', 'maxQty': '90000000000.00000000', 'stepSize': '1.00000000'},
+        {'filterType': 'MIN_NOTIONAL', 'minNotional': '10.00000000'},
+    ]))
+    mm = TestnetMM('SHIB', 'BUSD')
+    mm._get_asset_filters()
 
-    mm._place_bid.assert_called_with(mm._truncate_quantity(bid_quantity), mm._truncate_price(bid_price))
+    assert mm._truncate_quantity(Decimal('1234567.89')) == '1234567'
+    assert mm._truncate_price(Decimal('0.0000081234')) == '0.00000812'
 
 
-def test_buy_quote_asset(requests_mock):
-    from decimal import Decimal
+def test_notional_only_symbol(requests_mock):
     from bot.testnet_mm import TestnetMM
-    from bot.testnet_mm_state import TestnetMMState
 
-    base_asset_qty = '2.78'
-    distance_from_mid_price = '0.1'
-    TestnetMMState.PRODUCTION_LAST_PRICE = 1000
+    btcbusd = next(s for s in MOCK_RESPONSES['getExchangeInfo']['symbols'] if s['symbol'] == 'BTCBUSD')
+    filters = [f for f in btcbusd['filters'] if f['filterType'] != 'MIN_NOTIONAL']
+    filters.append({'filterType': 'NOTIONAL', 'minNotional': '5.00000000', 'maxNotional': '9000000.00000000'})
+    requests_mock.get('https://testnet.binance.vision/api/v3/exchangeInfo', json=_exchange_info_with('BTCFDUSD', filters))
+    mm = TestnetMM('BTC', 'FDUSD', distance_from_mid_price='0.01')
+    mm._get_asset_filters()
+    mm.state.production_last_price = '1000'
+    mm._place_bid = MagicMock()
+    mm._place_ask = MagicMock()
+
+    assert mm._has_sufficient_base_asset('0.006')
+    assert not mm._has_sufficient_quote_asset('5')
+    mm._provide_liquidity('0.02', '8')
+    # the 0.007 BTC ask clears the NOTIONAL filter's 5 FDUSD, the bid shrunk toward the target doesn't
+    assert mm._place_ask.call_args.args[0] == '0.007000'
+    assert not mm._place_bid.called
+
+def test_no_quotes_above_min_notional(requests_mock):
+    from bot.testnet_mm import TestnetMM
+    from bot.exceptions import TestnetMMInsufficientFundsException
 
-    mm = TestnetMM(distance_from_mid_price=distance_from_mid_price)
     requests_mock.get('https://testnet.binance.vision/api/v3/exchangeInfo', json=MOCK_RESPONSES['getExchangeInfo'])
+    mm = TestnetMM('BTC', 'BUSD', distance_from_mid_price='0.01')
     mm._get_asset_filters()
-
+    mm.state.production_last_price = '1000'
+    mm._place_bid = MagicMock()
     mm._place_ask = MagicMock()
-    mm._buy_quote_asset(base_asset_qty)
-
-    bid_price = Decimal(TestnetMMState.PRODUCTION_LAST_PRICE) * (Decimal('1') + Decimal(distance_from_mid_price))
-    bid_quantity = Decimal(base_asset_qty) / Decimal('2')
 
-    mm._place_ask.assert_called_with(mm._truncate_quantity(bid_quantity), mm._truncate_price(bid_price))
+    # each asset clears min notional on its own, split across both sides neither does
+    assert mm._has_sufficient_base_asset('0.012') and mm._has_sufficient_quote_asset('12')
+    with pytest.raises(TestnetMMInsufficientFundsException):
+        mm._provide_liquidity('0.012', '12')
+    assert not mm._place_bid.called and not mm._place_ask.called
 
-def test_provide_liquidity(requests_mock):
+def test_provide_liquidity_with_balanced_inventory(requests_mock):
     from decimal import Decimal
-    from bot.testnet_mm_state import TestnetMMState
     from bot.testnet_mm import TestnetMM
 
     distance_from_mid_price = '0.01'
-    base_asset_available = '1'
+    base_asset_available = '10'
     quote_asset_available = '10000'
-    TestnetMMState.PRODUCTION_LAST_PRICE = '1000'
-
-    bid_price = Decimal(TestnetMMState.PRODUCTION_LAST_PRICE) * (Decimal('1') - Decimal(distance_from_mid_price))
-    ask_price = Decimal(TestnetMMState.PRODUCTION_LAST_PRICE) * (Decimal('1') + Decimal(distance_from_mid_price))
+    mm = TestnetMM(distance_from_mid_price=distance_from_mid_price)
+    mm.state.production_last_price = '1000'
 
-    max_quantity_to_sell = Decimal(base_asset_available)
-    max_quantity_to_buy = Decimal(quote_asset_available) / bid_price
-    order_qty = min(max_quantity_to_sell, max_quantity_to_buy)
+    bid_price = Decimal(mm.state.production_last_price) * (Decimal('1') - Decimal(distance_from_mid_price))
+    ask_price = Decimal(mm.state.production_last_price) * (Decimal('1') + Decimal(distance_from_mid_price))
 
-    mm = TestnetMM(distance_from_mid_price=distance_from_mid_price)
     requests_mock.get('https://testnet.binance.vision/api/v3/exchangeInfo', json=MOCK_RESPONSES['getExchangeInfo'])
     mm._get_asset_filters()
     mm._place_bid = MagicMock()
     mm._place_ask = MagicMock()
     mm._provide_liquidity(base_asset_available, quote_asset_available)
 
-    truncated_order_qty = mm._truncate_quantity(order_qty)
+    truncated_order_qty = mm._truncate_quantity(Decimal(base_asset_available) / 2)
     mm._place_bid.assert_called_with(truncated_order_qty, mm._truncate_price(bid_price))
     mm._place_ask.assert_called_with(truncated_order_qty, mm._truncate_price(ask_price))
+    assert mm.quoted_sides == {'bids', 'asks'}
+
+def test_provide_liquidity_skews_toward_target_inventory(requests_mock):
+    from decimal import Decimal
+    from bot.testnet_mm import TestnetMM
+
+    # 1000 BUSD of BTC and 10000 BUSD, long quote asset
+    mm = TestnetMM(distance_from_mid_price='0.01')
+    mm.state.production_last_price = '1000'
+
+    requests_mock.get('https://testnet.binance.vision/api/v3/exchangeInfo', json=MOCK_RESPONSES['getExchangeInfo'])
+    mm._get_asset_filters()
+    mm._place_bid = MagicMock()
+    mm._place_ask = MagicMock()
+    mm._provide_liquidity('1', '10000')
+
+    (bid_qty, bid_price), = mm._place_bid.call_args.args,
+    (ask_qty, ask_price), = mm._place_ask.call_args.args,
+    # both sides stay live, the bid is larger and closer to the price than the ask
+    assert Decimal(bid_qty) == Decimal('4.5')
+    assert Decimal(ask_qty) == Decimal('0.5')
+    assert 1000 - Decimal(bid_price) < Decimal(ask_price) - 1000
+    assert mm.health()['inventory']['imbalance'] == pytest.approx(-0.818, abs=1e-3)
+
+def test_trade_does_not_requote_a_side_left_out_for_lack_of_inventory():
+    from bot.testnet_mm import TestnetMM
+
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret')
+    mm.state.production_last_price = '1000'
+    mm.state.open_orders = {'bids': [{'price': '995'}], 'asks': []}
+    mm.quoted_sides = {'bids'}
+    mm._place_trade = MagicMock()
+
+    mm._trade()
+    assert not mm._place_trade.called
+
+    mm.state.open_orders = {'bids': [], 'asks': []}
+    mm._trade()
+    assert mm._place_trade.called
 
 
 @pytest.fixture
 def place_bid_setup(requests_mock):
     from bot.testnet_mm import TestnetMM
-    from bot.testnet_mm_state import TestnetMMState
-    TestnetMMState.PAST_ORDERS = []
-    TestnetMMState.OPEN_ORDERS = {
-        'bids': [],
-        'asks': []
-    }
 
     base_url = "https://testnet.binance.vision"
 
@@ -284,7 +450,6 @@ def place_bid_setup(requests_mock):
 
 
 def test_place_bid(place_bid_setup):
-    from bot.testnet_mm_state import TestnetMMState
 
     order_qty, order_price, mocked, mm = place_bid_setup
 
@@ -303,19 +468,13 @@ def test_place_bid(place_bid_setup):
         'executedQty': mocked['executedQty'],
     }
 
-    assert TestnetMMState.PAST_ORDERS == [order_details]
+    assert list(mm.state.past_orders) == [order_details]
 
-    assert TestnetMMState.OPEN_ORDERS['bids'] == [order_details]
+    assert mm.state.open_orders['bids'] == [order_details]
 
 @pytest.fixture
 def place_ask_setup(requests_mock):
     from bot.testnet_mm import TestnetMM
-    from bot.testnet_mm_state import TestnetMMState
-    TestnetMMState.PAST_ORDERS = []
-    TestnetMMState.OPEN_ORDERS = {
-        'bids': [],
-        'asks': []
-    }
 
     base_url = "https://testnet.binance.vision"
 
@@ -334,7 +493,6 @@ def place_ask_setup(requests_mock):
     return order_qty, order_price, mocked, TestnetMM(base_asset, quote_asset, 'key', 'secret')
 
 def test_place_ask(place_ask_setup):
-    from bot.testnet_mm_state import TestnetMMState
 
     order_qty, order_price, mocked, mm = place_ask_setup
 
@@ -353,9 +511,9 @@ def test_place_ask(place_ask_setup):
         'executedQty': mocked['executedQty'],
     }
 
-    assert TestnetMMState.PAST_ORDERS == [order_details]
+    assert list(mm.state.past_orders) == [order_details]
 
-    assert TestnetMMState.OPEN_ORDERS['asks'] == [order_details]
+    assert mm.state.open_orders['asks'] == [order_details]
 
 
 @pytest.fixture
@@ -400,13 +558,14 @@ def test_place_ask_throws_exception_if_failed(bad_order):
 def test_clear_open_order():
     from bot.testnet_mm_state import TestnetMMState
 
-    TestnetMMState.OPEN_ORDERS = {
+    state = TestnetMMState()
+    state.open_orders = {
         'bids': [{'orderId': 'someOrder'}],
         'asks': [{'orderId': 'someOrder'}]
     }
-    TestnetMMState.clear_open_orders()
+    state.clear_open_orders()
 
-    assert TestnetMMState.OPEN_ORDERS == {
+    assert state.open_orders == {
         'bids': [],
         'asks': []
     }
@@ -414,31 +573,29 @@ def test_clear_open_order():
 @rm.Mocker(kw='mock')
 def test_cancel_order(**kwargs):
     from bot.testnet_mm import TestnetMM
-    from bot.testnet_mm_state import TestnetMMState
 
-    TestnetMMState.clear_open_orders = MagicMock()
     kwargs['mock'].delete(rm.ANY, json=MOCK_RESPONSES['deleteOpenOrdersSuccess'])
 
     mm = TestnetMM('BTC', 'BUSD', 'key', 'secret')
+    mm.state.clear_open_orders = MagicMock()
     mm._timeout = MagicMock()
     mm._cancel_open_orders()
 
-    assert TestnetMMState.clear_open_orders.called
+    assert mm.state.clear_open_orders.called
 
 @patch('lib.binance.rest.client.requests')
 def test_cancel_order_handle_exception(mock_requests):
     from bot.testnet_mm import TestnetMM
-    from bot.testnet_mm_state import TestnetMMState
 
     mock_response = MagicMock()
     mock_response.status_code = 400
     mock_response.reason = 'Bad Request'
     mock_response.json.return_value = MOCK_RESPONSES['deleteOpenOrdersHandledError']
 
-    TestnetMMState.clear_open_orders = MagicMock()
     mock_requests.delete.return_value = mock_response
 
     mm = TestnetMM('BTC', 'BUSD', 'key', 'secret')
+    mm.state.clear_open_orders = MagicMock()
 
     try:
         mm._cancel_open_orders()
@@ -449,37 +606,35 @@ def test_cancel_order_handle_exception(mock_requests):
 @patch('lib.binance.rest.client.requests')
 def test_cancel_order_unhandled_exception(mock_requests):
     from bot.testnet_mm import TestnetMM
-    from bot.testnet_mm_state import TestnetMMState
 
     mock_response = MagicMock()
     mock_response.status_code = 400
     mock_response.reason = 'Bad Request'
     mock_response.json.return_value = MOCK_RESPONSES['deleteOpenOrdersUnhandledError']
 
-    TestnetMMState.clear_open_orders = MagicMock()
     mock_requests.delete.return_value = mock_response
 
     mm = TestnetMM('BTC', 'BUSD', 'key', 'secret')
+    mm.state.clear_open_orders = MagicMock()
 
     with pytest.raises(BinanceRestException):
         mm._cancel_open_orders()
 
 def test_has_no_open_orders_return_true():
     from bot.testnet_mm import TestnetMM
-    from bot.testnet_mm_state import TestnetMMState
 
-    TestnetMMState.OPEN_ORDERS = {
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret')
+    mm.state.open_orders = {
         'bids': [],
         'asks': []
     }
-    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret')
     assert mm._has_no_open_orders() == True
 
 def test_has_no_open_orders_return_false():
     from bot.testnet_mm import TestnetMM
-    from bot.testnet_mm_state import TestnetMMState
 
-    TestnetMMState.OPEN_ORDERS = {
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret')
+    mm.state.open_orders = {
         'bids': [{
             'price': '995'
         }],
@@ -487,15 +642,14 @@ def test_has_no_open_orders_return_false():
             'price': '1005'
         }]
     }
-    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret')
     assert mm._has_no_open_orders() == False
 
 @pytest.fixture
 def open_orders():
     from bot.testnet_mm import TestnetMM
-    from bot.testnet_mm_state import TestnetMMState
 
-    TestnetMMState.OPEN_ORDERS = {
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret')
+    mm.state.open_orders = {
         'bids': [{
             'price': '995'
         }],
@@ -503,40 +657,33 @@ def open_orders():
             'price': '1005'
         }]
     }
-    return TestnetMM('BTC', 'BUSD', 'key', 'secret')
+    return mm
 
 def test_has_open_orders_and_production_price_reached_return_true_when_bid_reached(open_orders):
-    from bot.testnet_mm_state import TestnetMMState
-
-    TestnetMMState.PRODUCTION_LAST_PRICE = '995'
-
     mm = open_orders
+    mm.state.production_last_price = '995'
 
     assert mm._has_open_orders_and_production_price_reached() == True
 
 def test_has_open_orders_and_production_price_reached_return_true_when_ask_reached(open_orders):
-    from bot.testnet_mm_state import TestnetMMState
-
-    TestnetMMState.PRODUCTION_LAST_PRICE = '1005'
-
     mm = open_orders
+    mm.state.production_last_price = '1005'
 
     assert mm._has_open_orders_and_production_price_reached() == True
 
 def test_has_open_orders_and_production_price_reached_return_true(open_orders):
-    from bot.testnet_mm_state import TestnetMMState
-
-    TestnetMMState.PRODUCTION_LAST_PRICE = '1000'
-
     mm = open_orders
+    mm.state.production_last_price = '1000'
     assert mm._has_open_orders_and_production_price_reached() == False
 
 def test_trade_does_not_place_orders_with_existing_open_orders():
     from bot.testnet_mm import TestnetMM
-    from bot.testnet_mm_state import TestnetMMState
 
-    TestnetMMState.PRODUCTION_LAST_PRICE = '1000'
-    TestnetMMState.OPEN_ORDERS = {
+    base_asset, quote_asset = 'BTC', 'BUSD'
+
+    mm = TestnetMM(base_asset, quote_asset, 'key', 'secret')
+    mm.state.production_last_price = '1000'
+    mm.state.open_orders = {
         'bids': [{
             'price': '995'
         }],
@@ -544,20 +691,18 @@ def test_trade_does_not_place_orders_with_existing_open_orders():
             'price': '1005'
         }]
     }
-
-    base_asset, quote_asset = 'BTC', 'BUSD'
-
-    mm = TestnetMM(base_asset, quote_asset, 'key', 'secret')
     mm._place_trade = MagicMock()
     mm._trade()
     assert not mm._place_trade.called
 
 def test_trade_places_orders_when_open_bid_orders_price_reached():
     from bot.testnet_mm import TestnetMM
-    from bot.testnet_mm_state import TestnetMMState
 
-    TestnetMMState.PRODUCTION_LAST_PRICE = '995'
-    TestnetMMState.OPEN_ORDERS = {
+    base_asset, quote_asset = 'BTC', 'BUSD'
+
+    mm = TestnetMM(base_asset, quote_asset, 'key', 'secret')
+    mm.state.production_last_price = '995'
+    mm.state.open_orders = {
         'bids': [{
             'price': '995'
         }],
@@ -565,20 +710,18 @@ def test_trade_places_orders_when_open_bid_orders_price_reached():
             'price': '1005'
         }]
     }
-
-    base_asset, quote_asset = 'BTC', 'BUSD'
-
-    mm = TestnetMM(base_asset, quote_asset, 'key', 'secret')
     mm._place_trade = MagicMock()
     mm._trade()
     assert mm._place_trade.called
 
 def test_trade_places_orders_when_open_ask_orders_price_reached():
     from bot.testnet_mm import TestnetMM
-    from bot.testnet_mm_state import TestnetMMState
 
-    TestnetMMState.PRODUCTION_LAST_PRICE = '1005'
-    TestnetMMState.OPEN_ORDERS = {
+    base_asset, quote_asset = 'BTC', 'BUSD'
+
+    mm = TestnetMM(base_asset, quote_asset, 'key', 'secret')
+    mm.state.production_last_price = '1005'
+    mm.state.open_orders = {
         'bids': [{
             'price': '995'
         }],
@@ -586,10 +729,6 @@ def test_trade_places_orders_when_open_ask_orders_price_reached():
             'price': '1005'
         }]
     }
-
-    base_asset, quote_asset = 'BTC', 'BUSD'
-
-    mm = TestnetMM(base_asset, quote_asset, 'key', 'secret')
     mm._place_trade = MagicMock()
     mm._trade()
     assert mm._place_trade.called
@@ -602,11 +741,11 @@ def test_get_asset_filters(requests_mock):
     mm = TestnetMM('BTC', 'BUSD')
     mm._get_asset_filters()
 
-    assert mm.base_asset_precision == {'BNBBUSD': 2, 'BTCBUSD': 6, 'ETHBUSD': 5, 'LTCBUSD': 5, 'TRXBUSD': 1, 'XRPBUSD': 1, 'BNBUSDT': 2, 'BTCUSDT': 6, 'ETHUSDT': 5, 'LTCUSDT': 5, 'TRXUSDT': 1, 'XRPUSDT': 1, 'BNBBTC': 2, 'ETHBTC': 5, 'LTCBTC': 5, 'TRXBTC': 1, 'XRPBTC': 1, 'LTCBNB': 5, 'TRXBNB': 1, 'XRPBNB': 1}
-
-    assert mm.price_precision == {'BNBBUSD': 2, 'BTCBUSD': 2, 'ETHBUSD': 2, 'LTCBUSD': 2, 'TRXBUSD': 5, 'XRPBUSD': 4, 'BNBUSDT': 2, 'BTCUSDT': 2, 'ETHUSDT': 2, 'LTCUSDT': 2, 'TRXUSDT': 5, 'XRPUSDT': 4, 'BNBBTC': 6, 'ETHBTC': 6, 'LTCBTC': 6, 'TRXBTC': 8, 'XRPBTC': 8, 'LTCBNB': 4, 'TRXBNB': 7, 'XRPBNB': 6}
-
-    assert mm.min_notional == {'BNBBUSD': '10.00000000', 'BTCBUSD': '10.00000000', 'ETHBUSD': '10.00000000', 'LTCBUSD': '10.00000000', 'TRXBUSD': '10.00000000', 'XRPBUSD': '10.00000000', 'BNBUSDT': '10.00000000', 'BTCUSDT': '10.00000000', 'ETHUSDT': '10.00000000', 'LTCUSDT': '10.00000000', 'TRXUSDT': '10.00000000', 'XRPUSDT': '10.00000000', 'BNBBTC': '0.00010000', 'ETHBTC': '0.00010000', 'LTCBTC': '0.00010000', 'TRXBTC': '0.00010000', 'XRPBTC': '0.00010000', 'LTCBNB': '0.10000000', 'TRXBNB': '0.10000000', 'XRPBNB': '0.10000000'}
+    from decimal import Decimal
+    assert mm.symbol_filters.symbol == 'BTCBUSD'
+    assert mm.symbol_filters.step_size == Decimal('0.000001')
+    assert mm.symbol_filters.tick_size == Decimal('0.01')
+    assert mm.symbol_filters.min_notional == Decimal('10')
 
 def test_get_listen_key(requests_mock):
     from bot.testnet_mm import TestnetMM
@@ -616,3 +755,195 @@ def test_get_listen_key(requests_mock):
 
     mm._get_listen_key()
     assert mm.listen_key == 'abc'
+
+def execution_report(order_id, side, execution_type, status, executed_qty='0.00000000', last_qty='0.00000000'):
+    return {'e': 'executionReport', 'E': 1669812778101, 's': 'BTCBUSD', 'c': 'tHqKp0tXgstVzO4xoL0qLT', 'S': side,
+            'o': 'LIMIT', 'f': 'GTC', 'q': '0.00100000', 'p': '1000.00000000', 'x': execution_type, 'X': status,
+            'r': 'NONE', 'i': order_id, 'l': last_qty, 'z': executed_qty, 'L': '1000.00000000', 'n': '0',
+            'N': None, 'T': 1669812778100, 't': 1 if execution_type == 'TRADE' else -1, 'm': True,
+            'Y': '0.00000000'}
+
+def test_update_order_state_partial_fill_keeps_order_open():
+    from bot.testnet_mm_state import TestnetMMState
+
+    state = TestnetMMState()
+    state.open_orders = {'bids': [{'orderId': 1, 'price': '1000'}], 'asks': []}
+
+    assert state.update_order_state(execution_report(1, 'BUY', 'TRADE', 'PARTIALLY_FILLED', '0.0005', '0.0005')) is None
+    assert state.open_orders['bids'][0]['status'] == 'PARTIALLY_FILLED'
+    assert state.open_orders['bids'][0]['executedQty'] == '0.0005'
+    assert len(state.fills) == 1
+
+def test_reports_of_other_symbols_on_the_account_are_ignored():
+    from bot.testnet_mm import TestnetMM
+
+    mm = TestnetMM('BTC', 'BUSD')
+    mm.journal = MagicMock()
+    mm._trade = MagicMock()
+
+    mm._on_execution_report(dict(execution_report(1, 'BUY', 'TRADE', 'FILLED', '0.001', '0.001'), s='ETHBUSD'))
+    assert list(mm.state.fills) == []
+    assert mm.state.fill_count == 0
+    assert not mm.journal.record_fill.called
+
+    mm._on_execution_report(execution_report(2, 'BUY', 'TRADE', 'FILLED', '0.001', '0.001'))
+    assert [fill['symbol'] for fill in mm.state.fills] == ['BTCBUSD']
+    assert mm.journal.record_fill.called
+
+@pytest.mark.parametrize('execution_type,status', [
+    ('TRADE', 'FILLED'),
+    ('CANCELED', 'CANCELED'),
+    ('EXPIRED', 'EXPIRED'),
+    ('REJECTED', 'REJECTED'),
+    ('TRADE_PREVENTION', 'EXPIRED_IN_MATCH'),
+])
+def test_update_order_state_removes_terminal_orders(execution_type, status):
+    from bot.testnet_mm_state import TestnetMMState
+
+    state = TestnetMMState()
+    state.open_orders = {'bids': [], 'asks': [{'orderId': 2, 'price': '1005'}]}
+
+    finished = state.update_order_state(execution_report(2, 'SELL', execution_type, status))
+    assert finished['orderId'] == 2
+    assert state.open_orders['asks'] == []
+    assert len(state.fills) == (1 if execution_type == 'TRADE' else 0)
+
+def test_fill_triggers_requote_immediately():
+    from bot.testnet_mm import TestnetMM
+
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret')
+    mm.state.production_last_price = '1000'
+    mm.state.open_orders = {
+        'bids': [{'orderId': 1, 'price': '995'}],
+        'asks': [{'orderId': 2, 'price': '1005'}]
+    }
+    mm._place_trade = MagicMock()
+    mm._message_handler(execution_report(1, 'BUY', 'TRADE', 'FILLED', '0.00100000', '0.00100000'))
+
+    assert mm._place_trade.called
+
+def test_execution_report_for_untracked_order_does_not_requote():
+    from bot.testnet_mm import TestnetMM
+
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret')
+    mm._trade = MagicMock()
+    mm._message_handler(execution_report(3, 'BUY', 'CANCELED', 'CANCELED'))
+
+    assert not mm._trade.called
+
+def test_orders_are_sized_from_and_sent_to_one_pool_account(requests_mock):
+    from bot.testnet_mm import TestnetMM
+    from bot.order_gateway import PooledRestOrderGateway
+
+    def account(btc, busd):
+        return {'balances': [{'asset': 'BTC', 'free': btc, 'locked': '0'}, {'asset': 'BUSD', 'free': busd, 'locked': '0'}]}
+
+    mm = TestnetMM('BTC', 'BUSD', testnet_api_credentials=[('key1', 'secret1'), ('key2', 'secret2')])
+    funded = mm.account_pool.client_for('BTCBUSD')
+    requests_mock.get('https://testnet.binance.vision/api/v3/account', json=lambda request, context: (
+        account('1.00000000', '20000.00000000') if request.headers['X-MBX-APIKEY'] == funded.key else account('2.00000000', '0.00000000')
+    ))
+    requests_mock.post('https://testnet.binance.vision/api/v3/order', json=MOCK_RESPONSES['postOrderBuySuccess'])
+
+    assert isinstance(mm.order_gateway, PooledRestOrderGateway)
+    assert mm._get_balances('BTC', 'BUSD') == ('1.00000000', '20000.00000000')
+    mm.order_gateway.place_order({'symbol': 'BTCBUSD', 'side': 'BUY', 'type': 'LIMIT', 'timeInForce': 'GTC', 'quantity': '0.001', 'price': '15000'})
+
+    assert requests_mock.last_request.headers['X-MBX-APIKEY'] == funded.key
+
+def test_ws_api_gateway_rejects_an_account_pool():
+    from bot.testnet_mm import TestnetMM
+
+    with pytest.raises(ValueError):
+        TestnetMM('BTC', 'BUSD', testnet_api_credentials=[('key1', 'secret1'), ('key2', 'secret2')], order_gateway="ws-api")
+
+def test_user_stream_per_pool_account(requests_mock):
+    from bot.testnet_mm import TestnetMM
+
+    requests_mock.post('https://testnet.binance.vision/api/v3/userDataStream', [{'json': {'listenKey': 'a'}}, {'json': {'listenKey': 'b'}}])
+    mm = TestnetMM('BTC', 'BUSD', testnet_api_credentials=[('key1', 'secret1'), ('key2', 'secret2')])
+
+    with patch('bot.testnet_mm.BinanceWebsocketClient') as ws_client:
+        streams = mm._connect_to_testnet_user_stream()
+
+    assert len(streams) == 2
+    assert [call.kwargs['ws_base_url'] for call in ws_client.call_args_list] == ['wss://testnet.binance.vision/ws/a', 'wss://testnet.binance.vision/ws/b']
+    assert sorted(mm.listen_keys.values()) == ['a', 'b']
+
+def test_trade_survives_transient_errors():
+    from bot.testnet_mm import TestnetMM
+    from lib.binance.rest.exceptions import BinanceCircuitOpenException
+
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret')
+    mm.state.production_last_price = '1000'
+    mm.terminate = MagicMock()
+    mm._place_trade = MagicMock(side_effect=BinanceCircuitOpenException('postOrder', 10))
+
+    assert mm._trade() == False
+    assert not mm.terminate.called
+
+def test_trade_terminates_on_fatal_errors():
+    from bot.testnet_mm import TestnetMM
+
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret')
+    mm.state.production_last_price = '1000'
+    mm.terminate = MagicMock()
+    mm._place_trade = MagicMock(side_effect=BinanceRestException('Bad Request', 400, 'POST', '/api/v3/order', {'code': -1013, 'msg': 'Filter failure: LOT_SIZE'}))
+
+    with pytest.raises(BinanceRestException):
+        mm._trade()
+    assert mm.terminate.called
+
+def test_ack_mode_tracks_pending_order_until_new_report(requests_mock):
+    from bot.testnet_mm import TestnetMM
+
+    requests_mock.post('https://testnet.binance.vision/api/v3/order', json={
+        'symbol': 'BTCBUSD', 'orderId': 7, 'orderListId': -1, 'clientOrderId': 'tmm-abc', 'transactTime': 1669812778100
+    })
+
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret', order_response_type='ACK')
+    order = mm._place_bid('0.00100000', '1000.00000000')
+
+    assert requests_mock.last_request.qs['neworderresptype'] == ['ack']
+    assert order['status'] == 'PENDING_NEW'
+    assert order['price'] == '1000.00000000'
+    assert order['origQty'] == '0.00100000'
+    assert mm.state.open_orders['bids'] == [order]
+    assert mm.order_entry_stats[7]['ackLatencyMs'] is None
+
+    mm._message_handler(execution_report(7, 'BUY', 'NEW', 'NEW'))
+
+    assert mm.state.open_orders['bids'][0]['status'] == 'NEW'
+    assert mm.order_entry_stats[7]['ackLatencyMs'] >= 0
+    summary = mm.health()['order_entry']
+    assert summary['responseType'] == 'ACK'
+    assert summary['orders'] == 1
+    assert summary['avgResponseBytes'] > 0
+
+def test_result_mode_records_response_size(requests_mock):
+    from bot.testnet_mm import TestnetMM
+
+    mocked = dict(MOCK_RESPONSES['postOrder'], orderId=8, side='BUY')
+    requests_mock.post('https://testnet.binance.vision/api/v3/order', json=mocked)
+
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret')
+    mm._place_bid('0.00100000', '1500.00000000')
+
+    assert 'newOrderRespType' not in requests_mock.last_request.qs
+    stats = mm.order_entry_stats[8]
+    assert stats['responseType'] == 'RESULT'
+    assert stats['responseBytes'] > 0
+
+def test_orders_and_fills_are_journaled(requests_mock, tmp_path):
+    from bot.testnet_mm import TestnetMM
+
+    requests_mock.post('https://testnet.binance.vision/api/v3/order', json=dict(MOCK_RESPONSES['postOrder'], orderId=9, side='BUY'))
+
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret', journal_dir=str(tmp_path))
+    mm.state.production_last_price = '1000'
+    mm._place_bid('0.00100000', '1000.00000000')
+    mm._trade = MagicMock()
+    mm._message_handler(execution_report(9, 'BUY', 'TRADE', 'FILLED', '0.00100000', '0.00100000'))
+
+    assert (tmp_path / 'BTCBUSD' / 'orders.bin').stat().st_size > 0
+    assert (tmp_path / 'BTCBUSD' / 'fills.bin').stat().st_size > 0
@@ -0,0 +1,95 @@
+import pytest
+import json
+from time import perf_counter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ticks_without_orders_are_dropped():
+    from bot.tracing import TickTracer
+
+    tracer = TickTracer()
+    tracer.begin()
+    tracer.end()
+
+    assert tracer.pending == {}
+    assert tracer.summary() == {}
+
+
+def test_trace_finishes_when_every_order_is_reported():
+    from bot.tracing import TickTracer
+
+    clock = FakeClock()
+    tracer = TickTracer(clock=clock)
+    tracer.begin()
+    clock.now = 0.001
+    bid, ask = tracer.client_order_id(), tracer.client_order_id()
+    tracer.order_sent(bid, 0.001, 0.003)
+    tracer.order_sent(ask, 0.003, 0.005)
+    tracer.end()
+
+    assert len(bid) <= 36
+    clock.now = 0.010
+    tracer.on_execution_report(bid)
+    assert tracer.exported == 0
+
+    clock.now = 0.011
+    tracer.on_execution_report(ask)
+    assert tracer.exported == 1
+    summary = tracer.summary()
+    assert summary['decide']['p50'] == pytest.approx(1)
+    assert summary['ack']['count'] == 2
+    assert summary['executionReport']['p99'] == pytest.approx(9)
+
+
+def test_unreported_traces_expire():
+    from bot.tracing import TickTracer
+
+    clock = FakeClock()
+    tracer = TickTracer(timeout=10, clock=clock)
+    tracer.begin()
+    tracer.order_sent(tracer.client_order_id(), 0, 0.002)
+    tracer.end()
+
+    clock.now = 11
+    tracer.begin()
+    tracer.end()
+
+    assert tracer.exported == 1
+    assert 'executionReport' not in tracer.summary()
+
+
+def test_requotes_are_traced_end_to_end(tmp_path):
+    from bot.simulator import SimulatedBinanceClient
+    from bot.testnet_mm import TestnetMM
+
+    trace_file = tmp_path / 'trace.json'
+    mm = TestnetMM('BTC', 'BUSD', price_min_interval=0, rest_client=SimulatedBinanceClient(), trace_file=str(trace_file))
+    mm._timeout = lambda seconds: None
+    mm.rest_client.execution_handler = mm.events.put
+    mm._get_asset_filters()
+
+    mm._on_production_message({'e': 'aggTrade', 's': 'BTCBUSD', 'a': 1, 'p': '20000', 'q': '1', 'T': 1}, perf_counter())
+    while not mm.events.empty():
+        mm._process_next_event(timeout=0)
+
+    bids = mm.state.open_orders['bids']
+    assert bids[0]['clientOrderId'].startswith('tmm-')
+    assert mm.tracer.exported == 1
+
+    with open(trace_file) as f:
+        events = json.loads(f.read().rstrip().rstrip(',') + ']')
+    assert {event['name'] for event in events} == set(mm.tracer.STAGES)
+    assert len({event['tid'] for event in events}) == 1
+    # cancel and getAccount have their own stages, sign and http only time the orders
+    orders = len(mm.state.open_orders['bids']) + len(mm.state.open_orders['asks'])
+    assert [event['name'] for event in events].count('http') == orders
+    decide, cancel = (next(event for event in events if event['name'] == name) for name in ('decide', 'cancel'))
+    assert decide['ts'] + decide['dur'] == pytest.approx(cancel['ts'], abs=0.2)
+    assert set(mm.health()['tracing']) == set(mm.tracer.STAGES)
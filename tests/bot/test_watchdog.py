@@ -0,0 +1,92 @@
+import json
+from unittest.mock import MagicMock
+from urllib.request import urlopen
+from urllib.error import HTTPError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_feed_becomes_stale_without_messages():
+    from bot.watchdog import FeedWatchdog
+
+    clock = FakeClock()
+    watchdog = FeedWatchdog(stale_after=10, clock=clock)
+    watchdog.watch('production', 'BTCBUSD')
+
+    clock.now = 5
+    watchdog.record('production', 'BTCBUSD')
+    clock.now = 14
+    assert watchdog.stale() == []
+
+    clock.now = 16
+    assert watchdog.stale() == [('production', 'BTCBUSD')]
+
+
+def test_stale_feed_pulls_quotes_and_reconnects():
+    from bot.testnet_mm import TestnetMM
+
+    clock = FakeClock()
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret', feed_stale_after=10)
+    mm.watchdog.clock = clock
+    mm.watchdog.watch('production', 'BTCBUSD')
+    mm._cancel_open_orders = MagicMock()
+    stale_bws, fresh_bws = MagicMock(), MagicMock()
+    mm.bws = stale_bws
+    mm._connect_to_production_trade_stream = MagicMock(return_value=fresh_bws)
+
+    mm._check_feeds()
+    assert not mm._cancel_open_orders.called
+
+    clock.now = 11
+    mm._check_feeds()
+    assert mm._cancel_open_orders.called
+    assert stale_bws.disconnect.called
+    assert mm.bws is fresh_bws
+    assert mm.watchdog.stale() == []
+
+
+def test_retired_production_stream_close_does_not_terminate():
+    from bot.testnet_mm import TestnetMM
+
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret')
+    mm._close_handler = MagicMock()
+    mm.bws = MagicMock()
+
+    mm._on_production_stream_closed(MagicMock())
+    assert not mm._close_handler.called
+
+    mm._on_production_stream_closed(mm.bws)
+    assert mm._close_handler.called
+
+
+def test_health_endpoints():
+    from bot.testnet_mm import TestnetMM
+    from bot.health_server import HealthServer
+
+    mm = TestnetMM('BTC', 'BUSD', 'key', 'secret')
+    server = HealthServer([mm], host='127.0.0.1', port=0).start()
+    base_url = f'http://127.0.0.1:{server.port}'
+
+    try:
+        try:
+            urlopen(f'{base_url}/readyz')
+            assert False, 'engine is not ready before run'
+        except HTTPError as err:
+            assert err.code == 503
+
+        mm.keep_alive, mm.ready = True, True
+        mm.watchdog.watch('production', 'BTCBUSD')
+
+        report = json.loads(urlopen(f'{base_url}/readyz').read())['BTCBUSD']
+        assert report['feeds']['production:BTCBUSD']['stale'] is False
+        assert report['open_orders'] == {'bids': 0, 'asks': 0}
+        assert report['rest']['recent_error_rate'] == 0.0
+        assert urlopen(f'{base_url}/healthz').status == 200
+    finally:
+        server.stop()